@@ -0,0 +1,273 @@
+"""Benchmark init, update and backup at scale on synthetic projects.
+
+Generates projects that vary in template size, number of user files under
+.specify/specs and .specify/features, file size and the fraction of template
+files changed since the last install, then times the library functions
+(copy_directory, sync_directory, backup_directory, get_changed_files) and the
+full `init` / `update` commands. Results are saved as JSON; pass an earlier
+result file with --compare to flag regressions between versions.
+
+Usage:
+    python benchmarks/scale.py                              # default matrix
+    python benchmarks/scale.py --template-files 100 2000 --user-files 0 5000
+    python benchmarks/scale.py --output base.json           # save a baseline
+    python benchmarks/scale.py --compare base.json          # exit 1 on regressions
+
+The commands run in a subprocess against the packaged templates (their size
+is fixed), so only the user-file count, file size and changed fraction vary
+for them; the library benchmarks use the synthetic template.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+from custom_speckit import __version__  # noqa: E402
+from custom_speckit.utils.file_manager import (  # noqa: E402
+    backup_directory,
+    copy_directory,
+    get_changed_files,
+    sync_directory,
+)
+
+LIBRARY_BENCHMARKS = ("copy_directory", "sync_directory", "get_changed_files", "backup_directory")
+COMMAND_BENCHMARKS = ("init", "update")
+# Benchmarks that do not depend on how much of the template changed
+FRESH_INSTALL_BENCHMARKS = ("copy_directory", "backup_directory", "init")
+
+
+def build_template(root: Path, files: int, size: int) -> None:
+    """Create a template with the .specify/ and .cursor/ layout of the real one."""
+    payload = os.urandom(size // 2).hex().encode()[:size]
+    dirs = (
+        ".specify/scripts/bash",
+        ".specify/templates",
+        ".specify/memory",
+        ".cursor/commands",
+        ".cursor/rules",
+    )
+    for index in range(files):
+        directory = dirs[index % len(dirs)]
+        path = root / directory / f"group-{index % 9}" / f"file-{index:05d}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(payload)
+
+
+def add_user_files(project: Path, files: int, size: int) -> None:
+    """Add spec/feature files that update must leave alone."""
+    payload = os.urandom(size // 2).hex().encode()[:size]
+    for index in range(files):
+        area = "specs" if index % 2 else "features"
+        path = project / ".specify" / area / f"{index // 10:03d}-feature" / f"doc-{index:05d}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(payload)
+
+
+def change_files(root: Path, fraction: float, exclude: str = "") -> int:
+    """Append to every n-th file under root so `fraction` of them differ."""
+    files = sorted(p for p in root.rglob("*") if p.is_file() and not (exclude and exclude in p.parts))
+    if not files or fraction <= 0:
+        return 0
+    step = max(1, round(1 / fraction))
+    changed = files[::step]
+    for path in changed:
+        with path.open("ab") as f:
+            f.write(b"\n<!-- changed -->\n")
+    return len(changed)
+
+
+def measure(setup: Callable[[Path], Dict], run: Callable[[Dict], None], repeat: int, scratch: Path) -> List[float]:
+    """Time `run` `repeat` times, each on a fresh state from `setup` (untimed)."""
+    timings = []
+    for attempt in range(repeat):
+        workdir = scratch / f"run-{attempt}"
+        workdir.mkdir()
+        state = setup(workdir)
+        start = time.perf_counter()
+        run(state)
+        timings.append(time.perf_counter() - start)
+        shutil.rmtree(workdir)
+    return timings
+
+
+def library_case(name: str, template_files: int, user_files: int, size: int, changed: float):
+    """Return (setup, run) for one library benchmark."""
+
+    def setup(workdir: Path) -> Dict:
+        template = workdir / "template"
+        build_template(template, template_files, size)
+        project = workdir / "project"
+        project.mkdir()
+        state = {"template": template / ".specify", "project": project / ".specify"}
+        if name == "copy_directory":
+            add_user_files(project, user_files, size)
+            return state
+        copy_directory(template / ".specify", project / ".specify")
+        add_user_files(project, user_files, size)
+        # The new template version differs from the installed one
+        change_files(template / ".specify", changed)
+        return state
+
+    runs = {
+        "copy_directory": lambda s: copy_directory(s["template"], s["project"]),
+        "sync_directory": lambda s: sync_directory(s["template"], s["project"]),
+        "get_changed_files": lambda s: get_changed_files(s["template"], s["project"]),
+        "backup_directory": lambda s: backup_directory(s["project"]),
+    }
+    return setup, runs[name]
+
+
+def _cli(args: List[str]) -> None:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC), env.get("PYTHONPATH")]))
+    env["NO_COLOR"] = "1"
+    subprocess.run(
+        [sys.executable, "-m", "custom_speckit.cli", *args],
+        check=True,
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def command_case(name: str, user_files: int, size: int, changed: float):
+    """Return (setup, run) for a full init/update in a subprocess."""
+
+    def setup(workdir: Path) -> Dict:
+        project = workdir / "project"
+        project.mkdir()
+        if name == "update":
+            _cli(["init", str(project)])
+            # Installed files that no longer match the template and must be restored
+            change_files(project / ".specify", changed, exclude="specs")
+        add_user_files(project, user_files, size)
+        return {"project": project}
+
+    return setup, lambda s: _cli([name, str(s["project"])])
+
+
+def run_matrix(args: argparse.Namespace) -> List[Dict]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        scratch = Path(tmp)
+        for name in args.benchmarks:
+            is_command = name in COMMAND_BENCHMARKS
+            template_sizes = [None] if is_command else args.template_files
+            for template_files, user_files, size, changed in itertools.product(
+                template_sizes, args.user_files, args.size, args.changed
+            ):
+                if name in FRESH_INSTALL_BENCHMARKS:
+                    if changed != args.changed[0]:
+                        continue
+                    changed = 0.0
+                if is_command:
+                    setup, run = command_case(name, user_files, size, changed)
+                else:
+                    setup, run = library_case(name, template_files, user_files, size, changed)
+                case_dir = scratch / f"case-{len(results)}"
+                case_dir.mkdir()
+                timings = measure(setup, run, args.repeat, case_dir)
+                result = {
+                    "benchmark": name,
+                    "template_files": template_files,
+                    "user_files": user_files,
+                    "size": size,
+                    "changed": changed,
+                    "median_ms": round(statistics.median(timings) * 1000, 2),
+                    "min_ms": round(min(timings) * 1000, 2),
+                    "runs": len(timings),
+                }
+                results.append(result)
+                print(f"  {_label(result):<60} {result['median_ms']:9.1f} ms")
+    return results
+
+
+def _key(result: Dict) -> tuple:
+    return (result["benchmark"], result["template_files"], result["user_files"], result["size"], result["changed"])
+
+
+def _label(result: Dict) -> str:
+    template = "" if result["template_files"] is None else f" template={result['template_files']}"
+    return (
+        f"{result['benchmark']}{template} user={result['user_files']} "
+        f"size={result['size']} changed={result['changed']:.0%}"
+    )
+
+
+def compare(results: List[Dict], baseline_path: Path, threshold: float) -> int:
+    """Print per-case ratios against a baseline; return the number of regressions."""
+    baseline = json.loads(baseline_path.read_text())
+    previous = {_key(r): r for r in baseline["results"]}
+    print(f"\nCompared with {baseline_path} (version {baseline.get('version', '?')}):")
+    regressions = 0
+    for result in results:
+        before: Optional[Dict] = previous.get(_key(result))
+        if before is None:
+            continue
+        ratio = result["median_ms"] / before["median_ms"] if before["median_ms"] else 1.0
+        flag = ""
+        if ratio > threshold:
+            regressions += 1
+            flag = "  ✗ regression"
+        print(f"  {_label(result):<60} {before['median_ms']:9.1f} → {result['median_ms']:9.1f} ms ({ratio:.2f}x){flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--benchmarks", nargs="+", default=list(LIBRARY_BENCHMARKS + COMMAND_BENCHMARKS),
+                        choices=LIBRARY_BENCHMARKS + COMMAND_BENCHMARKS)
+    parser.add_argument("--template-files", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--user-files", type=int, nargs="+", default=[0, 1000])
+    parser.add_argument("--size", type=int, nargs="+", default=[4096], help="Bytes per file")
+    parser.add_argument("--changed", type=float, nargs="+", default=[0.0, 0.1, 0.5],
+                        help="Fraction of template files changed since the last install")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="Result file (defaults to benchmarks/results/<version>-<time>.json)")
+    parser.add_argument("--compare", type=Path, help="Earlier result file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Slowdown ratio counted as a regression")
+    args = parser.parse_args()
+
+    print(f"custom-speckit {__version__}, Python {platform.python_version()}, median of {args.repeat} runs")
+    results = run_matrix(args)
+
+    output = args.output or (
+        Path(__file__).resolve().parent / "results"
+        / f"{__version__}-{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "config": {
+            "template_files": args.template_files,
+            "user_files": args.user_files,
+            "size": args.size,
+            "changed": args.changed,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }, indent=2))
+    print(f"\nSaved {len(results)} results to {output}")
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Startup benchmark and budget check for short CLI invocations.
+
+Runs `version` and a bare invocation under `python -X importtime`, reports
+the import cost of the CLI and the wall-clock overhead over an empty
+interpreter, and exits non-zero if either exceeds its budget or if typer
+or the command modules were imported. Suitable as a CI gate:
+
+    python benchmarks/startup.py [--repeat 10]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+# Budgets for `custom-speckit version`
+IMPORT_BUDGET_MS = 10.0       # cumulative import time of custom_speckit.cli
+OVERHEAD_BUDGET_MS = 40.0     # median wall clock above `python -c pass`
+
+# Modules that must stay out of the fast paths
+FORBIDDEN = {
+    "version": ("typer", "rich", "custom_speckit.commands"),
+    "bare": ("typer", "custom_speckit.commands"),
+}
+
+RUN_CLI = "import sys; from custom_speckit.cli import main; sys.argv[1:] = {args!r}; main()"
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC), env.get("PYTHONPATH")]))
+    env["NO_COLOR"] = "1"
+    return env
+
+
+def import_report(args: list) -> dict:
+    """Return {module: cumulative_us} for one CLI run under -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", RUN_CLI.format(args=args)],
+        capture_output=True, text=True, env=_env(), check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def median_wall_ms(code: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], capture_output=True, env=_env(), check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    failures = []
+
+    for label, cli_args in (("version", ["version"]), ("bare", [])):
+        modules = import_report(cli_args)
+        loaded = [m for m in modules if any(m == f or m.startswith(f + ".") for f in FORBIDDEN[label])]
+        cli_ms = modules.get("custom_speckit.cli", 0) / 1000
+        print(f"{label:<8} import custom_speckit.cli: {cli_ms:6.2f} ms, modules imported: {len(modules)}")
+        if loaded:
+            failures.append(f"{label}: imported {', '.join(sorted(loaded)[:5])}")
+        if label == "version" and cli_ms > IMPORT_BUDGET_MS:
+            failures.append(f"version: CLI import {cli_ms:.2f} ms > budget {IMPORT_BUDGET_MS} ms")
+
+    empty = median_wall_ms("pass", args.repeat)
+    version = median_wall_ms(RUN_CLI.format(args=["version"]), args.repeat)
+    overhead = version - empty
+    print(f"version  wall clock: {version:6.1f} ms ({overhead:+.1f} ms over empty interpreter)")
+    if overhead > OVERHEAD_BUDGET_MS:
+        failures.append(f"version: {overhead:.1f} ms overhead > budget {OVERHEAD_BUDGET_MS} ms")
+
+    if failures:
+        print("\nStartup budget exceeded:")
+        for failure in failures:
+            print(f"  ✗ {failure}")
+        sys.exit(1)
+    print("\n✓ Within startup budget")
+
+
+if __name__ == "__main__":
+    main()
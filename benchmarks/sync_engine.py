@@ -0,0 +1,86 @@
+"""Benchmark serial vs. concurrent template copies on a synthetic template.
+
+Usage:
+    python benchmarks/sync_engine.py [--files 3000] [--size 4096] [--jobs 1 4 8 16]
+    python benchmarks/sync_engine.py --target /mnt/nfs/scratch   # measure on a network mount
+    python benchmarks/sync_engine.py --latency-ms 2              # simulate per-file round trips
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from custom_speckit.utils.file_manager import copy_directory  # noqa: E402
+
+
+def add_latency(latency_ms: float) -> None:
+    """Delay every copy by a fixed round trip, as a network filesystem would."""
+    copy2 = shutil.copy2
+
+    def slow_copy2(src, dst, **kwargs):
+        time.sleep(latency_ms / 1000)
+        return copy2(src, dst, **kwargs)
+
+    shutil.copy2 = slow_copy2
+
+
+def build_template(root: Path, files: int, size: int) -> None:
+    """Create a template tree of `files` files spread over nested directories."""
+    payload = os.urandom(size)
+    for index in range(files):
+        path = root / f"group-{index % 40:02d}" / f"sub-{index % 7}" / f"file-{index:05d}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(payload)
+
+
+def time_copy(template: Path, target_root: Path, jobs: int, repeat: int) -> float:
+    """Return the median wall-clock seconds of copying the template with `jobs` workers."""
+    timings = []
+    for run in range(repeat):
+        dst = target_root / f"copy-{jobs}-{run}"
+        start = time.perf_counter()
+        copy_directory(template, dst, jobs=jobs)
+        timings.append(time.perf_counter() - start)
+        shutil.rmtree(dst)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=3000)
+    parser.add_argument("--size", type=int, default=4096, help="Bytes per file")
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--target", type=Path, help="Directory to copy into (defaults to a temp dir)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated per-file latency")
+    args = parser.parse_args()
+
+    if args.latency_ms:
+        add_latency(args.latency_ms)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        template = Path(tmp) / "template"
+        build_template(template, args.files, args.size)
+        target_root = args.target or Path(tmp)
+        target_root.mkdir(parents=True, exist_ok=True)
+
+        print(
+            f"{args.files} files x {args.size} bytes, "
+            f"{args.latency_ms} ms latency, median of {args.repeat} runs"
+        )
+        baseline = None
+        for jobs in args.jobs:
+            seconds = time_copy(template, target_root, jobs, args.repeat)
+            baseline = baseline or seconds
+            print(f"  jobs={jobs:<3} {seconds * 1000:8.1f} ms  ({baseline / seconds:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
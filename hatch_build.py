@@ -0,0 +1,40 @@
+"""Hatch build hook: ship custom_speckit/template_index.json with the wheel."""
+
+import importlib.util
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+INDEX_MODULE = "src/custom_speckit/utils/template_index.py"
+TEMPLATE_DIR = "src/custom_speckit/templates"
+
+
+class TemplateIndexHook(BuildHookInterface):
+    """Hash the templates once at build time instead of on every run."""
+
+    def initialize(self, version, build_data):
+        # Editable installs run from the source tree, where templates change;
+        # they keep scanning at runtime
+        if self.target_name != "wheel" or version == "editable":
+            return
+
+        # Load the module by path: the package itself imports typer and rich
+        spec = importlib.util.spec_from_file_location(
+            "custom_speckit_template_index", Path(self.root) / INDEX_MODULE
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        index = module.build_index(Path(self.root) / TEMPLATE_DIR)
+        self._tempdir = tempfile.mkdtemp(prefix="custom-speckit-build-")
+        output = Path(self._tempdir) / module.INDEX_FILE
+        output.write_text(json.dumps(index, indent=1, sort_keys=True))
+        build_data["force_include"][str(output)] = f"custom_speckit/{module.INDEX_FILE}"
+
+    def finalize(self, version, build_data, artifact_path):
+        tempdir = getattr(self, "_tempdir", None)
+        if tempdir:
+            shutil.rmtree(tempdir, ignore_errors=True)
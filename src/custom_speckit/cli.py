@@ -1,46 +1,159 @@
-"""Main CLI entry point for Custom Speckit."""
+"""Main CLI entry point for Custom Speckit.
 
-import typer
-from rich.console import Console
-from rich.panel import Panel
-from custom_speckit.commands import init, update
+Command modules (and with them typer and rich) are imported only when the
+invoked command needs them; `version`, `script` and a bare invocation never
+load typer.
+"""
 
-app = typer.Typer(
-    name="custom-speckit",
-    help="AI-powered Spec-Driven Development toolkit",
-    add_completion=False,
-)
-console = Console()
+import importlib
+import os
+import sys
 
-app.command()(init.init)
-app.command()(update.update)
+# Command name -> (module, attribute). The attribute is either a command
+# function or a typer.Typer sub-application.
+COMMANDS = {
+    "init": ("custom_speckit.commands.init", "init"),
+    "update": ("custom_speckit.commands.update", "update"),
+    "restore": ("custom_speckit.commands.restore", "restore"),
+    "batch": ("custom_speckit.commands.batch", "batch"),
+    "bundle": ("custom_speckit.commands.bundle", "app"),
+    "spec": ("custom_speckit.commands.spec", "app"),
+    "analyze": ("custom_speckit.commands.analyze", "analyze"),
+    "context": ("custom_speckit.commands.context", "context"),
+    "status": ("custom_speckit.commands.status", "status"),
+    "lint": ("custom_speckit.commands.lint", "lint"),
+    "tasks": ("custom_speckit.commands.tasks", "app"),
+    "watch": ("custom_speckit.commands.watch", "app"),
+}
 
+COMMAND_SUMMARIES = [
+    ("init", "Initialize Custom Speckit in your project"),
+    ("update", "Update Custom Speckit to latest version"),
+    ("restore", "Roll back files changed by an update"),
+    ("batch", "Run init/update across many projects"),
+    ("bundle", "Build template delta bundles for offline upgrades"),
+    ("spec", "Look up requirements and stories in spec.md"),
+    ("analyze", "Check spec, plan and tasks for coverage gaps"),
+    ("context", "Print a compact context pack for a slash command"),
+    ("status", "Show progress of every feature at once"),
+    ("lint", "Check documents against template and constitution rules"),
+    ("tasks", "Schedule tasks.md into parallel waves"),
+    ("watch", "Keep workspace lookups warm in a daemon"),
+    ("script", "Run a .specify workflow script in-process"),
+    ("version", "Show version information"),
+]
 
-@app.command()
-def version():
-    """Show Custom Speckit version."""
+
+def _use_color() -> bool:
+    return sys.stdout.isatty() and "NO_COLOR" not in os.environ
+
+
+def print_version() -> None:
+    """Print the version without importing typer or rich."""
     from custom_speckit import __version__
-    console.print(f"[bold cyan]Custom Speckit[/bold cyan] version [bold]{__version__}[/bold]")
-
-
-@app.callback(invoke_without_command=True)
-def main(ctx: typer.Context):
-    """Custom Speckit - AI-powered Spec-Driven Development toolkit."""
-    if ctx.invoked_subcommand is None:
-        from custom_speckit import __version__
-        console.print(Panel.fit(
-            f"[bold cyan]Custom Speckit[/bold cyan]\n"
-            f"Version: [bold green]{__version__}[/bold green]\n\n"
-            f"AI-powered Spec-Driven Development toolkit\n\n"
-            f"[dim]Commands:[/dim]\n"
-            f"  • [cyan]init[/cyan]     - Initialize Custom Speckit in your project\n"
-            f"  • [cyan]update[/cyan]   - Update Custom Speckit to latest version\n"
-            f"  • [cyan]version[/cyan]  - Show version information\n\n"
-            f"[dim]Usage:[/dim] [yellow]uvx custom-speckit <command>[/yellow]",
-            border_style="cyan"
-        ))
+    if _use_color():
+        print(f"\033[1;36mCustom Speckit\033[0m version \033[1m{__version__}\033[0m")
+    else:
+        print(f"Custom Speckit version {__version__}")
 
 
-if __name__ == "__main__":
-    app()
+def print_banner() -> None:
+    """Print the overview shown for a bare invocation (rich only, no typer)."""
+    from rich.console import Console
+    from rich.panel import Panel
+    from custom_speckit import __version__
+
+    commands = "\n".join(
+        f"  • [cyan]{name}[/cyan]{' ' * (9 - len(name))}- {summary}"
+        for name, summary in COMMAND_SUMMARIES
+    )
+    Console().print(Panel.fit(
+        f"[bold cyan]Custom Speckit[/bold cyan]\n"
+        f"Version: [bold green]{__version__}[/bold green]\n\n"
+        f"AI-powered Spec-Driven Development toolkit\n\n"
+        f"[dim]Commands:[/dim]\n"
+        f"{commands}\n\n"
+        f"[dim]Usage:[/dim] [yellow]uvx custom-speckit <command>[/yellow]",
+        border_style="cyan"
+    ))
+
+
+def build_app(commands=None):
+    """
+    Build the typer application, registering only the requested commands.
+
+    Args:
+        commands: Iterable of command names to register (defaults to all,
+            e.g. for --help). Left unannotated so `typing` stays off the
+            version fast path.
+    """
+    import typer
+
+    app = typer.Typer(
+        name="custom-speckit",
+        help="AI-powered Spec-Driven Development toolkit",
+        add_completion=False,
+    )
+
+    for name in commands if commands is not None else COMMANDS:
+        module_name, attribute = COMMANDS[name]
+        target = getattr(importlib.import_module(module_name), attribute)
+        if isinstance(target, typer.Typer):
+            app.add_typer(target, name=name)
+        else:
+            app.command(name=name)(target)
+
+    @app.command(context_settings={
+        "allow_extra_args": True,
+        "ignore_unknown_options": True,
+        "help_option_names": [],
+    })
+    def script(ctx: typer.Context):
+        """Run a .specify workflow script (check-prerequisites, compare-specs, ...) in-process."""
+        from custom_speckit.commands.script import run
+        raise typer.Exit(run(ctx.args))
 
+    @app.command()
+    def version():
+        """Show Custom Speckit version."""
+        print_version()
+
+    @app.callback(invoke_without_command=True)
+    def main(ctx: typer.Context):
+        """Custom Speckit - AI-powered Spec-Driven Development toolkit."""
+        if ctx.invoked_subcommand is None:
+            print_banner()
+
+    return app
+
+
+def main() -> None:
+    """Console script entry point."""
+    args = sys.argv[1:]
+
+    if not args:
+        print_banner()
+        return
+    if args == ["version"]:
+        print_version()
+        return
+    if args[0] == "script":
+        # Called several times per agent step; skip typer entirely
+        from custom_speckit.commands.script import run
+        sys.exit(run(args[1:]))
+
+    # Register only the invoked command; anything else (--help, typos) gets all
+    # of them so help output and error messages list every command
+    command = args[0]
+    build_app([command] if command in COMMANDS else None)()
+
+
+def __getattr__(name: str):
+    # Backwards compatibility: `custom_speckit.cli:app` still resolves
+    if name == "app":
+        return build_app()
+    raise AttributeError(name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Mechanical cross-artifact analysis of spec.md, plan.md and tasks.md."""
+
+import json
+from pathlib import Path
+import typer
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+from custom_speckit.utils.analyzer import analyze as analyze_artifacts
+from custom_speckit.utils.workspace import get_feature_paths
+
+console = Console()
+
+SECTIONS = [
+    ("requirements_without_tasks", "Requirements without tasks"),
+    ("stories_without_tasks", "Stories without tasks"),
+    ("tasks_without_story", "Tasks without a story label"),
+    ("tasks_with_unknown_references", "Tasks referencing unknown IDs"),
+    ("duplicate_ids", "Duplicate IDs"),
+    ("needs_clarification", "Unresolved [NEEDS CLARIFICATION]"),
+    ("missing_files", "Missing referenced files"),
+]
+
+
+def _describe(key: str, finding: dict) -> str:
+    if key == "duplicate_ids":
+        return f"{finding['id']} ({finding['artifact']} lines {', '.join(map(str, finding['lines']))})"
+    if key == "tasks_with_unknown_references":
+        return f"{finding['id']} → {', '.join(finding['references'])} (line {finding['line']})"
+    if key == "needs_clarification":
+        return f"{finding['artifact']}:{finding['line']} {finding['text']}"
+    if key == "missing_files":
+        return f"{finding['artifact']}:{finding['line']} {finding['path']}"
+    return f"{finding['id']} (line {finding['line']})"
+
+
+def analyze(
+    path: Path = typer.Argument(
+        Path.cwd(),
+        help="Project directory (defaults to current directory)",
+    ),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+    strict: bool = typer.Option(False, "--strict", help="Exit with status 1 if there are any findings"),
+):
+    """Check spec, plan, tasks and constitution for mechanical issues.
+
+    All four artifacts are read once into a single model, which is checked
+    for requirements and stories with no tasks, tasks with no story,
+    duplicate IDs, unresolved [NEEDS CLARIFICATION] markers and references
+    to files that do not exist.
+    """
+    report = analyze_artifacts(get_feature_paths(path))
+
+    if json_output:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        summary = report["summary"]
+        missing = [name for name, artifact in report["artifacts"].items() if artifact is None]
+        if missing:
+            console.print(f"[yellow]Not found: {', '.join(missing)}[/yellow]")
+
+        coverage = summary["coverage_percent"]
+        console.print(
+            f"[cyan]→[/cyan] {summary['requirements']} requirements, {summary['stories']} stories, "
+            f"{summary['tasks']} tasks ({summary['tasks_done']} done), "
+            f"coverage {'n/a' if coverage is None else f'{coverage}%'}"
+        )
+
+        table = Table(title="Findings")
+        table.add_column("Check")
+        table.add_column("Count", justify="right")
+        table.add_column("Details", style="dim")
+        for key, title in SECTIONS:
+            findings = report[key]
+            details = "\n".join(escape(_describe(key, f)) for f in findings[:10])
+            if len(findings) > 10:
+                details += f"\n… {len(findings) - 10} more"
+            table.add_row(escape(title), str(len(findings)), details)
+        console.print(table)
+
+        if summary["findings"]:
+            console.print(f"[yellow]{summary['findings']} finding(s)[/yellow]")
+        else:
+            console.print("[green]✓ No mechanical issues found[/green]")
+
+    if strict and report["summary"]["findings"]:
+        raise typer.Exit(1)
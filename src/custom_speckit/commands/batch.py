@@ -0,0 +1,324 @@
+"""Run init or update across many projects in one process."""
+
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+import typer
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+from custom_speckit import __version__
+from custom_speckit.utils.version import (
+    is_custom_speckit_installed,
+    get_installed_version,
+    get_installed_files,
+    get_installed_entries,
+    save_version_and_files,
+)
+from custom_speckit.utils.file_manager import (
+    COPY,
+    LINK_MODES,
+    copy_directory,
+    ensure_gitignore,
+    make_scripts_executable,
+)
+from custom_speckit.utils.backup_store import (
+    DEFAULT_KEEP_BACKUPS,
+    create_snapshot,
+    prune_snapshots,
+)
+from custom_speckit.utils.sync_plan import (
+    load_template,
+    plan_update,
+)
+from custom_speckit.utils.template_index import files_under
+from custom_speckit.utils.transaction import apply_update, recover
+
+console = Console()
+
+ACTIONS = ("init", "update")
+
+
+def _expand_paths(paths: List[str], from_file: Optional[Path]) -> List[Path]:
+    """Expand literal paths, glob patterns and a path list file into project directories."""
+    patterns = list(paths)
+    if from_file:
+        for line in from_file.read_text().splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                patterns.append(line)
+
+    projects = []
+    seen = set()
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        for match in matches:
+            project_root = Path(match).resolve()
+            if project_root.is_dir() and project_root not in seen:
+                seen.add(project_root)
+                projects.append(project_root)
+    return projects
+
+
+def _init_project(
+    project_root: Path,
+    template_dir: Path,
+    template_index: Dict[str, Dict],
+    link_mode: str,
+) -> Dict:
+    """Install templates into one project; mirrors the init command without output."""
+    # A pending update would otherwise be replayed over the fresh install later
+    recovered = recover(project_root)
+
+    copied_specify = copy_directory(
+        template_dir / ".specify", project_root / ".specify", link_mode=link_mode,
+        files=files_under(template_index, ".specify"),
+    )
+    copied_cursor = copy_directory(
+        template_dir / ".cursor", project_root / ".cursor", link_mode=link_mode,
+        files=files_under(template_index, ".cursor"),
+    )
+
+    scripts_dir = project_root / ".specify" / "scripts" / "bash"
+    if scripts_dir.exists():
+        make_scripts_executable(scripts_dir)
+
+    # Hashes of the copies come from the template index; nothing is re-read
+    save_version_and_files(
+        project_root,
+        __version__,
+        list(copied_specify),
+        list(copied_cursor),
+        link_methods={**copied_specify, **copied_cursor},
+        template_entries=template_index,
+    )
+    ensure_gitignore(project_root)
+    return {"added": len(copied_specify) + len(copied_cursor), "recovered": recovered}
+
+
+def _update_project(
+    project_root: Path,
+    template_dir: Path,
+    template_index: Dict[str, Dict],
+    dry_run: bool,
+    skip_backup: bool,
+    keep_backups: int,
+) -> Dict:
+    """Update one project; mirrors the update command without output."""
+    if not is_custom_speckit_installed(project_root):
+        raise RuntimeError("Custom Speckit is not installed (run init first)")
+
+    # Finish (or discard) an interrupted update before planning against the tree
+    recovered = None if dry_run else recover(project_root)
+
+    current_version = get_installed_version(project_root)
+    previous_entries = get_installed_entries(project_root)
+    plan = plan_update(
+        template_dir,
+        project_root,
+        get_installed_files(project_root),
+        previous_entries,
+        template_index,
+    )
+    result = {
+        "from_version": current_version,
+        "added": len(plan.added),
+        "updated": len(plan.updated),
+        "removed": len(plan.removed),
+        "conflicts": len(plan.conflicts),
+        "recovered": recovered,
+    }
+    if dry_run:
+        return result
+    if plan.total_changes == 0 and current_version == __version__:
+        result["up_to_date"] = True
+        return result
+
+    if not skip_backup and plan.total_changes:
+        result["snapshot"], _ = create_snapshot(project_root, plan, current_version, __version__)
+        prune_snapshots(project_root, keep_backups)
+
+    # Written files take their hashes from the template index
+    apply_update(project_root, plan, __version__, previous_entries, template_index)
+
+    scripts_dir = project_root / ".specify" / "scripts" / "bash"
+    if scripts_dir.exists():
+        make_scripts_executable(scripts_dir)
+
+    ensure_gitignore(project_root)
+    return result
+
+
+def _run_project(
+    action: str,
+    project_root: Path,
+    template_dir: Path,
+    template_index: Dict[str, Dict],
+    options: Dict,
+) -> Dict:
+    """Process-pool entry point; failures are reported instead of raised."""
+    try:
+        if action == "init" and options["dry_run"]:
+            # Init installs the whole template, so the preview is just its size
+            result = {"added": len(template_index)}
+        elif action == "init":
+            result = _init_project(project_root, template_dir, template_index, options["link_mode"])
+        else:
+            result = _update_project(
+                project_root,
+                template_dir,
+                template_index,
+                options["dry_run"],
+                options["skip_backup"],
+                options["keep_backups"],
+            )
+        result["ok"] = True
+    except Exception as e:  # noqa: BLE001 - one broken project must not stop the batch
+        result = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+    result["project"] = str(project_root)
+    return result
+
+
+def batch(
+    action: str = typer.Argument(
+        ...,
+        help="Command to run in every project: init or update",
+    ),
+    paths: List[str] = typer.Argument(
+        None,
+        help="Project directories or glob patterns (e.g. 'services/*/')",
+    ),
+    from_file: Optional[Path] = typer.Option(
+        None,
+        "--from-file",
+        "-f",
+        exists=True,
+        dir_okay=False,
+        help="File listing project paths or globs, one per line",
+    ),
+    jobs: int = typer.Option(
+        os.cpu_count() or 1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of projects processed in parallel",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Show what would change without making changes",
+    ),
+    skip_backup: bool = typer.Option(
+        False,
+        "--skip-backup",
+        help="Skip creating backups (not recommended)",
+    ),
+    keep_backups: int = typer.Option(
+        DEFAULT_KEEP_BACKUPS,
+        "--keep-backups",
+        min=1,
+        help="Number of backup snapshots to retain per project",
+    ),
+    link_mode: str = typer.Option(
+        COPY,
+        "--link-mode",
+        help="init only: copy, reflink, hardlink (.specify/scripts/ only, shared with the package), or auto",
+    ),
+):
+    """Run init or update across many projects at once.
+
+    The template is scanned and hashed once, then projects are processed
+    in parallel worker processes. Results and failures are reported in a
+    single table.
+    """
+    if action not in ACTIONS:
+        console.print(f"[red]✗ Unknown action '{action}'. Choose from: {', '.join(ACTIONS)}[/red]")
+        raise typer.Exit(1)
+    if link_mode not in LINK_MODES:
+        console.print(f"[red]✗ Unknown link mode '{link_mode}'. Choose from: {', '.join(LINK_MODES)}[/red]")
+        raise typer.Exit(1)
+
+    projects = _expand_paths(paths or [], from_file)
+    if not projects:
+        console.print("[red]✗ No project directories matched.[/red]")
+        raise typer.Exit(1)
+
+    console.print(Panel.fit(
+        f"[bold cyan]Custom Speckit Batch {action.capitalize()}[/bold cyan]\n"
+        f"Projects: [yellow]{len(projects)}[/yellow]\n"
+        f"Version: [green]{__version__}[/green]",
+        border_style="cyan"
+    ))
+
+    template_dir = Path(__file__).parent.parent / "templates"
+    if not template_dir.exists():
+        console.print("[red]✗ Template directory not found. Installation may be corrupted.[/red]")
+        raise typer.Exit(1)
+
+    console.print("\n[cyan]→[/cyan] Loading template index...")
+    template_index = load_template(template_dir)
+    console.print(f"[green]✓[/green] Indexed {len(template_index)} template files")
+
+    options = {
+        "dry_run": dry_run,
+        "skip_backup": skip_backup,
+        "keep_backups": keep_backups,
+        "link_mode": link_mode,
+    }
+
+    console.print(f"[cyan]→[/cyan] Processing {len(projects)} projects ({jobs} workers)...")
+    if jobs == 1 or len(projects) == 1:
+        results = [
+            _run_project(action, project, template_dir, template_index, options)
+            for project in projects
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(_run_project, action, project, template_dir, template_index, options)
+                for project in projects
+            ]
+            results = []
+            for project, future in zip(projects, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:  # noqa: BLE001 - e.g. BrokenProcessPool when a worker is killed
+                    results.append({"ok": False, "error": f"{type(e).__name__}: {e}", "project": str(project)})
+
+    table = Table(title=f"Batch {action}" + (" (dry run)" if dry_run else ""))
+    table.add_column("Project", style="yellow")
+    table.add_column("Status")
+    table.add_column("Added", justify="right")
+    if action == "update":
+        table.add_column("Updated", justify="right")
+        table.add_column("Removed", justify="right")
+        table.add_column("Conflicts", justify="right")
+
+    failures = 0
+    for result in results:
+        if not result["ok"]:
+            failures += 1
+            status = f"[red]✗ {result['error']}[/red]"
+        else:
+            status = "[green]✓[/green]"
+            if result.get("recovered"):
+                status += " [yellow](recovered)[/yellow]"
+            if result.get("up_to_date"):
+                status += " [dim](up to date)[/dim]"
+        row = [result["project"], status, str(result.get("added", "-"))]
+        if action == "update":
+            row += [
+                str(result.get("updated", "-")),
+                str(result.get("removed", "-")),
+                str(result.get("conflicts", "-")),
+            ]
+        table.add_row(*row)
+    console.print(table)
+
+    succeeded = len(results) - failures
+    console.print(f"\n[green]✓ {succeeded} succeeded[/green]" + (f", [red]{failures} failed[/red]" if failures else ""))
+    if failures:
+        raise typer.Exit(1)
@@ -0,0 +1,87 @@
+"""Build and inspect template delta bundles for offline upgrades."""
+
+from pathlib import Path
+from typing import Optional
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from custom_speckit.utils import tracing
+from custom_speckit.utils.bundle import BundleError, create_bundle, load_source, read_bundle
+
+console = Console()
+
+app = typer.Typer(
+    help="Ship only the template files that changed between two versions",
+    no_args_is_help=True,
+)
+
+
+@app.command()
+def create(
+    base: Path = typer.Argument(
+        ...,
+        help="Old version: a wheel, a project directory or .manifest.json, or a templates directory",
+    ),
+    target: Optional[Path] = typer.Option(
+        None,
+        "--to",
+        help="New version: a wheel or templates directory (defaults to this installation's templates)",
+    ),
+    output: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Bundle file (defaults to custom-speckit-<from>-to-<to>.bundle.tar.gz)",
+    ),
+    from_version: Optional[str] = typer.Option(None, "--from-version", help="Label for the old version"),
+    to_version: Optional[str] = typer.Option(None, "--to-version", help="Label for the new version"),
+):
+    """Build a bundle that upgrades installs of one version to another.
+
+    The bundle holds the new content of added and changed files (stored
+    once per distinct hash) and the hashes of both versions. Apply it on
+    each project with: custom-speckit update --from-bundle FILE
+    """
+    try:
+        base_source = load_source(base, from_version)
+        target_source = load_source(target, to_version)
+        output = output or Path(
+            f"custom-speckit-{base_source.version or 'unknown'}-to-{target_source.version}.bundle.tar.gz"
+        )
+        bundle = create_bundle(base_source, target_source, output)
+    except BundleError as e:
+        console.print(f"[red]✗ {e}[/red]")
+        raise typer.Exit(1)
+
+    console.print(
+        f"[green]✓[/green] Bundle {bundle.from_version or 'unknown'} → {bundle.to_version}: "
+        f"{len(bundle.changed)} changed, {len(bundle.removed)} removed, "
+        f"{len(bundle.target) - len(bundle.changed)} unchanged"
+    )
+    console.print(f"[dim]  {output} ({tracing.format_bytes(output.stat().st_size)})[/dim]")
+
+
+@app.command()
+def show(bundle_file: Path = typer.Argument(..., help="Bundle file")):
+    """List the files a bundle changes and the version it applies to."""
+    try:
+        bundle = read_bundle(bundle_file)
+    except BundleError as e:
+        console.print(f"[red]✗ {e}[/red]")
+        raise typer.Exit(1)
+
+    console.print(
+        f"[bold]{bundle.from_version or 'unknown'} → {bundle.to_version}[/bold] "
+        f"[dim]({tracing.format_bytes(bundle_file.stat().st_size)})[/dim]"
+    )
+    table = Table(show_header=True)
+    table.add_column("Change")
+    table.add_column("File", style="cyan")
+    table.add_column("Size", justify="right")
+    for relative in bundle.changed:
+        change = "[yellow]~ update[/yellow]" if relative in bundle.base else "[green]+ add[/green]"
+        table.add_row(change, relative, tracing.format_bytes(bundle.target[relative]["size"]))
+    for relative in bundle.removed:
+        table.add_row("[red]- remove[/red]", relative, "")
+    console.print(table)
@@ -0,0 +1,48 @@
+"""Print the compact context pack of an agent slash command."""
+
+import json
+from pathlib import Path
+import typer
+from rich.console import Console
+
+from custom_speckit.utils.context_pack import DEFAULT_BUDGET, PACKS, load_pack
+from custom_speckit.utils.workspace import get_feature_paths
+
+console = Console(stderr=True)
+
+
+def context(
+    command: str = typer.Argument(..., help=f"Slash command: {', '.join(PACKS)}"),
+    path: Path = typer.Option(
+        Path.cwd(),
+        "--path",
+        "-p",
+        help="Project directory (defaults to current directory)",
+    ),
+    budget: int = typer.Option(
+        DEFAULT_BUDGET,
+        "--budget",
+        "-b",
+        min=500,
+        help="Approximate token budget for the documents",
+    ),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Rebuild the pack and leave the cache untouched"),
+):
+    """Print the documents a slash command needs, in one compact pack.
+
+    The feature is resolved like the workflow scripts do. Only the sections
+    the command uses are kept, template comments are dropped and the result
+    is trimmed to the budget (later documents first). Packs are cached in
+    .specify/.cache/context/ until one of their documents changes.
+    """
+    command = command.removeprefix("speckit.")
+    if command not in PACKS:
+        console.print(f"[red]✗ No context pack for '{command}'. Choose from: {', '.join(PACKS)}[/red]")
+        raise typer.Exit(1)
+
+    result = load_pack(get_feature_paths(path), command, budget, use_cache=not no_cache)
+    if json_output:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print(result["pack"], end="")
@@ -1,18 +1,28 @@
 """Initialize Custom Speckit in a project."""
 
 from pathlib import Path
+from typing import Optional
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
 from custom_speckit import __version__
+from custom_speckit.utils import tracing
+from custom_speckit.utils.template_index import files_under, load_index
+from custom_speckit.utils.transaction import recover
 from custom_speckit.utils.version import (
     save_version_and_files,
 )
 from custom_speckit.utils.file_manager import (
+    COPY,
+    DEFAULT_JOBS,
+    HARDLINK,
+    LINK_MODES,
+    REFLINK,
     copy_directory,
     ensure_gitignore,
+    make_scripts_executable,
 )
 
 console = Console()
@@ -23,6 +33,32 @@ def init(
         Path.cwd(),
         help="Project directory to initialize (defaults to current directory)",
     ),
+    jobs: int = typer.Option(
+        DEFAULT_JOBS,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of files to copy concurrently",
+    ),
+    link_mode: str = typer.Option(
+        COPY,
+        "--link-mode",
+        help=(
+            "How to install files: copy, reflink, hardlink, or auto (reflink → copy). "
+            "hardlink shares .specify/scripts/ with the installed package, so editing a linked "
+            "script in place changes it for every linked project; other files are reflinked or copied"
+        ),
+    ),
+    timings: bool = typer.Option(
+        False,
+        "--timings",
+        help="Print per-phase durations, file counts and bytes read/written",
+    ),
+    trace: Optional[Path] = typer.Option(
+        None,
+        "--trace",
+        help="Write a Chrome trace (chrome://tracing, Perfetto) of the run to this file",
+    ),
 ):
     """Initialize Custom Speckit in your project.
     
@@ -34,6 +70,16 @@ def init(
     """
     project_root = path.resolve()
     
+    if link_mode not in LINK_MODES:
+        console.print(f"[red]✗ Unknown link mode '{link_mode}'. Choose from: {', '.join(LINK_MODES)}[/red]")
+        raise typer.Exit(1)
+    
+    with tracing.session(trace, timings, console, "init", {"command": "init", "version": __version__}):
+        _init(project_root, jobs, link_mode)
+
+
+def _init(project_root: Path, jobs: int, link_mode: str) -> None:
+    """Run the installation; see init() for the options."""
     console.print(Panel.fit(
         f"[bold cyan]Custom Speckit Initialization[/bold cyan]\n"
         f"Project: [yellow]{project_root}[/yellow]\n"
@@ -43,6 +89,12 @@ def init(
     
     # Always overwrite - no warning needed
     
+    # Init overwrites everything anyway; finish a pending update first so it
+    # cannot be replayed over the fresh install later
+    recovered = recover(project_root)
+    if recovered:
+        console.print(f"[yellow]![/yellow] {recovered}")
+    
     # Get template directory
     template_dir = Path(__file__).parent.parent / "templates"
     
@@ -50,13 +102,20 @@ def init(
         console.print("[red]✗ Template directory not found. Installation may be corrupted.[/red]")
         raise typer.Exit(1)
     
+    # The wheel's build-time index lists the files; a source checkout is walked
+    template_index = load_index(template_dir)
+    
     # Copy .specify directory
     console.print("\n[cyan]→[/cyan] Installing .specify/ directory...")
     specify_src = template_dir / ".specify"
     specify_dst = project_root / ".specify"
     
     if specify_src.exists():
-        copied_specify = copy_directory(specify_src, specify_dst, skip_existing=False)
+        with tracing.span("install .specify"):
+            copied_specify = copy_directory(
+                specify_src, specify_dst, skip_existing=False, jobs=jobs, link_mode=link_mode,
+                files=files_under(template_index, ".specify"),
+            )
         console.print(f"[green]✓[/green] Installed {len(copied_specify)} files to .specify/")
     else:
         console.print("[red]✗ .specify template not found[/red]")
@@ -68,7 +127,11 @@ def init(
     cursor_dst = project_root / ".cursor"
     
     if cursor_src.exists():
-        copied_cursor = copy_directory(cursor_src, cursor_dst, skip_existing=False)
+        with tracing.span("install .cursor"):
+            copied_cursor = copy_directory(
+                cursor_src, cursor_dst, skip_existing=False, jobs=jobs, link_mode=link_mode,
+                files=files_under(template_index, ".cursor"),
+            )
         console.print(f"[green]✓[/green] Installed {len(copied_cursor)} files to .cursor/")
     else:
         console.print("[red]✗ .cursor template not found[/red]")
@@ -78,17 +141,31 @@ def init(
     console.print("[cyan]→[/cyan] Setting script permissions...")
     scripts_dir = project_root / ".specify" / "scripts" / "bash"
     if scripts_dir.exists():
-        for script in scripts_dir.glob("*.sh"):
-            script.chmod(0o755)
+        with tracing.span("chmod"):
+            make_scripts_executable(scripts_dir)
         console.print("[green]✓[/green] Made scripts executable")
     
-    # Save version and file manifest
-    save_version_and_files(project_root, __version__, copied_specify, copied_cursor)
+    # Save version and file manifest (with the install method of linked files)
+    methods = {**copied_specify, **copied_cursor}
+    with tracing.span("manifest"):
+        save_version_and_files(
+            project_root,
+            __version__,
+            list(copied_specify),
+            list(copied_cursor),
+            link_methods=methods,
+            template_entries=template_index,
+        )
+    for method in (REFLINK, HARDLINK):
+        linked = sum(1 for used in methods.values() if used == method)
+        if linked:
+            console.print(f"[green]✓[/green] Installed {linked} files as {method}s")
     console.print(f"[green]✓[/green] Saved version {__version__}")
     
     # Update .gitignore
     console.print("[cyan]→[/cyan] Updating .gitignore...")
-    ensure_gitignore(project_root)
+    with tracing.span("gitignore"):
+        ensure_gitignore(project_root)
     console.print("[green]✓[/green] Updated .gitignore")
     
     # Summary
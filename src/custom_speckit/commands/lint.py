@@ -0,0 +1,87 @@
+"""Check spec, plan, task and checklist files against the project's rules."""
+
+import json
+from pathlib import Path
+from typing import List, Optional
+import typer
+from rich.console import Console
+from rich.markup import escape
+
+from custom_speckit.utils.linter import ERROR, lint_project
+from custom_speckit.utils.workspace import get_feature_paths
+
+console = Console()
+
+
+def _relative(file: Path, root: Path) -> Optional[str]:
+    try:
+        return file.resolve().relative_to(root.resolve()).as_posix()
+    except ValueError:
+        return None
+
+
+def lint(
+    files: Optional[List[Path]] = typer.Argument(
+        None,
+        help="Files to check (defaults to every spec, plan, tasks, checklist and the constitution)",
+    ),
+    path: Path = typer.Option(
+        Path.cwd(),
+        "--path",
+        "-p",
+        help="Project directory (defaults to current directory)",
+    ),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+    strict: bool = typer.Option(False, "--strict", help="Exit with an error on warnings too"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Check every file and leave the cache untouched"),
+):
+    """Check documents against rules compiled from the templates and constitution.
+
+    Reports unfilled template placeholders, missing mandatory sections,
+    malformed or duplicate IDs, too many [NEEDS CLARIFICATION] markers and
+    constitution principles the plan's Constitution Check leaves out. Only
+    files changed since the last run are read; results are cached in
+    .specify/.cache/lint.json. Passing the staged files makes it cheap
+    enough for a pre-commit hook.
+    """
+    root = get_feature_paths(path).repo_root
+    relative_files = None
+    if files:
+        relative_files = []
+        for file in files:
+            relative = _relative(file, root)
+            if relative is None:
+                console.print(f"[yellow]![/yellow] Skipping {escape(str(file))} (outside {root})")
+            else:
+                relative_files.append(relative)
+
+    report = lint_project(root, relative_files, use_cache=not no_cache)
+    findings = [
+        {"path": relative, **finding}
+        for relative, file_findings in report["files"].items()
+        for finding in file_findings
+    ]
+    errors = sum(1 for finding in findings if finding["severity"] == ERROR)
+    warnings = len(findings) - errors
+
+    if json_output:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        for finding in findings:
+            color = "red" if finding["severity"] == ERROR else "yellow"
+            console.print(
+                f"{escape(finding['path'])}:{finding['line']}: [{color}]{finding['severity']}[/{color}] "
+                f"[dim]\\[{finding['rule']}][/dim] {escape(finding['message'])}"
+            )
+        checked = len(report["files"])
+        cached = checked - len(report["linted"])
+        summary = f"{checked} files checked [dim]({cached} from cache)[/dim]"
+        if report["rules_recompiled"]:
+            summary += " [dim]- rules recompiled[/dim]"
+        if errors or warnings:
+            console.print(f"[red]✗[/red] {errors} errors, {warnings} warnings in {summary}")
+        else:
+            console.print(f"[green]✓[/green] No problems in {summary}")
+
+    if errors or (strict and warnings):
+        raise typer.Exit(1)
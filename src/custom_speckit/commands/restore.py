@@ -0,0 +1,90 @@
+"""Restore Custom Speckit files from an update backup snapshot."""
+
+from pathlib import Path
+from typing import Optional
+import typer
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+from custom_speckit.utils.backup_store import list_snapshots, restore_snapshot
+from custom_speckit.utils.transaction import recover
+
+console = Console()
+
+
+def restore(
+    path: Path = typer.Argument(
+        Path.cwd(),
+        help="Project directory to restore (defaults to current directory)",
+    ),
+    snapshot: Optional[str] = typer.Option(
+        None,
+        "--snapshot",
+        "-s",
+        help="Snapshot id to restore (defaults to the most recent)",
+    ),
+    list_only: bool = typer.Option(
+        False,
+        "--list",
+        help="List available snapshots without restoring",
+    ),
+):
+    """Roll back files changed by an update.
+    
+    Each update stores a snapshot of the files it overwrote or removed.
+    Restoring a snapshot puts those files back, deletes files the update
+    added, and restores the previous version and manifest. Restoring an
+    older snapshot also rolls back every update made after it. The files a
+    restore changes are snapshotted first, so a restore can be undone by
+    restoring that snapshot.
+    """
+    project_root = path.resolve()
+    snapshots = list_snapshots(project_root)
+    
+    if not snapshots:
+        console.print("[yellow]No backup snapshots found.[/yellow]")
+        raise typer.Exit(1)
+    
+    if list_only:
+        table = Table(title="Backup snapshots")
+        table.add_column("Snapshot", style="cyan")
+        table.add_column("Created")
+        table.add_column("Version")
+        table.add_column("Files", justify="right")
+        for item in reversed(snapshots):
+            table.add_row(
+                item["id"],
+                item["created"],
+                f"{item['from_version'] or 'unknown'} → {item['to_version'] or 'unknown'}",
+                str(len(item["files"])),
+            )
+        console.print(table)
+        raise typer.Exit(0)
+    
+    snapshot_id = snapshot or snapshots[-1]["id"]
+    
+    console.print(Panel.fit(
+        f"[bold cyan]Custom Speckit Restore[/bold cyan]\n"
+        f"Project: [yellow]{project_root}[/yellow]\n"
+        f"Snapshot: [green]{snapshot_id}[/green]",
+        border_style="cyan"
+    ))
+    
+    # A pending update would otherwise be replayed over the restored files
+    recovered = recover(project_root)
+    if recovered:
+        console.print(f"[yellow]![/yellow] {recovered}")
+    
+    try:
+        restored, removed, rolled_back, backup_id = restore_snapshot(project_root, snapshot_id)
+    except FileNotFoundError as e:
+        console.print(f"[red]✗ {e}[/red]")
+        raise typer.Exit(1)
+    
+    if len(rolled_back) > 1:
+        console.print(f"[cyan]→[/cyan] Rolled back {len(rolled_back)} updates, newest first")
+    console.print(f"[green]✓[/green] Restored {len(restored)} files")
+    if removed:
+        console.print(f"[green]✓[/green] Removed {len(removed)} files added by the update")
+    console.print(f"[dim]  Undo with: custom-speckit restore --snapshot {backup_id}[/dim]")
@@ -0,0 +1,670 @@
+"""In-process implementations of the .specify/scripts/bash workflow scripts.
+
+`custom-speckit script <name> [OPTIONS]` accepts the same options and prints
+the same text and JSON output as the bash script of the same name. The CLI
+dispatches here before typer is imported, so each call costs one interpreter
+start instead of a bash process plus several `git` forks. Modules only some
+scripts need (re, shutil, fnmatch) are imported inside those scripts.
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from custom_speckit.utils.workspace import (
+    check_feature_branch,
+    find_git_dir,
+    find_specify_root,
+    get_feature_paths,
+)
+
+
+def _emit_json(data: Dict) -> None:
+    print(json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+
+
+def _error(message: str) -> int:
+    print(message, file=sys.stderr)
+    return 1
+
+
+def _unknown_option(arg: str) -> int:
+    return _error(f"ERROR: Unknown option '{arg}'. Use --help for usage information.")
+
+
+CHECK_PREREQUISITES_HELP = """Usage: check-prerequisites.sh [OPTIONS]
+
+Consolidated prerequisite checking for Spec-Driven Development workflow.
+
+OPTIONS:
+  --json              Output in JSON format
+  --require-tasks     Require tasks.md to exist (for implementation phase)
+  --include-tasks     Include tasks.md in AVAILABLE_DOCS list
+  --paths-only        Only output path variables (no prerequisite validation)
+  --help, -h          Show this help message
+"""
+
+
+def check_prerequisites(args: List[str]) -> int:
+    """Port of check-prerequisites.sh."""
+    flags = {"--json": False, "--require-tasks": False, "--include-tasks": False, "--paths-only": False}
+    for arg in args:
+        if arg in ("--help", "-h"):
+            print(CHECK_PREREQUISITES_HELP)
+            return 0
+        if arg not in flags:
+            return _unknown_option(arg)
+        flags[arg] = True
+    json_mode = flags["--json"]
+
+    paths = get_feature_paths()
+    if not check_feature_branch(paths.current_branch, paths.has_git):
+        return 1
+
+    if flags["--paths-only"]:
+        values = {
+            "REPO_ROOT": paths.repo_root,
+            "BRANCH": paths.current_branch,
+            "FEATURE_DIR": paths.feature_dir,
+            "FEATURE_SPEC": paths.feature_spec,
+            "IMPL_PLAN": paths.impl_plan,
+            "TASKS": paths.tasks,
+        }
+        if json_mode:
+            _emit_json({key: str(value) for key, value in values.items()})
+        else:
+            for key, value in values.items():
+                print(f"{key}: {value}")
+        return 0
+
+    if not paths.feature_dir.is_dir():
+        return _error(
+            f"ERROR: Feature directory not found: {paths.feature_dir}\n"
+            "Run /speckit.specify first to create the feature structure."
+        )
+    if not paths.impl_plan.is_file():
+        return _error(
+            f"ERROR: plan.md not found in {paths.feature_dir}\n"
+            "Run /speckit.plan first to create the implementation plan."
+        )
+    if flags["--require-tasks"] and not paths.tasks.is_file():
+        return _error(
+            f"ERROR: tasks.md not found in {paths.feature_dir}\n"
+            "Run /speckit.tasks first to create the task list."
+        )
+
+    contracts_present = paths.contracts_dir.is_dir() and any(os.scandir(paths.contracts_dir))
+    candidates = [
+        ("research.md", paths.research.is_file()),
+        ("data-model.md", paths.data_model.is_file()),
+        ("contracts/", contracts_present),
+        ("quickstart.md", paths.quickstart.is_file()),
+    ]
+    if flags["--include-tasks"]:
+        candidates.append(("tasks.md", paths.tasks.is_file()))
+
+    if json_mode:
+        _emit_json({
+            "FEATURE_DIR": str(paths.feature_dir),
+            "AVAILABLE_DOCS": [name for name, present in candidates if present],
+        })
+    else:
+        print(f"FEATURE_DIR:{paths.feature_dir}")
+        print("AVAILABLE_DOCS:")
+        for name, present in candidates:
+            print(f"  {'✓' if present else '✗'} {name}")
+    return 0
+
+
+COMPARE_SPECS_HELP = """Usage: compare-specs.sh [OPTIONS]
+
+Check if existing spec exists to determine if delta workflow is needed.
+With --diff or --against, also report the spec sections that change.
+
+OPTIONS:
+  --json              Output in JSON format
+  --diff              Diff the spec against DELTA_DIR/delta-spec.md as it would merge
+  --against PATH      Diff the spec against another version of it
+  --no-text           With --diff/--against, omit the old/new section text
+  --help, -h          Show this help message"""
+
+
+def compare_specs(args: List[str]) -> int:
+    """Port of compare-specs.sh, plus the section diff behind --diff/--against."""
+    json_mode = diff_mode = False
+    include_text = True
+    against: Optional[Path] = None
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == "--json":
+            json_mode = True
+        elif arg == "--diff":
+            diff_mode = True
+        elif arg == "--no-text":
+            include_text = False
+        elif arg == "--against":
+            if i + 1 >= len(args):
+                return _error("ERROR: --against requires a path")
+            against = Path(args[i + 1]).resolve()
+            i += 1
+        elif arg in ("--help", "-h"):
+            print(COMPARE_SPECS_HELP)
+            return 0
+        else:
+            return _unknown_option(arg)
+        i += 1
+
+    paths = get_feature_paths()
+    spec_path = paths.feature_spec
+    delta_dir = paths.repo_root / ".specify" / ".deltas" / paths.current_branch
+    has_spec = spec_path.is_file()
+    modified = ""
+    if has_spec:
+        modified = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(spec_path.stat().st_mtime))
+
+    diff: Optional[Dict] = None
+    if diff_mode or against is not None:
+        delta_path = delta_dir / "delta-spec.md"
+        if not has_spec:
+            return _error(f"ERROR: Spec not found: {spec_path}")
+        if against is None and not delta_path.is_file():
+            return _error(f"ERROR: Delta spec not found: {delta_path}")
+        if against is not None and not against.is_file():
+            return _error(f"ERROR: File not found: {against}")
+
+        from custom_speckit.utils.spec_diff import SECTIONS_FILE, diff_spec, summarize
+        changes, conflicts = diff_spec(
+            spec_path,
+            paths.repo_root / SECTIONS_FILE,
+            delta_path=None if against is not None else delta_path,
+            against=against,
+            include_text=include_text,
+        )
+        diff = {
+            "AGAINST": str(against or delta_path),
+            "SUMMARY": summarize(changes),
+            "CHANGES": changes,
+            "CONFLICTS": conflicts,
+        }
+
+    if json_mode:
+        output = {
+            "HAS_EXISTING_SPEC": has_spec,
+            "SPEC_PATH": str(spec_path),
+            "DELTA_DIR": str(delta_dir),
+            "CURRENT_BRANCH": paths.current_branch,
+            "SPEC_MODIFIED": modified,
+        }
+        if diff is not None:
+            output["DIFF"] = diff
+        _emit_json(output)
+    else:
+        print(f"HAS_EXISTING_SPEC: {str(has_spec).lower()}")
+        print(f"SPEC_PATH: {spec_path}")
+        print(f"DELTA_DIR: {delta_dir}")
+        print(f"CURRENT_BRANCH: {paths.current_branch}")
+        if modified:
+            print(f"SPEC_MODIFIED: {modified}")
+        if diff is not None:
+            summary = diff["SUMMARY"]
+            print(f"SECTIONS: {summary['added']} added, {summary['changed']} changed, {summary['removed']} removed")
+            for change in diff["CHANGES"]:
+                line = change["new_line"] or change["old_line"]
+                print(f"  {change['change'].upper():8} {change['anchor']} (line {line})")
+            for conflict in diff["CONFLICTS"]:
+                print(f"  CONFLICT {conflict['id']}: {conflict['reason']}")
+    return 0
+
+
+MERGE_DELTA_SPEC_HELP = """Usage: merge-delta-spec.sh [OPTIONS]
+
+Validate and prepare for merging delta specification into main spec.
+With --apply, merge it: additions, modifications and deletions are applied
+by ID and the spec is rewritten atomically. The spec before and after the
+merge is recorded in the spec history (custom-speckit spec history).
+
+OPTIONS:
+  --spec-path PATH    Path to main specification (specs/spec.md)
+  --delta-path PATH   Path to delta specification (.deltas/{branch}/delta-spec.md)
+  --branch NAME       Branch name for tracking
+  --apply             Merge the delta into the spec
+  --dry-run           With --apply, report what would change without writing
+  --partial           With --apply, apply non-conflicting changes even if others conflict
+                      (reported as SUCCESS with PARTIAL and the skipped CONFLICTS)
+  --json              Output in JSON format
+  --help, -h          Show this help message"""
+
+
+def _record_merge(spec_path: Path, before: bytes, branch: str) -> Optional[int]:
+    """
+    Record the spec before and after a merge in the spec history.
+
+    Returns:
+        Revision number of the merged spec, or None if the spec is not a
+        project's .specify/specs/spec.md or did not change
+    """
+    from custom_speckit.utils.spec_history import record_revision
+
+    specs_dir = spec_path.parent
+    if spec_path.name != "spec.md" or specs_dir.name != "specs" or specs_dir.parent.name != ".specify":
+        return None
+    after = spec_path.read_bytes()
+    if after == before:
+        return None
+    project_root = specs_dir.parent.parent
+    record_revision(project_root, before, branch=branch, note="before merge")
+    entry = record_revision(project_root, after, branch=branch, note="approved", previous=before)
+    return entry["rev"] if entry else None
+
+
+def merge_delta_spec(args: List[str]) -> int:
+    """Port of merge-delta-spec.sh, plus the native merge behind --apply."""
+    flags = {"--json": False, "--apply": False, "--dry-run": False, "--partial": False}
+    values = {"--spec-path": "", "--delta-path": "", "--branch": ""}
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in values:
+            values[arg] = args[i + 1] if i + 1 < len(args) else ""
+            i += 2
+            continue
+        if arg in flags:
+            flags[arg] = True
+        elif arg in ("--help", "-h"):
+            print(MERGE_DELTA_SPEC_HELP)
+            return 0
+        else:
+            return _unknown_option(arg)
+        i += 1
+    json_mode = flags["--json"]
+
+    for option in values:
+        if not values[option]:
+            return _error(f"ERROR: {option} is required")
+
+    spec_path = Path(values["--spec-path"])
+    delta_path = Path(values["--delta-path"])
+    branch = values["--branch"]
+
+    error = ""
+    if not spec_path.is_file():
+        error = f"Main spec not found: {spec_path}"
+    if not delta_path.is_file():
+        error = f"Delta spec not found: {delta_path}"
+    if not error and not os.access(spec_path, os.W_OK):
+        error = f"Main spec is not writable: {spec_path}"
+
+    if not error:
+        spec_path = Path(os.path.abspath(spec_path))
+        delta_path = Path(os.path.abspath(delta_path))
+
+    report: Dict = {}
+    if not error and flags["--apply"]:
+        from custom_speckit.utils.delta_merge import apply_delta
+
+        before = spec_path.read_bytes()
+        result = apply_delta(spec_path, delta_path, dry_run=flags["--dry-run"], partial=flags["--partial"])
+        report = result.report()
+        report["DRY_RUN"] = flags["--dry-run"]
+        # A partial merge that applied something succeeded; its conflicts are listed
+        report["PARTIAL"] = flags["--partial"] and bool(result.conflicts) and result.applied > 0
+        report["SPEC_MODIFIED"] = False
+        if not flags["--dry-run"]:
+            report["HISTORY_REV"] = _record_merge(spec_path, before, branch)
+            report["SPEC_MODIFIED"] = spec_path.read_bytes() != before
+        if not result.success and not report["PARTIAL"]:
+            error = f"{len(result.conflicts)} conflicting change(s); spec.md was not modified"
+
+    if json_mode:
+        if error and not report:
+            _emit_json({"SUCCESS": False, "ERROR": error})
+        else:
+            _emit_json({
+                "SUCCESS": not error,
+                "SPEC_PATH": str(spec_path),
+                "DELTA_PATH": str(delta_path),
+                "BRANCH": branch,
+                **report,
+                **({"ERROR": error} if error else {}),
+            })
+    else:
+        print(f"SUCCESS: {str(not error).lower()}")
+        if error:
+            print(f"ERROR: {error}")
+        if not error or report:
+            print(f"SPEC_PATH: {spec_path}")
+            print(f"DELTA_PATH: {delta_path}")
+            print(f"BRANCH: {branch}")
+        if report:
+            print(f"APPLIED: {report['APPLIED']}")
+            print(f"CONFLICT_COUNT: {report['CONFLICT_COUNT']}")
+            print(f"PARTIAL: {str(report['PARTIAL']).lower()}")
+            print(f"SPEC_MODIFIED: {str(report['SPEC_MODIFIED']).lower()}")
+            print(f"ADDITIONS_APPLIED: {report['ADDITIONS_APPLIED']}")
+            print(f"MODIFICATIONS_APPLIED: {report['MODIFICATIONS_APPLIED']}")
+            print(f"DELETIONS_APPLIED: {report['DELETIONS_APPLIED']}")
+            for new_id, assigned in report["ASSIGNED_IDS"].items():
+                print(f"ASSIGNED: {new_id} -> {assigned}")
+            for conflict in report["CONFLICTS"]:
+                print(f"CONFLICT: {conflict['id']} ({conflict['action']}, {conflict['reason']}): {conflict['detail']}")
+            for heading in report["SKIPPED"]:
+                print(f"SKIPPED: {heading}")
+            if report.get("HISTORY_REV"):
+                print(f"HISTORY_REV: {report['HISTORY_REV']}")
+    return 1 if error else 0
+
+
+def setup_plan(args: List[str]) -> int:
+    """Port of setup-plan.sh."""
+    json_mode = False
+    for arg in args:
+        if arg == "--json":
+            json_mode = True
+        elif arg in ("--help", "-h"):
+            print("Usage: setup-plan.sh [--json]\n"
+                  "  --json    Output results in JSON format\n"
+                  "  --help    Show this help message")
+            return 0
+
+    paths = get_feature_paths()
+    if not check_feature_branch(paths.current_branch, paths.has_git):
+        return 1
+
+    import shutil
+
+    paths.feature_dir.mkdir(parents=True, exist_ok=True)
+    template = paths.repo_root / ".specify" / "templates" / "plan-template.md"
+    if template.is_file():
+        shutil.copy(template, paths.impl_plan)
+        print(f"Copied plan template to {paths.impl_plan}")
+    else:
+        print(f"Warning: Plan template not found at {template}")
+        paths.impl_plan.touch()
+
+    has_git = str(paths.has_git).lower()
+    if json_mode:
+        _emit_json({
+            "FEATURE_SPEC": str(paths.feature_spec),
+            "IMPL_PLAN": str(paths.impl_plan),
+            "SPECS_DIR": str(paths.feature_dir),
+            "BRANCH": paths.current_branch,
+            "HAS_GIT": has_git,
+        })
+    else:
+        print(f"FEATURE_SPEC: {paths.feature_spec}")
+        print(f"IMPL_PLAN: {paths.impl_plan}")
+        print(f"SPECS_DIR: {paths.feature_dir}")
+        print(f"BRANCH: {paths.current_branch}")
+        print(f"HAS_GIT: {has_git}")
+    return 0
+
+
+VERSION_PATTERN = r"^v[0-9]+\.[0-9]+\.[0-9]+(-[a-zA-Z0-9.-]+)?(\+[a-zA-Z0-9.-]+)?$"
+
+
+def _is_valid_version(version: str) -> bool:
+    import re
+
+    return re.match(VERSION_PATTERN, version) is not None
+
+
+def _ensure_v_prefix(version: str) -> str:
+    return version if version.startswith("v") else f"v{version}"
+
+
+def _version_sort_key(tag: str):
+    """Approximate `git tag --sort=v:refname`: compare digit runs numerically."""
+    import re
+
+    return [(0, int(part), "") if part.isdigit() else (1, 0, part) for part in re.split(r"(\d+)", tag) if part]
+
+
+def _latest_version_tag(git_dir: Path) -> Optional[str]:
+    """Read v*.*.* tags from loose refs and packed-refs without running git."""
+    import fnmatch
+
+    tags = set()
+    tags_dir = git_dir / "refs" / "tags"
+    if tags_dir.is_dir():
+        for path in tags_dir.rglob("*"):
+            if path.is_file():
+                tags.add(path.relative_to(tags_dir).as_posix())
+    packed = git_dir / "packed-refs"
+    if packed.is_file():
+        for line in packed.read_text().splitlines():
+            parts = line.split(" ", 1)
+            if len(parts) == 2 and parts[1].startswith("refs/tags/"):
+                tags.add(parts[1][len("refs/tags/"):])
+    matching = [tag for tag in tags if fnmatch.fnmatchcase(tag, "v*.*.*")]
+    return max(matching, key=_version_sort_key) if matching else None
+
+
+def _pyproject_version(path: Path) -> Optional[str]:
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            tomllib = None
+    if tomllib is not None:
+        try:
+            data = tomllib.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        return data.get("project", {}).get("version") or data.get("tool", {}).get("poetry", {}).get("version")
+    import re
+
+    match = re.search(r'^version\s*=\s*"([^"]+)"', path.read_text(), re.MULTILINE)
+    return match.group(1) if match else None
+
+
+def get_version(args: List[str]) -> int:
+    """Port of get-version.sh."""
+    json_mode = False
+    auto_mode = False
+    specified = ""
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == "--json":
+            json_mode = True
+        elif arg == "--auto":
+            auto_mode = True
+        elif arg == "--version":
+            specified = args[i + 1] if i + 1 < len(args) else ""
+            i += 1
+        elif arg in ("--help", "-h"):
+            print("Usage: get-version.sh [OPTIONS]\n\n"
+                  "Detect project version from various sources.\n\n"
+                  "OPTIONS:\n"
+                  "  --json              Output in JSON format\n"
+                  "  --auto              Don't prompt user, use \"v1.0.0\" as default if no version found\n"
+                  "  --version VERSION   Use specified version instead of detecting\n"
+                  "  --help, -h          Show this help message")
+            return 0
+        # Unknown args are skipped (might be from other tools)
+        i += 1
+
+    cwd = Path.cwd().resolve()
+    work_tree, git_dir = find_git_dir(cwd)
+    repo_root = work_tree or find_specify_root(cwd) or cwd
+
+    def invalid(value: str, fallback_note: bool = False) -> None:
+        if json_mode:
+            print(json.dumps({"ERROR": f"Invalid version format: {value}"}, separators=(",", ":")), file=sys.stderr)
+        else:
+            print(f"ERROR: Invalid version format: {value}", file=sys.stderr)
+            print("Using default: v1.0.0" if fallback_note else "Expected format: v1.0.0 or 1.0.0", file=sys.stderr)
+
+    version = ""
+    source = "unknown"
+
+    if specified:
+        version = _ensure_v_prefix(specified)
+        if not _is_valid_version(version):
+            invalid(specified)
+            return 1
+        source = "specified"
+
+    if not version and git_dir is not None:
+        tag = _latest_version_tag(git_dir)
+        if tag:
+            version, source = tag, "git"
+
+    if not version and (repo_root / "pyproject.toml").is_file():
+        found = _pyproject_version(repo_root / "pyproject.toml")
+        if found:
+            version, source = _ensure_v_prefix(found), "pyproject"
+
+    if not version and (repo_root / "package.json").is_file():
+        try:
+            found = json.loads((repo_root / "package.json").read_text()).get("version")
+        except (OSError, ValueError):
+            found = None
+        if found:
+            version, source = _ensure_v_prefix(found), "package"
+
+    if not version:
+        if auto_mode:
+            version, source = "v1.0.0", "default"
+        else:
+            print("No version detected from git tags, pyproject.toml, or package.json", file=sys.stderr)
+            print("Please enter project version (e.g., v1.0.0 or 1.0.0):", file=sys.stderr)
+            user_version = sys.stdin.readline().strip()
+            if not user_version:
+                version, source = "v1.0.0", "default"
+            else:
+                version = _ensure_v_prefix(user_version)
+                if _is_valid_version(version):
+                    source = "user"
+                else:
+                    invalid(user_version, fallback_note=True)
+                    version, source = "v1.0.0", "default"
+
+    if json_mode:
+        _emit_json({"VERSION": version, "SOURCE": source})
+    else:
+        print(f"VERSION: {version}")
+        print(f"SOURCE: {source}")
+    return 0
+
+
+def update_agent_context(args: List[str]) -> int:
+    """Port of update-agent-context.sh; plan.md is parsed once for all agents."""
+    from custom_speckit.utils.agent_context import (
+        AGENT_FILES,
+        parse_plan,
+        select_agent_files,
+        update_agent_files,
+    )
+
+    agent_types = "|".join(dict.fromkeys(key for key, _, _ in AGENT_FILES))
+    agent_type = args[0] if args else ""
+    paths = get_feature_paths()
+
+    if not paths.impl_plan.is_file():
+        print(f"ERROR: No plan.md found at {paths.impl_plan}", file=sys.stderr)
+        print("INFO: Make sure you're working on a feature with a corresponding spec directory")
+        if not paths.has_git:
+            print("INFO: Use: export SPECIFY_FEATURE=your-feature-name or create a new feature first")
+        return 1
+
+    print(f"INFO: === Updating agent context files for feature {paths.current_branch} ===")
+    print(f"INFO: Parsing plan data from {paths.impl_plan}")
+    plan = parse_plan(paths.impl_plan.read_text(encoding="utf-8"))
+    if plan.language:
+        print(f"INFO: Found language: {plan.language}")
+    else:
+        print("WARNING: No language information found in plan", file=sys.stderr)
+    if plan.framework:
+        print(f"INFO: Found framework: {plan.framework}")
+    if plan.database:
+        print(f"INFO: Found database: {plan.database}")
+    if plan.project_type:
+        print(f"INFO: Found project type: {plan.project_type}")
+
+    try:
+        targets = select_agent_files(paths.repo_root, agent_type or None)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        print(f"ERROR: Expected: {agent_types}", file=sys.stderr)
+        return 1
+
+    if agent_type:
+        print(f"INFO: Updating specific agent: {agent_type}")
+    else:
+        print("INFO: No agent specified, updating all existing agent files...")
+        if not targets[0][0].is_file():
+            print("INFO: No existing agent files found, creating default Claude file...")
+
+    try:
+        results = update_agent_files(
+            paths.repo_root,
+            plan,
+            paths.current_branch,
+            targets,
+            time.strftime("%Y-%m-%d"),
+        )
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        print("ERROR: Agent context update completed with errors", file=sys.stderr)
+        return 1
+
+    messages = {
+        "created": "✓ Created new {} context file",
+        "updated": "✓ Updated existing {} context file",
+        "unchanged": "✓ {} context file already up to date",
+    }
+    for result in results:
+        print(f"INFO: Updating {result.name} context file: {result.path}")
+        if result.status == "created":
+            print("INFO: Creating new agent context file from template...")
+        else:
+            print("INFO: Updating existing agent context file...")
+        print(messages[result.status].format(result.name))
+
+    print()
+    print("INFO: Summary of changes:")
+    if plan.language:
+        print(f"  - Added language: {plan.language}")
+    if plan.framework:
+        print(f"  - Added framework: {plan.framework}")
+    if plan.database:
+        print(f"  - Added database: {plan.database}")
+    print()
+    print(f"INFO: Usage: update-agent-context.sh [{agent_types}]")
+    print("✓ Agent context update completed successfully")
+    return 0
+
+
+SCRIPTS: Dict[str, Callable[[List[str]], int]] = {
+    "check-prerequisites": check_prerequisites,
+    "compare-specs": compare_specs,
+    "merge-delta-spec": merge_delta_spec,
+    "setup-plan": setup_plan,
+    "get-version": get_version,
+    "update-agent-context": update_agent_context,
+}
+
+
+def run(argv: List[str]) -> int:
+    """Run `script <name> [OPTIONS]`; returns the process exit code."""
+    if not argv or argv[0] in ("--help", "-h"):
+        print("Usage: custom-speckit script <name> [OPTIONS]\n\nAvailable scripts:")
+        for name in SCRIPTS:
+            print(f"  {name}")
+        return 0 if argv else 1
+
+    name, args = argv[0], argv[1:]
+    if name.endswith(".sh"):
+        name = name[:-3]
+    if name not in SCRIPTS:
+        _error(f"ERROR: Unknown script '{name}'. Available: {', '.join(SCRIPTS)}")
+        # "Command not found": the bash wrappers fall back to their own implementation
+        return 127
+    return SCRIPTS[name](args)
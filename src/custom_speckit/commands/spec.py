@@ -0,0 +1,341 @@
+"""Query requirements and user stories in specs/spec.md, and its recorded history."""
+
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+import typer
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+from custom_speckit.utils.spec_index import (
+    SPEC_FILE,
+    entry_sort_key,
+    find_project_root,
+    load_index,
+    normalize_id,
+    read_entries,
+)
+
+console = Console()
+
+app = typer.Typer(
+    help="Look up requirements and user stories in .specify/specs/spec.md",
+    no_args_is_help=True,
+)
+
+PATH_OPTION = typer.Option(
+    Path.cwd(),
+    "--path",
+    "-p",
+    help="Project directory (defaults to current directory)",
+)
+JSON_OPTION = typer.Option(False, "--json", help="Output in JSON format")
+
+
+def _load(path: Path):
+    project_root = find_project_root(path.resolve())
+    if project_root is None:
+        console.print("[red]✗ No .specify/specs/spec.md found.[/red]")
+        raise typer.Exit(1)
+    return load_index(project_root)
+
+
+def _matches_kind(entry_id: str, entry: Dict, kind: Optional[str]) -> bool:
+    """Match a kind (story, item) or an ID prefix (FR, SC, ...)."""
+    if not kind:
+        return True
+    return entry["kind"] == kind.lower() or entry_id.startswith(f"{kind.upper()}-")
+
+
+def _print_json(data) -> None:
+    print(json.dumps(data, ensure_ascii=False, indent=2))
+
+
+@app.command()
+def get(
+    ids: List[str] = typer.Argument(..., help="IDs such as FR-001, SC-002 or 'User Story 3' (us3)"),
+    refs: bool = typer.Option(False, "--refs", help="Also print the entries these IDs reference"),
+    path: Path = PATH_OPTION,
+    json_output: bool = JSON_OPTION,
+):
+    """Print the text of one or more entries, reading only their byte ranges."""
+    entries, spec_path = _load(path)
+
+    wanted = list(dict.fromkeys(normalize_id(entry_id) for entry_id in ids))
+    missing = [entry_id for entry_id in wanted if entry_id not in entries]
+    if refs:
+        for entry_id in list(wanted):
+            if entry_id in entries:
+                wanted.extend(ref for ref in entries[entry_id]["refs"] if ref in entries and ref not in wanted)
+    found = [entry_id for entry_id in wanted if entry_id in entries]
+
+    results = []
+    for entry_id, (entry, text) in zip(found, read_entries(spec_path, [entries[i] for i in found])):
+        results.append({"id": entry_id, **entry, "text": text})
+
+    if json_output:
+        _print_json({"entries": results, "missing": missing})
+    else:
+        for result in results:
+            print(result["text"].rstrip("\n"))
+            print()
+        for entry_id in missing:
+            console.print(f"[red]✗ {entry_id} not found[/red]")
+    if missing:
+        raise typer.Exit(1)
+
+
+@app.command(name="list")
+def list_entries(
+    kind: Optional[str] = typer.Option(
+        None,
+        "--kind",
+        "-k",
+        help="Filter by kind (story, item) or ID prefix (FR, SC, ...)",
+    ),
+    path: Path = PATH_OPTION,
+    json_output: bool = JSON_OPTION,
+):
+    """List indexed entries with their titles and cross-references."""
+    entries, _ = _load(path)
+
+    selected = sorted((i for i, e in entries.items() if _matches_kind(i, e, kind)), key=entry_sort_key)
+
+    if json_output:
+        _print_json([{"id": entry_id, **entries[entry_id]} for entry_id in selected])
+        return
+
+    table = Table(title=f"Spec entries ({len(selected)})")
+    table.add_column("ID", style="cyan", no_wrap=True)
+    table.add_column("Title")
+    table.add_column("Line", justify="right")
+    table.add_column("Refs", style="dim")
+    for entry_id in selected:
+        entry = entries[entry_id]
+        table.add_row(entry_id, escape(entry["title"]), str(entry["line"]), ", ".join(entry["refs"]))
+    console.print(table)
+
+
+@app.command()
+def grep(
+    pattern: str = typer.Argument(..., help="Regular expression to search for"),
+    ignore_case: bool = typer.Option(False, "--ignore-case", "-i", help="Case-insensitive match"),
+    kind: Optional[str] = typer.Option(None, "--kind", "-k", help="Only search entries of this kind or ID prefix"),
+    ids_only: bool = typer.Option(False, "--ids-only", "-l", help="Print only the matching IDs"),
+    path: Path = PATH_OPTION,
+    json_output: bool = JSON_OPTION,
+):
+    """Search entry text and report matches by ID."""
+    entries, spec_path = _load(path)
+    try:
+        regex = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+    except re.error as e:
+        console.print(f"[red]✗ Invalid pattern: {e}[/red]")
+        raise typer.Exit(2)
+
+    selected = [
+        entry_id for entry_id in sorted(entries, key=entry_sort_key)
+        if _matches_kind(entry_id, entries[entry_id], kind)
+    ]
+
+    results = []
+    for entry_id, (entry, text) in zip(selected, read_entries(spec_path, [entries[i] for i in selected])):
+        lines = [
+            (entry["line"] + offset, line)
+            for offset, line in enumerate(text.splitlines())
+            if regex.search(line)
+        ]
+        if lines:
+            results.append({"id": entry_id, "matches": [{"line": n, "text": line} for n, line in lines]})
+
+    if json_output:
+        _print_json(results)
+    else:
+        for result in results:
+            if ids_only:
+                print(result["id"])
+                continue
+            for match in result["matches"]:
+                print(f"{result['id']}:{match['line']}: {match['text']}")
+    if not results:
+        raise typer.Exit(1)
+
+
+@app.command()
+def diff(
+    delta: Optional[Path] = typer.Option(
+        None,
+        "--delta",
+        "-d",
+        help="delta-spec.md to compare as it would merge (defaults to the current branch's)",
+    ),
+    against: Optional[Path] = typer.Option(None, "--against", "-a", help="Another version of spec.md"),
+    no_text: bool = typer.Option(False, "--no-text", help="List changed sections without their text"),
+    path: Path = PATH_OPTION,
+    json_output: bool = JSON_OPTION,
+):
+    """Show the spec sections a delta (or another spec version) adds, changes or removes."""
+    from custom_speckit.utils.spec_diff import SECTIONS_FILE, diff_spec, summarize
+    from custom_speckit.utils.workspace import get_feature_paths
+
+    project_root = find_project_root(path.resolve())
+    if project_root is None:
+        console.print("[red]✗ No .specify/specs/spec.md found.[/red]")
+        raise typer.Exit(1)
+    if against is None and delta is None:
+        branch = get_feature_paths(project_root).current_branch
+        delta = project_root / ".specify" / ".deltas" / branch / "delta-spec.md"
+    target = against or delta
+    if not target.is_file():
+        console.print(f"[red]✗ Not found: {target}[/red]")
+        raise typer.Exit(1)
+
+    changes, conflicts = diff_spec(
+        project_root / SPEC_FILE,
+        project_root / SECTIONS_FILE,
+        delta_path=None if against else delta,
+        against=against,
+        include_text=not no_text,
+    )
+
+    if json_output:
+        _print_json({"summary": summarize(changes), "changes": changes, "conflicts": conflicts})
+        return
+
+    styles = {"added": "green", "changed": "yellow", "removed": "red"}
+    for change in changes:
+        style = styles[change["change"]]
+        line = change["new_line"] or change["old_line"]
+        console.print(f"[{style}]{change['change'].upper()}[/{style}] [cyan]{escape(change['anchor'])}[/cyan] (line {line})")
+        if not no_text:
+            if "old_text" in change:
+                for text_line in change["old_text"].rstrip("\n").splitlines():
+                    console.print(f"[red]- {escape(text_line)}[/red]", highlight=False)
+            if "new_text" in change:
+                for text_line in change["new_text"].rstrip("\n").splitlines():
+                    console.print(f"[green]+ {escape(text_line)}[/green]", highlight=False)
+            print()
+    for conflict in conflicts:
+        console.print(f"[red]✗ {conflict['id']}: {conflict['reason']}[/red]")
+    summary = summarize(changes)
+    console.print(f"{summary['added']} added, {summary['changed']} changed, {summary['removed']} removed")
+
+
+def _history_root(path: Path) -> Path:
+    from custom_speckit.utils.workspace import find_specify_root
+
+    project_root = find_specify_root(path.resolve())
+    if project_root is None:
+        console.print("[red]✗ No .specify/ directory found.[/red]")
+        raise typer.Exit(1)
+    return project_root
+
+
+def _resolve(project_root: Path, rev: str) -> Dict:
+    from custom_speckit.utils.spec_history import load_history, resolve_revision
+
+    try:
+        return resolve_revision(load_history(project_root), rev)
+    except KeyError as e:
+        console.print(f"[red]✗ {e.args[0]}[/red]")
+        raise typer.Exit(1)
+
+
+@app.command()
+def history(
+    import_backups: bool = typer.Option(
+        False,
+        "--import-backups",
+        help="Record the full copies in .specify/specs/.backups/ (oldest first) and delete them; "
+        "best run once, before the first recorded merge",
+    ),
+    path: Path = PATH_OPTION,
+    json_output: bool = JSON_OPTION,
+):
+    """List recorded spec revisions (newest first).
+
+    merge-delta-spec --apply records the spec before and after each merge.
+    Revisions are stored as compressed line deltas with a full snapshot
+    every few revisions, so showing or restoring any of them stays fast.
+    """
+    from custom_speckit.utils.spec_history import import_legacy_backups, load_history
+
+    project_root = _history_root(path)
+    if import_backups:
+        imported = import_legacy_backups(project_root, remove=True)
+        console.print(f"[green]✓[/green] Imported {len(imported)} backups")
+
+    revisions = load_history(project_root)
+    if json_output:
+        _print_json(list(reversed(revisions)))
+        return
+    if not revisions:
+        console.print("[yellow]No spec history recorded yet.[/yellow]")
+        return
+
+    table = Table(title=f"Spec history ({len(revisions)} revisions)")
+    table.add_column("Rev", style="cyan", justify="right")
+    table.add_column("Created")
+    table.add_column("Branch")
+    table.add_column("Note")
+    table.add_column("Size", justify="right")
+    table.add_column("Stored", justify="right", style="dim")
+    for entry in reversed(revisions):
+        table.add_row(
+            str(entry["rev"]),
+            entry["created"],
+            escape(entry["branch"]),
+            escape(entry["note"]),
+            f"{entry['size']:,}",
+            f"{entry['stored']:,}" if entry["stored"] else "=",
+        )
+    console.print(table)
+    stored = sum(entry["stored"] for entry in revisions)
+    console.print(f"[dim]{stored:,} bytes stored for {sum(e['size'] for e in revisions):,} bytes of revisions[/dim]")
+
+
+@app.command()
+def show(
+    rev: str = typer.Argument(..., help="Revision number, 'latest', 'latest~N' or a branch name"),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Write to this file instead of stdout"),
+    path: Path = PATH_OPTION,
+):
+    """Print a recorded revision of spec.md."""
+    from custom_speckit.utils.spec_history import read_revision
+
+    project_root = _history_root(path)
+    entry = _resolve(project_root, rev)
+    data = read_revision(project_root, entry["rev"])
+    if output is not None:
+        output.write_bytes(data)
+        console.print(f"[green]✓[/green] Wrote revision {entry['rev']} to {output}")
+    else:
+        sys.stdout.buffer.write(data)
+
+
+@app.command()
+def restore(
+    rev: str = typer.Argument(..., help="Revision number, 'latest', 'latest~N' or a branch name"),
+    path: Path = PATH_OPTION,
+):
+    """Replace spec.md with a recorded revision.
+
+    The current spec is recorded first (if it is not already), so a restore
+    can itself be undone.
+    """
+    from custom_speckit.utils.file_manager import write_if_changed
+    from custom_speckit.utils.spec_history import read_revision, record_revision
+
+    project_root = _history_root(path)
+    entry = _resolve(project_root, rev)
+    data = read_revision(project_root, entry["rev"])
+
+    spec_path = project_root / SPEC_FILE
+    if spec_path.is_file():
+        record_revision(project_root, spec_path.read_bytes(), note="before restore")
+    write_if_changed(spec_path, data.decode("utf-8"))
+    record_revision(project_root, data, branch=entry["branch"], note=f"restored {entry['rev']}")
+    console.print(f"[green]✓[/green] Restored spec.md to revision {entry['rev']} ({entry['created']})")
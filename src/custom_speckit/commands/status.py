@@ -0,0 +1,101 @@
+"""Show the state of every feature in the project at once."""
+
+import json
+from pathlib import Path
+import typer
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+from custom_speckit.utils.feature_status import DEFAULT_JOBS, collect_status
+from custom_speckit.utils.workspace import get_feature_paths
+
+console = Console()
+
+# One-letter column per feature_status.ARTIFACTS entry, in the same order
+ARTIFACT_LETTERS = {
+    "spec.md": "S",
+    "plan.md": "P",
+    "research.md": "R",
+    "data-model.md": "D",
+    "contracts": "C",
+    "quickstart.md": "Q",
+    "tasks.md": "T",
+}
+
+
+def _progress(counts: dict) -> str:
+    done, total = counts["done"], counts["total"]
+    if not total:
+        return "[dim]-[/dim]"
+    color = "green" if done == total else "yellow" if done else "red"
+    return f"[{color}]{done}/{total}[/{color}] [dim]{100 * done // total}%[/dim]"
+
+
+def status(
+    path: Path = typer.Argument(
+        Path.cwd(),
+        help="Project directory (defaults to current directory)",
+    ),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+    jobs: int = typer.Option(
+        DEFAULT_JOBS,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of features to scan concurrently",
+    ),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Rescan every feature and leave the cache untouched"),
+):
+    """Show artifacts, task and checklist progress and pending deltas of every feature.
+
+    Scans all NNN-* directories under specs/ without checking out their
+    branches. Features whose files did not change since the last run are
+    answered from .specify/.cache/status.json.
+    """
+    paths = get_feature_paths(path)
+    report = collect_status(paths.repo_root, jobs, use_cache=not no_cache)
+
+    if json_output:
+        print(json.dumps({"current_feature": paths.feature_dir.name, **report}, ensure_ascii=False, indent=2))
+        return
+
+    features = report["features"]
+    if not features:
+        console.print(f"[yellow]![/yellow] No NNN-* feature directories in {paths.repo_root / 'specs'}")
+        raise typer.Exit(0)
+
+    table = Table(show_header=True)
+    table.add_column("Feature", style="cyan")
+    table.add_column("Docs")
+    table.add_column("Tasks", justify="right")
+    table.add_column("Checklists", justify="right")
+    table.add_column("Delta")
+    for feature in features:
+        name = escape(feature["name"])
+        if feature["name"] == paths.feature_dir.name:
+            name = f"[bold]{name}[/bold] ←"
+        artifacts = " ".join(
+            letter if artifact in feature["artifacts"] else "[dim]·[/dim]"
+            for artifact, letter in ARTIFACT_LETTERS.items()
+        )
+        table.add_row(
+            name,
+            artifacts,
+            _progress(feature["tasks"]),
+            _progress(feature["checklists"]),
+            "[magenta]pending[/magenta]" if feature["deltas"] else "",
+        )
+    console.print(table)
+    console.print("[dim]Docs: " + ", ".join(f"{letter} {name}" for name, letter in ARTIFACT_LETTERS.items()) + "[/dim]")
+
+    complete = sum(1 for f in features if f["tasks"]["total"] and f["tasks"]["done"] == f["tasks"]["total"])
+    with_deltas = sum(1 for f in features if f["deltas"])
+    console.print(
+        f"[cyan]→[/cyan] {len(features)} features, {complete} with all tasks done, "
+        f"{with_deltas} with pending deltas [dim]({report['cache_hits']} from cache)[/dim]"
+    )
+    for prefix, names in report["duplicate_prefixes"].items():
+        console.print(f"[yellow]![/yellow] Several directories share prefix {prefix}: {', '.join(names)}")
+    for delta in report["unmatched_deltas"]:
+        console.print(f"[yellow]![/yellow] Pending delta with no matching feature: {delta}")
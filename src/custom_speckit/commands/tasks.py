@@ -0,0 +1,90 @@
+"""Inspect and schedule the tasks in a feature's tasks.md."""
+
+import json
+from pathlib import Path
+from typing import Optional
+import typer
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+from custom_speckit.utils.task_graph import plan_tasks
+from custom_speckit.utils.task_list import parse_tasks
+from custom_speckit.utils.workspace import get_feature_paths
+
+console = Console()
+
+app = typer.Typer(
+    help="Work with the current feature's tasks.md",
+    no_args_is_help=True,
+)
+
+
+@app.command()
+def plan(
+    path: Path = typer.Option(
+        Path.cwd(),
+        "--path",
+        "-p",
+        help="Project directory (defaults to current directory)",
+    ),
+    tasks_file: Optional[Path] = typer.Option(
+        None,
+        "--file",
+        "-f",
+        help="tasks.md to schedule (defaults to the current feature's)",
+    ),
+    include_done: bool = typer.Option(
+        False,
+        "--include-done",
+        help="Schedule completed tasks too",
+    ),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+):
+    """Build the task dependency graph and print parallel execution waves.
+
+    Dependencies come from phase order, [P] markers and "depends on T012"
+    notes. Tasks in the same wave can run together; [P] tasks that touch
+    the same file are reported as conflicts and kept apart. Exits with
+    status 1 on a dependency cycle or unknown task reference.
+    """
+    tasks_path = tasks_file or get_feature_paths(path).tasks
+    if not tasks_path.is_file():
+        console.print(f"[red]✗ tasks.md not found: {tasks_path}[/red]")
+        raise typer.Exit(1)
+
+    result = plan_tasks(parse_tasks(tasks_path.read_text(encoding="utf-8")), include_done=include_done)
+    report = {"tasks_file": str(tasks_path), **result.to_dict()}
+
+    if json_output:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        summary = report["summary"]
+        console.print(
+            f"[cyan]→[/cyan] {summary['pending']} of {summary['tasks']} tasks pending, "
+            f"{summary['waves']} waves, up to {summary['max_parallel']} in parallel"
+        )
+        if result.waves:
+            table = Table(title="Execution waves")
+            table.add_column("Wave", justify="right", style="cyan")
+            table.add_column("Tasks")
+            for number, wave in enumerate(result.waves, start=1):
+                table.add_row(str(number), ", ".join(wave))
+            console.print(table)
+        if result.critical_path:
+            console.print(f"Critical path ({len(result.critical_path)}): {' → '.join(result.critical_path)}")
+        for conflict in result.conflicts:
+            console.print(
+                f"[yellow]Conflict: {' and '.join(conflict['tasks'])} are [P] but both touch "
+                f"{escape(', '.join(conflict['files']))}; running them in order[/yellow]"
+            )
+        for error in result.errors:
+            if error["type"] == "cycle":
+                console.print(f"[red]✗ Dependency cycle: {' → '.join(error['tasks'])}[/red]")
+            elif error["type"] == "unknown-dependency":
+                console.print(f"[red]✗ {error['task']} depends on unknown task {error['depends_on']}[/red]")
+            else:
+                console.print(f"[red]✗ Duplicate task ID {error['task']} (lines {error['lines'][0]}, {error['lines'][1]})[/red]")
+
+    if result.errors:
+        raise typer.Exit(1)
@@ -1,27 +1,67 @@
 """Update Custom Speckit in a project."""
 
+import tempfile
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
 from custom_speckit import __version__
+from custom_speckit.utils import tracing
 from custom_speckit.utils.version import (
     is_custom_speckit_installed,
     get_installed_version,
     get_installed_files,
-    save_version_and_files,
+    get_installed_entries,
 )
 from custom_speckit.utils.file_manager import (
-    sync_directory,
-    backup_directory,
+    DEFAULT_JOBS,
     ensure_gitignore,
+    make_scripts_executable,
 )
+from custom_speckit.utils.backup_store import (
+    DEFAULT_KEEP_BACKUPS,
+    create_snapshot,
+    prune_snapshots,
+)
+from custom_speckit.utils.bundle import (
+    Bundle,
+    BundleError,
+    base_mismatches,
+    extract_objects,
+    is_applied,
+    plan_bundle,
+    read_bundle,
+)
+from custom_speckit.utils.sync_plan import (
+    FileChange,
+    plan_update,
+)
+from custom_speckit.utils.template_index import load_index
+from custom_speckit.utils.transaction import apply_update, recover
 
 console = Console()
 
 
+def _print_changes(
+    project_root: Path,
+    label: str,
+    color: str,
+    marker: str,
+    changes: Tuple[FileChange, ...],
+) -> None:
+    """Print the first few entries of one change category."""
+    if not changes:
+        return
+    console.print(f"\n[{color}]{marker} {label} ({len(changes)}):[/{color}]")
+    for change in changes[:5]:
+        console.print(f"  {marker} {change.dst.relative_to(project_root)}")
+    if len(changes) > 5:
+        console.print(f"  ... and {len(changes) - 5} more")
+
+
 def update(
     path: Path = typer.Argument(
         Path.cwd(),
@@ -37,6 +77,34 @@ def update(
         "--skip-backup",
         help="Skip creating backups (not recommended)",
     ),
+    keep_backups: int = typer.Option(
+        DEFAULT_KEEP_BACKUPS,
+        "--keep-backups",
+        min=1,
+        help="Number of backup snapshots to retain",
+    ),
+    jobs: int = typer.Option(
+        DEFAULT_JOBS,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of files to copy concurrently",
+    ),
+    timings: bool = typer.Option(
+        False,
+        "--timings",
+        help="Print per-phase durations, file counts and bytes read/written",
+    ),
+    trace: Optional[Path] = typer.Option(
+        None,
+        "--trace",
+        help="Write a Chrome trace (chrome://tracing, Perfetto) of the run to this file",
+    ),
+    from_bundle: Optional[Path] = typer.Option(
+        None,
+        "--from-bundle",
+        help="Apply a template bundle (see 'custom-speckit bundle create') instead of this installation's templates",
+    ),
 ):
     """Update Custom Speckit to the latest version.
     
@@ -44,15 +112,64 @@ def update(
     - Update .specify/scripts/, .specify/templates/
     - Update .cursor/commands/, .cursor/rules/
     - Preserve user files (.specify/memory/, .specify/specs/, .specify/features/)
-    - Create backups before updating (unless --skip-backup)
+    - Back up files it overwrites or removes (unless --skip-backup)
+    - Apply all changes at once from a staging area; an interrupted update
+      is completed (or discarded) on the next run
     - Leave other project files untouched
+    
+    With --from-bundle, only the files in the bundle are written, and only if
+    the project's manifest records the bundle's base version.
     """
     project_root = path.resolve()
+    with tracing.session(trace, timings, console, "update", {"command": "update", "version": __version__}):
+        if from_bundle is None:
+            _update(project_root, dry_run, skip_backup, keep_backups, jobs)
+        else:
+            with tempfile.TemporaryDirectory(prefix="custom-speckit-bundle-") as objects_dir:
+                _update(project_root, dry_run, skip_backup, keep_backups, jobs, from_bundle, Path(objects_dir))
+
+
+def _load_bundle(bundle_path: Path, objects_dir: Path, previous_entries: Dict[str, Dict]) -> Bundle:
+    """Read a bundle and check it applies to the project's recorded install."""
+    try:
+        bundle = read_bundle(bundle_path)
+        if is_applied(bundle, previous_entries):
+            console.print(f"[green]✓ Bundle already applied (version {bundle.to_version}).[/green]")
+            raise typer.Exit(0)
+        mismatches = base_mismatches(bundle, previous_entries)
+        if mismatches:
+            console.print(
+                f"[red]✗ This bundle upgrades {bundle.from_version or 'unknown'}; "
+                f"{len(mismatches)} files do not match that version in the manifest:[/red]"
+            )
+            for relative in mismatches[:5]:
+                console.print(f"  {relative}")
+            if len(mismatches) > 5:
+                console.print(f"  ... and {len(mismatches) - 5} more")
+            console.print("[dim]Build a bundle from this project's .specify/.manifest.json, or run a full update.[/dim]")
+            raise typer.Exit(1)
+        extract_objects(bundle, objects_dir)
+    except BundleError as e:
+        console.print(f"[red]✗ {e}[/red]")
+        raise typer.Exit(1)
+    return bundle
+
+
+def _update(
+    project_root: Path,
+    dry_run: bool,
+    skip_backup: bool,
+    keep_backups: int,
+    jobs: int,
+    bundle_path: Optional[Path] = None,
+    objects_dir: Optional[Path] = None,
+) -> None:
+    """Run the update; see update() for the options."""
     
     console.print(Panel.fit(
         f"[bold cyan]Custom Speckit Update[/bold cyan]\n"
         f"Project: [yellow]{project_root}[/yellow]\n"
-        f"Target Version: [green]{__version__}[/green]",
+        + (f"Bundle: [yellow]{bundle_path}[/yellow]" if bundle_path else f"Target Version: [green]{__version__}[/green]"),
         border_style="cyan"
     ))
     
@@ -62,103 +179,105 @@ def update(
         console.print("[dim]Run 'custom-speckit init' first.[/dim]")
         raise typer.Exit(1)
     
+    # Finish (or discard) an update that was interrupted
+    if not dry_run:
+        recovered = recover(project_root)
+        if recovered:
+            console.print(f"[yellow]![/yellow] {recovered}")
+    
     # Get current version
     current_version = get_installed_version(project_root)
     console.print(f"Current version: [yellow]{current_version or 'unknown'}[/yellow]")
     
-    if current_version == __version__ and not dry_run:
+    if current_version == __version__ and not dry_run and bundle_path is None:
         console.print("[green]✓ Already on the latest version![/green]")
         console.print("[dim]Files will be refreshed to ensure consistency.[/dim]")
     
     # Get template directory
     template_dir = Path(__file__).parent.parent / "templates"
     
-    if not template_dir.exists():
+    if not template_dir.exists() and bundle_path is None:
         console.print("[red]✗ Template directory not found. Installation may be corrupted.[/red]")
         raise typer.Exit(1)
     
-    # Get previous installed files
-    previous_files = get_installed_files(project_root)
+    # Get previous installed files and their recorded hashes
+    with tracing.span("read manifest"):
+        previous_files = get_installed_files(project_root)
+        previous_entries = get_installed_entries(project_root)
     
-    # Analyze changes
+    # Analyze changes (read-only: the template index, stats of the project)
     console.print("\n[cyan]→[/cyan] Analyzing changes...")
     
-    specify_src = template_dir / ".specify"
-    specify_dst = project_root / ".specify"
-    cursor_src = template_dir / ".cursor"
-    cursor_dst = project_root / ".cursor"
-    
-    # Get previous files for each directory
-    previous_specify = {f.replace(".specify/", "") for f in previous_files if f.startswith(".specify/")}
-    previous_cursor = {f.replace(".cursor/", "") for f in previous_files if f.startswith(".cursor/")}
+    if bundle_path is not None:
+        with tracing.span("read bundle"):
+            bundle = _load_bundle(bundle_path, objects_dir, previous_entries)
+        target_version = bundle.to_version
+        template_entries = bundle.target
+        console.print(f"Bundle: [yellow]{bundle.from_version or 'unknown'}[/yellow] → [green]{target_version}[/green]")
+        with tracing.span("plan"):
+            plan = plan_bundle(project_root, bundle, objects_dir, previous_entries)
+    else:
+        target_version = __version__
+        # None in a source checkout: the template is walked instead
+        template_entries = load_index(template_dir)
+        with tracing.span("plan"):
+            plan = plan_update(template_dir, project_root, previous_files, previous_entries, template_entries)
     
     # Dry run mode - just show what would change
     if dry_run:
-        spec_added, spec_updated, spec_removed = sync_directory(
-            specify_src, specify_dst, previous_specify
-        ) if specify_src.exists() else ([], [], [])
-        
-        cursor_added, cursor_updated, cursor_removed = sync_directory(
-            cursor_src, cursor_dst, previous_cursor
-        ) if cursor_src.exists() else ([], [], [])
-        
-        total_changes = len(spec_added) + len(spec_updated) + len(spec_removed) + \
-                       len(cursor_added) + len(cursor_updated) + len(cursor_removed)
-        
-        if total_changes == 0:
+        if plan.total_changes == 0:
             console.print("[green]✓ No changes detected. Everything is up to date![/green]")
             raise typer.Exit(0)
         
         console.print("\n[bold]Changes preview:[/bold]")
+        _print_changes(project_root, "Added", "green", "+", plan.added)
+        _print_changes(project_root, "Updated", "yellow", "~", plan.updated)
+        _print_changes(project_root, "Removed", "red", "-", plan.removed)
+        _print_changes(project_root, "Conflicts (modified locally)", "magenta", "!", plan.conflicts)
+        _print_changes(project_root, "Kept (modified locally, user-owned)", "cyan", "=", plan.kept)
         
-        if spec_added or cursor_added:
-            console.print(f"\n[green]+ Added ({len(spec_added) + len(cursor_added)}):[/green]")
-            for f in (spec_added + cursor_added)[:5]:
-                console.print(f"  + {f.relative_to(project_root)}")
-            if len(spec_added) + len(cursor_added) > 5:
-                console.print(f"  ... and {len(spec_added) + len(cursor_added) - 5} more")
-        
-        if spec_updated or cursor_updated:
-            console.print(f"\n[yellow]~ Updated ({len(spec_updated) + len(cursor_updated)}):[/yellow]")
-            for f in (spec_updated + cursor_updated)[:5]:
-                console.print(f"  ~ {f.relative_to(project_root)}")
-            if len(spec_updated) + len(cursor_updated) > 5:
-                console.print(f"  ... and {len(spec_updated) + len(cursor_updated) - 5} more")
-        
-        if spec_removed or cursor_removed:
-            console.print(f"\n[red]- Removed ({len(spec_removed) + len(cursor_removed)}):[/red]")
-            for f in (spec_removed + cursor_removed)[:5]:
-                console.print(f"  - {f.relative_to(project_root)}")
-            if len(spec_removed) + len(cursor_removed) > 5:
-                console.print(f"  ... and {len(spec_removed) + len(cursor_removed) - 5} more")
-        
+        console.print(
+            f"\n[dim]{len(plan.unchanged)} files unchanged. "
+            f"{tracing.format_bytes(plan.bytes_to_write)} to write, "
+            f"{tracing.format_bytes(plan.bytes_to_remove)} to remove.[/dim]"
+        )
         console.print("\n[dim]Note: Template files will be synced. User files (not in template) will be preserved.[/dim]")
         console.print("\n[yellow]--dry-run enabled. No changes made.[/yellow]")
         raise typer.Exit(0)
     
-    # Create backups
-    if not skip_backup:
-        console.print("\n[cyan]→[/cyan] Creating backups...")
-        backup_specify = backup_directory(specify_dst)
-        backup_cursor = backup_directory(cursor_dst)
-        console.print("[green]✓[/green] Backups created")
-        console.print(f"  • {backup_specify.relative_to(project_root)}")
-        console.print(f"  • {backup_cursor.relative_to(project_root)}")
+    if plan.total_changes == 0 and current_version == target_version:
+        console.print("[green]✓ No changes detected. Everything is up to date![/green]")
+        raise typer.Exit(0)
     
-    # Sync files
+    # Back up only what this update overwrites or removes (a version-only bump
+    # has nothing worth a snapshot, and would push real ones out of retention)
+    if not skip_backup and plan.total_changes:
+        console.print("\n[cyan]→[/cyan] Creating backup snapshot...")
+        with tracing.span("backup"):
+            snapshot_id, stored = create_snapshot(project_root, plan, current_version, target_version)
+            pruned = prune_snapshots(project_root, keep_backups)
+        console.print(f"[green]✓[/green] Backup snapshot {snapshot_id} ({stored} files)")
+        if pruned:
+            console.print(f"[dim]  Pruned {len(pruned)} old snapshots (keeping {keep_backups})[/dim]")
+        console.print(f"[dim]  Roll back with: custom-speckit restore --snapshot {snapshot_id}[/dim]")
+    
+    # Sync files: stage everything (project untouched), then commit with renames
     console.print("\n[cyan]→[/cyan] Syncing files...")
     
-    spec_added, spec_updated, spec_removed = sync_directory(
-        specify_src, specify_dst, previous_specify
-    )
+    if plan.conflicts:
+        console.print(
+            f"[yellow]![/yellow] Overwriting {len(plan.conflicts)} locally modified files"
+        )
+    if plan.kept:
+        console.print(
+            f"[cyan]=[/cyan] Keeping {len(plan.kept)} locally modified files in user-owned directories"
+        )
     
-    cursor_added, cursor_updated, cursor_removed = sync_directory(
-        cursor_src, cursor_dst, previous_cursor
-    )
+    added, updated, removed = apply_update(project_root, plan, target_version, previous_entries, template_entries, jobs)
     
-    total_added = len(spec_added) + len(cursor_added)
-    total_updated = len(spec_updated) + len(cursor_updated)
-    total_removed = len(spec_removed) + len(cursor_removed)
+    total_added = len(added)
+    total_updated = len(updated)
+    total_removed = len(removed)
     
     if total_added:
         console.print(f"[green]✓[/green] Added {total_added} files")
@@ -167,28 +286,20 @@ def update(
     if total_removed:
         console.print(f"[green]✓[/green] Removed {total_removed} files")
     
-    # Make scripts executable
+    # Staged scripts were made executable before the commit; fix up the rest
     console.print("[cyan]→[/cyan] Setting script permissions...")
     scripts_dir = project_root / ".specify" / "scripts" / "bash"
     if scripts_dir.exists():
-        for script in scripts_dir.glob("*.sh"):
-            script.chmod(0o755)
+        with tracing.span("chmod"):
+            make_scripts_executable(scripts_dir)
         console.print("[green]✓[/green] Made scripts executable")
     
-    # Get all current files for manifest
-    all_current_specify = list((project_root / ".specify").rglob("*"))
-    all_current_specify = [f for f in all_current_specify if f.is_file()]
-    
-    all_current_cursor = list((project_root / ".cursor").rglob("*"))
-    all_current_cursor = [f for f in all_current_cursor if f.is_file()]
-    
-    # Save version and file manifest
-    save_version_and_files(project_root, __version__, all_current_specify, all_current_cursor)
-    console.print(f"[green]✓[/green] Updated version to {__version__}")
+    console.print(f"[green]✓[/green] Updated version to {target_version}")
     
     # Update .gitignore
     console.print("[cyan]→[/cyan] Checking .gitignore...")
-    ensure_gitignore(project_root)
+    with tracing.span("gitignore"):
+        ensure_gitignore(project_root)
     console.print("[green]✓[/green] .gitignore is up to date")
     
     # Summary
@@ -197,7 +308,7 @@ def update(
     
     table = Table(show_header=False, box=None)
     table.add_row("[cyan]Previous version:[/cyan]", current_version or "unknown")
-    table.add_row("[cyan]Current version:[/cyan]", f"[green]{__version__}[/green]")
+    table.add_row("[cyan]Current version:[/cyan]", f"[green]{target_version}[/green]")
     if total_added:
         table.add_row("[cyan]Added:[/cyan]", f"{total_added} files")
     if total_updated:
@@ -0,0 +1,143 @@
+"""Run the workspace watch daemon that keeps speckit lookups warm."""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from custom_speckit.utils.watch import PROTOCOL_VERSION, request, socket_path
+
+console = Console()
+
+app = typer.Typer(
+    help="Keep the current branch, feature map, manifest and spec index in memory",
+    no_args_is_help=True,
+)
+
+PATH_OPTION = typer.Option(
+    Path.cwd(),
+    "--path",
+    "-p",
+    help="Project directory (defaults to current directory)",
+)
+
+LOG_FILE = ".specify/.cache/watch.log"
+
+
+def _ping(project_root: Path):
+    return request(socket_path(project_root), {"op": "ping", "version": PROTOCOL_VERSION})
+
+
+def _detach(log_path: Path) -> bool:
+    """Fork into the background; returns True in the daemon process."""
+    if os.fork():
+        return False
+    os.setsid()
+    if os.fork():
+        os._exit(0)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    log = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.dup2(log, 1)
+    os.dup2(log, 2)
+    return True
+
+
+@app.command()
+def start(
+    path: Path = PATH_OPTION,
+    foreground: bool = typer.Option(
+        False,
+        "--foreground",
+        help="Stay attached to the terminal instead of running in the background",
+    ),
+):
+    """Start watching a project.
+
+    While the daemon runs, `custom-speckit script ...` (and so the bash
+    scripts), `spec` lookups and update answer branch, feature directory,
+    manifest and spec index queries from memory. Without it they take the
+    usual cold path. Requires Linux (inotify).
+    """
+    from custom_speckit.utils.watch_server import WatchError, WatchServer, resolve_root
+
+    project_root, git_dir = resolve_root(path)
+    if _ping(project_root):
+        console.print(f"[yellow]![/yellow] Already watching {project_root}")
+        raise typer.Exit(0)
+
+    try:
+        server = WatchServer(project_root, git_dir)
+    except WatchError as e:
+        console.print(f"[red]✗ {e}[/red]")
+        raise typer.Exit(1)
+
+    if foreground:
+        console.print(f"[cyan]→[/cyan] Watching {project_root} (Ctrl+C to stop)")
+    elif not _detach(project_root / LOG_FILE):
+        # Parent: wait until the daemon answers
+        for _ in range(50):
+            status = _ping(project_root)
+            if status:
+                console.print(f"[green]✓[/green] Watching {project_root} (pid {status['pid']})")
+                console.print("[dim]  Stop with: custom-speckit watch stop[/dim]")
+                return
+            time.sleep(0.05)
+        console.print(f"[red]✗ The daemon did not start; see {project_root / LOG_FILE}[/red]")
+        raise typer.Exit(1)
+
+    try:
+        server.serve()
+    except WatchError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        raise typer.Exit(1)
+    if foreground:
+        console.print("[green]✓[/green] Stopped")
+    else:
+        os._exit(0)
+
+
+@app.command()
+def status(
+    path: Path = PATH_OPTION,
+    output_json: bool = typer.Option(False, "--json", help="Output in JSON format"),
+):
+    """Show whether a daemon is watching the project, and its cache statistics."""
+    from custom_speckit.utils.watch_server import resolve_root
+
+    project_root, _ = resolve_root(path)
+    info = _ping(project_root)
+    if output_json:
+        print(json.dumps(info or {"ok": False, "root": str(project_root)}, indent=2))
+        raise typer.Exit(0 if info else 1)
+    if not info:
+        console.print(f"[yellow]![/yellow] Not watching {project_root} (lookups take the cold path)")
+        raise typer.Exit(1)
+
+    table = Table(show_header=False, box=None)
+    table.add_row("[cyan]Project:[/cyan]", info["root"])
+    table.add_row("[cyan]PID:[/cyan]", str(info["pid"]))
+    table.add_row("[cyan]Since:[/cyan]", datetime.fromtimestamp(info["started"]).strftime("%Y-%m-%d %H:%M:%S"))
+    table.add_row("[cyan]Queries:[/cyan]", f"{info['queries']} ({info['hits']} cache hits, {info['rebuilds']} rebuilds)")
+    table.add_row("[cyan]Events:[/cyan]", str(info["events"]))
+    table.add_row("[cyan]Cached:[/cyan]", ", ".join(info["cached"]) or "-")
+    table.add_row("[cyan]Watching:[/cyan]", "\n".join(info["watching"]))
+    console.print(table)
+
+
+@app.command()
+def stop(path: Path = PATH_OPTION):
+    """Stop the daemon watching the project."""
+    from custom_speckit.utils.watch_server import resolve_root
+
+    project_root, _ = resolve_root(path)
+    if not request(socket_path(project_root), {"op": "stop", "version": PROTOCOL_VERSION}):
+        console.print(f"[yellow]![/yellow] Not watching {project_root}")
+        raise typer.Exit(1)
+    console.print(f"[green]✓[/green] Stopped watching {project_root}")
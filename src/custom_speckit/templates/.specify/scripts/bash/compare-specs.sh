@@ -3,6 +3,23 @@
 # Unset CDPATH to prevent issues with cd command when calculating script directory
 unset CDPATH
 
+# The in-process implementation (same options and output) runs when
+# SPECIFY_NATIVE=1 is set, and for the options only it provides
+# (--diff, --against). If the installed custom-speckit does not have
+# this script, the bash implementation below runs.
+use_native="${SPECIFY_NATIVE:-}"
+for arg in "$@"; do
+    case "$arg" in --diff|--against) use_native=1 ;; esac
+done
+if [[ -n "$use_native" ]] && command -v custom-speckit >/dev/null; then
+    status=0
+    custom-speckit script compare-specs "$@" || status=$?
+    # 127: this CLI has no such script; 2: it has no script command at all
+    if [[ $status -ne 127 && $status -ne 2 ]]; then
+        exit "$status"
+    fi
+fi
+
 # Compare current spec with new requirements to determine if delta is needed
 #
 # This script checks if an existing spec exists and provides information
@@ -12,6 +29,8 @@ unset CDPATH
 #
 # OPTIONS:
 #   --json              Output in JSON format
+#   --diff              Section diff against the delta (custom-speckit CLI only)
+#   --against PATH      Section diff against another spec (custom-speckit CLI only)
 #   --help, -h          Show help message
 #
 # OUTPUTS:
@@ -28,6 +47,10 @@ for arg in "$@"; do
         --json)
             JSON_MODE=true
             ;;
+        --diff|--against|--no-text)
+            echo "ERROR: $arg requires the custom-speckit CLI (the section diff is not available in bash)." >&2
+            exit 1
+            ;;
         --help|-h)
             cat << 'EOF'
 Usage: compare-specs.sh [OPTIONS]
@@ -51,6 +74,11 @@ OUTPUT:
   - DELTA_DIR: absolute path to .deltas/{branch}/ directory
   - CURRENT_BRANCH: current git branch or feature name
 
+NOTE:
+  With the custom-speckit CLI installed, --diff (against the branch's
+  delta-spec.md) and --against PATH also report the added, changed and
+  removed spec sections.
+
 EOF
             exit 0
             ;;
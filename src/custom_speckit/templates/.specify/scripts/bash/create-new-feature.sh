@@ -6,6 +6,7 @@ set -e
 unset CDPATH
 
 JSON_MODE=false
+REFRESH_REMOTE=false
 SHORT_NAME=""
 ARGS=()
 i=1
@@ -15,6 +16,9 @@ while [ $i -le $# ]; do
         --json) 
             JSON_MODE=true 
             ;;
+        --refresh-remote)
+            REFRESH_REMOTE=true
+            ;;
         --short-name)
             if [ $((i + 1)) -gt $# ]; then
                 echo 'Error: --short-name requires a value' >&2
@@ -30,11 +34,12 @@ while [ $i -le $# ]; do
             SHORT_NAME="$next_arg"
             ;;
         --help|-h) 
-            echo "Usage: $0 [--json] [--short-name <name>] <feature_description>"
+            echo "Usage: $0 [--json] [--short-name <name>] [--refresh-remote] <feature_description>"
             echo ""
             echo "Options:"
             echo "  --json              Output in JSON format"
             echo "  --short-name <name> Provide a custom short name (2-4 words) for the branch"
+            echo "  --refresh-remote    Fetch all remotes before numbering (otherwise works offline)"
             echo "  --help, -h          Show this help message"
             echo ""
             echo "Examples:"
@@ -51,7 +56,7 @@ done
 
 FEATURE_DESCRIPTION="${ARGS[*]}"
 if [ -z "$FEATURE_DESCRIPTION" ]; then
-    echo "Usage: $0 [--json] [--short-name <name>] <feature_description>" >&2
+    echo "Usage: $0 [--json] [--short-name <name>] [--refresh-remote] <feature_description>" >&2
     exit 1
 fi
 
@@ -68,38 +73,82 @@ find_repo_root() {
     return 1
 }
 
-# Function to check existing branches (local, remote, and specs) and return next available number
+# Feature numbers are allocated from a local index (.specify/.feature-index,
+# one feature name per line) plus local and remote-tracking refs and the specs
+# directory, so numbering never touches the network. Pass --refresh-remote to
+# fetch remotes first. The index also remembers numbers whose branches were
+# since deleted, so they are not handed out again.
+
+# Serialize allocations: mkdir is atomic, so only one process holds the lock
+acquire_index_lock() {
+    local attempts=0
+    until mkdir "$FEATURE_INDEX_LOCK" 2>/dev/null; do
+        attempts=$((attempts + 1))
+        if [ $attempts -ge 200 ]; then
+            echo "Error: Timed out waiting for $FEATURE_INDEX_LOCK" >&2
+            echo "Remove it if no other create-new-feature.sh is running." >&2
+            exit 1
+        fi
+        sleep 0.05
+    done
+    trap 'rmdir "$FEATURE_INDEX_LOCK" 2>/dev/null' EXIT
+}
+
+release_index_lock() {
+    rmdir "$FEATURE_INDEX_LOCK" 2>/dev/null || true
+    trap - EXIT
+}
+
+# List every known feature name: index, branches (loose and packed refs,
+# local and remote-tracking) and spec directories
+list_feature_names() {
+    local specs_dir="$1"
+
+    if [ -f "$FEATURE_INDEX" ]; then
+        cat "$FEATURE_INDEX"
+    fi
+
+    if [ "$HAS_GIT" = true ]; then
+        local ref
+        git for-each-ref --format='%(refname)' refs/heads refs/remotes 2>/dev/null | while IFS= read -r ref; do
+            case "$ref" in
+                refs/heads/*) echo "${ref#refs/heads/}" ;;
+                refs/remotes/*/*) ref="${ref#refs/remotes/}"; echo "${ref#*/}" ;;
+            esac
+        done
+    fi
+
+    local dir
+    for dir in "$specs_dir"/[0-9]*-*; do
+        [ -d "$dir" ] && echo "${dir##*/}"
+    done
+    return 0
+}
+
+# Return the next available number for a short name (call with the lock held)
 check_existing_branches() {
     local short_name="$1"
     local specs_dir="$2"
-    
-    # Fetch all remotes to get latest branch info (suppress errors if no remotes)
-    git fetch --all --prune 2>/dev/null || true
-    
-    # Find all branches matching the pattern using git ls-remote (more reliable)
-    local remote_branches=$(git ls-remote --heads origin 2>/dev/null | grep -E "refs/heads/[0-9]+-${short_name}$" | sed 's/.*\/\([0-9]*\)-.*/\1/' | sort -n)
-    
-    # Also check local branches
-    local local_branches=$(git branch 2>/dev/null | grep -E "^[* ]*[0-9]+-${short_name}$" | sed 's/^[* ]*//' | sed 's/-.*//' | sort -n)
-    
-    # Check specs directory as well
-    local spec_dirs=""
-    if [ -d "$specs_dir" ]; then
-        spec_dirs=$(find "$specs_dir" -maxdepth 1 -type d -name "[0-9]*-${short_name}" 2>/dev/null | xargs -n1 basename 2>/dev/null | sed 's/-.*//' | sort -n)
-    fi
-    
-    # Combine all sources and get the highest number
+
     local max_num=0
-    for num in $remote_branches $local_branches $spec_dirs; do
-        if [ "$num" -gt "$max_num" ]; then
-            max_num=$num
+    local name
+    while IFS= read -r name; do
+        if [[ "$name" =~ ^([0-9]+)-${short_name}$ ]]; then
+            local num=$((10#${BASH_REMATCH[1]}))
+            if [ "$num" -gt "$max_num" ]; then
+                max_num=$num
+            fi
         fi
-    done
-    
-    # Return next number
+    done < <(list_feature_names "$specs_dir")
+
     echo $((max_num + 1))
 }
 
+# Record an allocated name so concurrent and later runs skip its number
+record_feature() {
+    echo "$1" >> "$FEATURE_INDEX"
+}
+
 # Resolve repository root. Prefer git information when available, but fall back
 # to searching for repository markers so the workflow still functions in repositories that
 # were initialised with --no-git.
@@ -122,6 +171,9 @@ cd "$REPO_ROOT"
 SPECS_DIR="$REPO_ROOT/.specify/specs"
 mkdir -p "$SPECS_DIR"
 
+FEATURE_INDEX="$REPO_ROOT/.specify/.feature-index"
+FEATURE_INDEX_LOCK="$FEATURE_INDEX.lock"
+
 # Function to generate branch name with stop word filtering and length filtering
 generate_branch_name() {
     local description="$1"
@@ -178,7 +230,13 @@ else
     BRANCH_SUFFIX=$(generate_branch_name "$FEATURE_DESCRIPTION")
 fi
 
-# Check existing branches (local, remote, and specs) to determine next available number
+# Remote branches are only consulted when explicitly requested
+if [ "$REFRESH_REMOTE" = true ] && [ "$HAS_GIT" = true ]; then
+    git fetch --all --prune >/dev/null 2>&1 || >&2 echo "[specify] Warning: git fetch failed; numbering from local refs only"
+fi
+
+# Hold the lock from picking the number until it is recorded in the index
+acquire_index_lock
 NEXT=$(check_existing_branches "$BRANCH_SUFFIX" "$SPECS_DIR")
 FEATURE_NUM=$(printf "%03d" "$NEXT")
 
@@ -206,6 +264,9 @@ if [ ${#BRANCH_NAME} -gt $MAX_BRANCH_LENGTH ]; then
     >&2 echo "[specify] Truncated to: $BRANCH_NAME (${#BRANCH_NAME} bytes)"
 fi
 
+record_feature "$BRANCH_NAME"
+release_index_lock
+
 if [ "$HAS_GIT" = true ]; then
     git checkout -b "$BRANCH_NAME"
 else
@@ -3,6 +3,18 @@
 # Unset CDPATH to prevent issues with cd command when calculating script directory
 unset CDPATH
 
+# Set SPECIFY_NATIVE=1 to run the in-process implementation (same options
+# and output) instead; if the installed custom-speckit does not have this
+# script, the bash implementation below runs.
+if [[ -n "${SPECIFY_NATIVE:-}" ]] && command -v custom-speckit >/dev/null; then
+    status=0
+    custom-speckit script get-version "$@" || status=$?
+    # 127: this CLI has no such script; 2: it has no script command at all
+    if [[ $status -ne 127 && $status -ne 2 ]]; then
+        exit "$status"
+    fi
+fi
+
 # Get project version from multiple sources
 #
 # This script attempts to determine the project version by checking:
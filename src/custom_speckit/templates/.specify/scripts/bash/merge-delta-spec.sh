@@ -3,6 +3,23 @@
 # Unset CDPATH to prevent issues with cd command when calculating script directory
 unset CDPATH
 
+# The in-process implementation (same options and output) runs when
+# SPECIFY_NATIVE=1 is set, and for the options only it provides
+# (--apply, --dry-run, --partial). If the installed custom-speckit does
+# not have this script, the bash implementation below runs.
+use_native="${SPECIFY_NATIVE:-}"
+for arg in "$@"; do
+    case "$arg" in --apply|--dry-run|--partial) use_native=1 ;; esac
+done
+if [[ -n "$use_native" ]] && command -v custom-speckit >/dev/null; then
+    status=0
+    custom-speckit script merge-delta-spec "$@" || status=$?
+    # 127: this CLI has no such script; 2: it has no script command at all
+    if [[ $status -ne 127 && $status -ne 2 ]]; then
+        exit "$status"
+    fi
+fi
+
 # Merge delta specification into main spec
 #
 # This script prepares paths and validates prerequisites for delta merging.
@@ -47,6 +64,10 @@ while [[ $# -gt 0 ]]; do
             JSON_MODE=true
             shift
             ;;
+        --apply|--dry-run|--partial)
+            echo "ERROR: $1 requires the custom-speckit CLI (the merge engine is not available in bash)." >&2
+            exit 1
+            ;;
         --help|-h)
             cat << 'EOF'
 Usage: merge-delta-spec.sh [OPTIONS]
@@ -69,8 +90,8 @@ EXAMPLES:
 
 NOTE:
   This script only validates prerequisites and prepares paths.
-  The actual text merging is done by the AI agent in /speckit.approve-delta
-  to ensure intelligent handling of additions, modifications, and deletions.
+  With the custom-speckit CLI installed, --apply merges the delta natively;
+  otherwise the text merging is done by the AI agent in /speckit.approve-delta.
 
 EOF
             exit 0
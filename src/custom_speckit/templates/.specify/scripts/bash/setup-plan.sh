@@ -5,6 +5,18 @@ set -e
 # Unset CDPATH to prevent issues with cd command when calculating script directory
 unset CDPATH
 
+# Set SPECIFY_NATIVE=1 to run the in-process implementation (same options
+# and output) instead; if the installed custom-speckit does not have this
+# script, the bash implementation below runs.
+if [[ -n "${SPECIFY_NATIVE:-}" ]] && command -v custom-speckit >/dev/null; then
+    status=0
+    custom-speckit script setup-plan "$@" || status=$?
+    # 127: this CLI has no such script; 2: it has no script command at all
+    if [[ $status -ne 127 && $status -ne 2 ]]; then
+        exit "$status"
+    fi
+fi
+
 # Parse command line arguments
 JSON_MODE=false
 ARGS=()
@@ -0,0 +1,279 @@
+"""Agent context file engine (native port of update-agent-context.sh).
+
+plan.md is parsed once and the technology and recent-changes entries are
+built once, then applied to every agent file in a single pass per file.
+Files whose content would not change are left untouched, so repeated runs
+do not rewrite (or re-date) agent files.
+"""
+
+import re
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
+
+from custom_speckit.utils.file_manager import write_if_changed
+
+# (agent type, file relative to the repo root, display name), in the order
+# update-agent-context.sh checks them when no agent is given
+AGENT_FILES: List[Tuple[str, str, str]] = [
+    ("claude", "CLAUDE.md", "Claude Code"),
+    ("gemini", "GEMINI.md", "Gemini CLI"),
+    ("copilot", ".github/copilot-instructions.md", "GitHub Copilot"),
+    ("cursor-agent", ".cursor/rules/specify-rules.mdc", "Cursor IDE"),
+    ("qwen", "QWEN.md", "Qwen Code"),
+    ("codex", "AGENTS.md", "Codex CLI"),
+    ("opencode", "AGENTS.md", "opencode"),
+    ("windsurf", ".windsurf/rules/specify-rules.md", "Windsurf"),
+    ("kilocode", ".kilocode/rules/specify-rules.md", "Kilo Code"),
+    ("auggie", ".augment/rules/specify-rules.md", "Auggie CLI"),
+    ("roo", ".roo/rules/specify-rules.md", "Roo Code"),
+    ("codebuddy", "CODEBUDDY.md", "CodeBuddy CLI"),
+    ("q", "AGENTS.md", "Amazon Q Developer CLI"),
+]
+
+TEMPLATE_FILE = ".specify/templates/agent-file-template.md"
+DEFAULT_AGENT = "claude"
+
+# Entries kept under "## Recent Changes", including the new one
+MAX_RECENT_CHANGES = 3
+
+LAST_UPDATED = re.compile(r"\*\*Last updated\*\*:.*[0-9]{4}-[0-9]{2}-[0-9]{2}")
+DATE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+
+class PlanData(NamedTuple):
+    """Fields extracted from a plan.md header."""
+
+    language: str
+    framework: str
+    database: str
+    project_type: str
+
+    @property
+    def tech_stack(self) -> str:
+        """Language and framework joined with " + " (format_technology_stack)."""
+        return " + ".join(part for part in (self.language, self.framework) if part)
+
+
+class AgentUpdate(NamedTuple):
+    """Outcome for one agent file: status is created, updated or unchanged."""
+
+    path: Path
+    name: str
+    status: str
+
+
+def _extract_plan_field(lines: List[str], field: str) -> str:
+    prefix = f"**{field}**: "
+    for line in lines:
+        if line.startswith(prefix):
+            value = line[len(prefix):].strip()
+            if "NEEDS CLARIFICATION" in value or value == "N/A":
+                return ""
+            return value
+    return ""
+
+
+def parse_plan(text: str) -> PlanData:
+    """Extract language, dependencies, storage and project type from plan.md."""
+    lines = text.splitlines()
+    return PlanData(
+        language=_extract_plan_field(lines, "Language/Version"),
+        framework=_extract_plan_field(lines, "Primary Dependencies"),
+        database=_extract_plan_field(lines, "Storage"),
+        project_type=_extract_plan_field(lines, "Project Type"),
+    )
+
+
+def _project_structure(project_type: str) -> str:
+    if "web" in project_type:
+        return "backend/\nfrontend/\ntests/"
+    return "src/\ntests/"
+
+
+def _commands_for_language(language: str) -> str:
+    if "Python" in language:
+        return "cd src && pytest && ruff check ."
+    if "Rust" in language:
+        return "cargo test && cargo clippy"
+    if "JavaScript" in language or "TypeScript" in language:
+        return "npm test && npm run lint"
+    return f"# Add commands for {language}"
+
+
+def render_new_file(template: str, plan: PlanData, branch: str, project_name: str, date: str) -> str:
+    """Fill agent-file-template.md for a new agent file."""
+    label = plan.tech_stack
+    tech_stack = f"- {label} ({branch})" if label else f"- ({branch})"
+    recent_change = f"- {branch}: Added {label}" if label else f"- {branch}: Added"
+
+    substitutions = [
+        ("[PROJECT NAME]", project_name),
+        ("[DATE]", date),
+        ("[EXTRACTED FROM ALL PLAN.MD FILES]", tech_stack),
+        ("[ACTUAL STRUCTURE FROM PLANS]", _project_structure(plan.project_type)),
+        ("[ONLY COMMANDS FOR ACTIVE TECHNOLOGIES]", _commands_for_language(plan.language)),
+        ("[LANGUAGE-SPECIFIC, ONLY FOR LANGUAGES IN USE]", f"{plan.language}: Follow standard conventions"),
+        ("[LAST 3 FEATURES AND WHAT THEY ADDED]", recent_change),
+    ]
+    content = template
+    for placeholder, value in substitutions:
+        content = content.replace(placeholder, value)
+    # The bash script turns literal "\n" sequences into newlines after substituting
+    return content.replace("\\n", "\n")
+
+
+def new_entries(plan: PlanData, branch: str) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+    """
+    Build the candidate entries once for all agent files.
+
+    Returns:
+        Tuple of ([(search text, technology line)], recent change line or None)
+    """
+    tech_entries = []
+    if plan.tech_stack:
+        tech_entries.append((plan.tech_stack, f"- {plan.tech_stack} ({branch})"))
+    if plan.database:
+        tech_entries.append((plan.database, f"- {plan.database} ({branch})"))
+
+    change = plan.tech_stack or plan.database
+    return tech_entries, f"- {branch}: Added {change}" if change else None
+
+
+def update_content(
+    content: str,
+    tech_entries: List[Tuple[str, str]],
+    change_entry: Optional[str],
+    date: str,
+) -> str:
+    """
+    Apply new technology and recent-change entries to an existing agent file.
+
+    Technologies already mentioned anywhere in the file are not added again,
+    and a change entry that is already listed is not repeated. The "Last
+    updated" date only moves when something else changed.
+    """
+    lines = content.split("\n")
+    if lines and lines[-1] == "":
+        lines.pop()
+
+    additions = [line for search, line in tech_entries if search not in content]
+    if change_entry in lines:
+        change_entry = None
+    keep_changes = MAX_RECENT_CHANGES - 1 if change_entry else MAX_RECENT_CHANGES
+
+    output: List[str] = []
+    date_lines: List[int] = []
+    in_tech = False
+    in_changes = False
+    tech_added = False
+    existing_changes = 0
+
+    for line in lines:
+        if line == "## Active Technologies":
+            output.append(line)
+            in_tech = True
+            continue
+        is_heading = line.startswith("## ") or line.startswith("##\t")
+        if in_tech and (is_heading or not line):
+            if not tech_added and additions:
+                output.extend(additions)
+                tech_added = True
+            if not line:
+                output.append(line)
+                continue
+            # Fall through so a following "## Recent Changes" is still handled
+            in_tech = False
+
+        if line == "## Recent Changes":
+            output.append(line)
+            if change_entry:
+                output.append(change_entry)
+            in_changes = True
+            continue
+        if in_changes and is_heading:
+            output.append(line)
+            in_changes = False
+            continue
+        if in_changes and line.startswith("- "):
+            if existing_changes < keep_changes:
+                output.append(line)
+                existing_changes += 1
+            continue
+
+        if LAST_UPDATED.search(line):
+            date_lines.append(len(output))
+        output.append(line)
+
+    if in_tech and not tech_added and additions:
+        output.extend(additions)
+
+    updated = "\n".join(output) + "\n"
+    if updated == content:
+        return content
+
+    for index in date_lines:
+        output[index] = DATE.sub(date, output[index], count=1)
+    return "\n".join(output) + "\n"
+
+
+def select_agent_files(repo_root: Path, agent_type: Optional[str] = None) -> List[Tuple[Path, str]]:
+    """
+    Resolve which agent files to update.
+
+    With an agent type, that agent's file (created if missing). Otherwise every
+    existing agent file, each path once, falling back to CLAUDE.md.
+
+    Raises:
+        ValueError: If the agent type is unknown
+    """
+    if agent_type:
+        for key, relative, name in AGENT_FILES:
+            if key == agent_type:
+                return [(repo_root / relative, name)]
+        raise ValueError(f"Unknown agent type '{agent_type}'")
+
+    selected = []
+    seen = set()
+    for _, relative, name in AGENT_FILES:
+        path = repo_root / relative
+        if path not in seen and path.is_file():
+            seen.add(path)
+            selected.append((path, name))
+    if not selected:
+        key, relative, name = AGENT_FILES[0]
+        selected.append((repo_root / relative, name))
+    return selected
+
+
+def update_agent_files(
+    repo_root: Path,
+    plan: PlanData,
+    branch: str,
+    targets: List[Tuple[Path, str]],
+    date: str,
+) -> List[AgentUpdate]:
+    """
+    Create or update the given agent files from one parsed plan.
+
+    Raises:
+        FileNotFoundError: If a file must be created and the template is missing
+    """
+    tech_entries, change_entry = new_entries(plan, branch)
+    template: Optional[str] = None
+    results = []
+
+    for path, name in targets:
+        if path.is_file():
+            content = path.read_text(encoding="utf-8")
+            updated = update_content(content, tech_entries, change_entry, date)
+            status = "updated" if write_if_changed(path, updated) else "unchanged"
+        else:
+            if template is None:
+                template_path = repo_root / TEMPLATE_FILE
+                if not template_path.is_file():
+                    raise FileNotFoundError(f"Template not found at {template_path}")
+                template = template_path.read_text(encoding="utf-8")
+            write_if_changed(path, render_new_file(template, plan, branch, repo_root.name, date))
+            status = "created"
+        results.append(AgentUpdate(path, name, status))
+    return results
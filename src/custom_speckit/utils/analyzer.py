@@ -0,0 +1,204 @@
+"""Mechanical cross-artifact checks for spec.md, plan.md, tasks.md and the constitution.
+
+Each artifact is read once and scanned in a single pass into one model;
+the checks then run over that model. Only mechanical findings are produced
+(coverage, duplicate IDs, clarification markers, dangling references and
+missing files) so the agent can spend its time on the judgment calls.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from custom_speckit.utils.delta_merge import SPEC_HEADING, SPEC_ITEM, STORY
+from custom_speckit.utils.task_list import parse_tasks
+from custom_speckit.utils.workspace import FeaturePaths
+
+CONSTITUTION_FILE = ".specify/memory/constitution.md"
+
+NEEDS_CLARIFICATION = re.compile(r"\[NEEDS CLARIFICATION[^\]]*\]")
+MARKDOWN_LINK = re.compile(r"\[[^\]]*\]\(([^)\s]+)\)")
+DOC_REFERENCE = re.compile(r"`((?:[\w.-]+/)*[\w.-]+\.md|contracts/[\w./-]*)`")
+PLACEHOLDER = re.compile(r"\[[A-Z][A-Z0-9_]+\]")
+REFERENCE = re.compile(r"\b[A-Z]{2,4}-\d{3,}\b")
+
+# Item prefixes that are outcomes rather than requirements needing tasks
+NON_TASK_PREFIXES = ("SC-",)
+
+
+def _artifact_paths(paths: FeaturePaths) -> Dict[str, Path]:
+    spec = paths.feature_spec
+    if not spec.is_file() and (paths.feature_dir / "spec.md").is_file():
+        spec = paths.feature_dir / "spec.md"
+    return {
+        "spec": spec,
+        "plan": paths.impl_plan,
+        "tasks": paths.tasks,
+        "constitution": paths.repo_root / CONSTITUTION_FILE,
+    }
+
+
+def _scan_common(name: str, lines: List[str], model: Dict) -> None:
+    """Clarification markers and file references, shared by every artifact."""
+    in_comment = False
+    for number, line in enumerate(lines, start=1):
+        if in_comment or line.lstrip().startswith("<!--"):
+            in_comment = "-->" not in line
+            continue
+        for marker in NEEDS_CLARIFICATION.findall(line):
+            model["needs_clarification"].append({"artifact": name, "line": number, "text": marker})
+        targets = MARKDOWN_LINK.findall(line) + DOC_REFERENCE.findall(line)
+        for target in targets:
+            target = target.split("#", 1)[0]
+            if target and "://" not in target and not any(c in target for c in "[]{}<>*"):
+                model["file_references"].append({"artifact": name, "line": number, "path": target})
+
+
+def _scan_spec(lines: List[str], model: Dict) -> None:
+    """Requirement and story definitions, plus the IDs each story references."""
+    story: Optional[str] = None
+    for number, line in enumerate(lines, start=1):
+        heading = SPEC_HEADING.match(line)
+        if heading and len(heading.group(1)) <= 3:
+            story = None
+            match = STORY.search(line)
+            if match and len(heading.group(1)) == 3:
+                story = f"User Story {match.group(1)}"
+                model["spec_ids"].setdefault(story, []).append(number)
+                model["story_refs"].setdefault(story, set())
+            continue
+        item = SPEC_ITEM.match(line)
+        if item:
+            model["spec_ids"].setdefault(item.group(2), []).append(number)
+        if story:
+            model["story_refs"][story].update(REFERENCE.findall(line))
+
+
+def _scan_constitution(lines: List[str], model: Dict) -> None:
+    for number, line in enumerate(lines, start=1):
+        if line.startswith("### "):
+            model["constitution"]["principles"].append(line[4:].strip())
+        for placeholder in PLACEHOLDER.findall(line):
+            model["constitution"]["placeholders"].append({"line": number, "text": placeholder})
+
+
+def _file_exists(reference: str, artifact: Path, paths: FeaturePaths) -> bool:
+    candidates = (artifact.parent, paths.feature_dir, paths.repo_root, paths.repo_root / ".specify")
+    return any((base / reference).exists() for base in candidates)
+
+
+def analyze(paths: FeaturePaths) -> Dict:
+    """
+    Build the artifact model and run the mechanical checks.
+
+    Args:
+        paths: Resolved feature paths (see workspace.get_feature_paths)
+
+    Returns:
+        JSON-serializable report
+    """
+    artifacts = _artifact_paths(paths)
+    model: Dict = {
+        "spec_ids": {},
+        "story_refs": {},
+        "needs_clarification": [],
+        "file_references": [],
+        "constitution": {"principles": [], "placeholders": []},
+    }
+    tasks = []
+
+    for name, path in artifacts.items():
+        if not path.is_file():
+            continue
+        text = path.read_text(encoding="utf-8")
+        lines = text.splitlines()
+        _scan_common(name, lines, model)
+        if name == "spec":
+            _scan_spec(lines, model)
+        elif name == "tasks":
+            tasks = parse_tasks(text)
+        elif name == "constitution":
+            _scan_constitution(lines, model)
+
+    spec_ids: Dict[str, List[int]] = model["spec_ids"]
+    stories = {sid: lines for sid, lines in spec_ids.items() if sid.startswith("User Story")}
+    requirements = {
+        sid: lines for sid, lines in spec_ids.items()
+        if sid not in stories and not sid.startswith(NON_TASK_PREFIXES)
+    }
+
+    task_lines: Dict[str, List[int]] = {}
+    coverage: Dict[str, List[str]] = {sid: [] for sid in requirements}
+    story_tasks: Dict[str, List[str]] = {sid: [] for sid in stories}
+    tasks_without_story = []
+    unknown_references = []
+
+    for task in tasks:
+        task_lines.setdefault(task.task_id, []).append(task.line)
+        story_number = task.story or task.phase_story
+        story = f"User Story {story_number}" if story_number else None
+
+        if task.phase_story and not task.story:
+            tasks_without_story.append({"id": task.task_id, "line": task.line, "phase": task.phase})
+        if story in story_tasks:
+            story_tasks[story].append(task.task_id)
+
+        covered = set(task.requirements)
+        if story in model["story_refs"]:
+            covered |= model["story_refs"][story]
+        for requirement in covered:
+            if requirement in coverage and task.task_id not in coverage[requirement]:
+                coverage[requirement].append(task.task_id)
+
+        unknown = [r for r in task.requirements if r not in spec_ids]
+        if task.story and f"User Story {task.story}" not in spec_ids:
+            unknown.append(f"US{task.story}")
+        if unknown and spec_ids:
+            unknown_references.append({"id": task.task_id, "line": task.line, "references": unknown})
+
+    duplicates = [
+        {"id": sid, "artifact": "spec", "lines": lines}
+        for sid, lines in spec_ids.items() if len(lines) > 1
+    ] + [
+        {"id": tid, "artifact": "tasks", "lines": lines}
+        for tid, lines in task_lines.items() if len(lines) > 1
+    ]
+
+    missing_files = [
+        reference for reference in model["file_references"]
+        if not _file_exists(reference["path"], artifacts[reference["artifact"]], paths)
+    ]
+
+    requirements_without_tasks = [
+        {"id": sid, "line": requirements[sid][0]} for sid, task_ids in coverage.items() if not task_ids
+    ] if tasks else []
+    stories_without_tasks = [
+        {"id": sid, "line": stories[sid][0]} for sid, task_ids in story_tasks.items() if not task_ids
+    ] if tasks else []
+
+    covered_count = sum(1 for task_ids in coverage.values() if task_ids)
+    findings = (
+        len(requirements_without_tasks) + len(stories_without_tasks) + len(tasks_without_story)
+        + len(unknown_references) + len(duplicates) + len(model["needs_clarification"]) + len(missing_files)
+    )
+
+    return {
+        "artifacts": {name: str(path) if path.is_file() else None for name, path in artifacts.items()},
+        "summary": {
+            "requirements": len(requirements),
+            "stories": len(stories),
+            "tasks": len(tasks),
+            "tasks_done": sum(1 for task in tasks if task.done),
+            "coverage_percent": round(100 * covered_count / len(requirements), 1) if requirements else None,
+            "findings": findings,
+        },
+        "requirements_without_tasks": requirements_without_tasks,
+        "stories_without_tasks": stories_without_tasks,
+        "tasks_without_story": tasks_without_story,
+        "tasks_with_unknown_references": unknown_references,
+        "duplicate_ids": duplicates,
+        "needs_clarification": model["needs_clarification"],
+        "missing_files": missing_files,
+        "constitution": model["constitution"],
+        "coverage": coverage,
+    }
@@ -0,0 +1,249 @@
+"""Incremental, content-addressed backups of files touched by an update."""
+
+import json
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from custom_speckit.utils import tracing
+from custom_speckit.utils.file_manager import break_link, hash_file
+from custom_speckit.utils.sync_plan import SyncPlan
+from custom_speckit.utils.version import (
+    MANIFEST_FILE,
+    VERSION_FILE,
+    get_installed_version,
+)
+
+
+BACKUP_STORE_DIR = ".specify/.backups"
+DEFAULT_KEEP_BACKUPS = 5
+
+
+def _store_root(project_root: Path) -> Path:
+    return project_root / BACKUP_STORE_DIR
+
+
+def _blob_path(project_root: Path, sha256: str) -> Path:
+    return _store_root(project_root) / "objects" / sha256[:2] / sha256
+
+
+def _snapshot_dir(project_root: Path) -> Path:
+    return _store_root(project_root) / "snapshots"
+
+
+def _store_blob(project_root: Path, file_path: Path) -> str:
+    """Store a file's content by hash, skipping the write if the blob exists."""
+    # Always hash: a blob is only ever looked up by its address, so an address
+    # taken from a stale manifest entry would restore the wrong content
+    sha256 = hash_file(file_path)
+
+    blob = _blob_path(project_root, sha256)
+    if not blob.exists():
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        tmp = blob.with_suffix(".tmp")
+        shutil.copyfile(file_path, tmp)
+        os.replace(tmp, blob)
+        tracing.count(tracing.FILES)
+        if tracing.enabled():
+            tracing.count(tracing.BYTES_WRITTEN, blob.stat().st_size)
+    else:
+        tracing.count(tracing.OPS_AVOIDED)
+    return sha256
+
+
+def _store_files(
+    project_root: Path,
+    paths: List[Path],
+) -> Dict[str, Optional[Dict]]:
+    """Store the current content of files; absent files are recorded as None."""
+    files: Dict[str, Optional[Dict]] = {}
+    for file_path in paths:
+        relative = file_path.relative_to(project_root).as_posix()
+        if not file_path.is_file():
+            files[relative] = None
+            continue
+        files[relative] = {
+            "sha256": _store_blob(project_root, file_path),
+            "mode": file_path.stat().st_mode & 0o777,
+        }
+    return files
+
+
+def _write_snapshot(
+    project_root: Path,
+    files: Dict[str, Optional[Dict]],
+    from_version: Optional[str],
+    to_version: Optional[str],
+) -> str:
+    snapshot_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    snapshot_dir = _snapshot_dir(project_root)
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    (snapshot_dir / f"{snapshot_id}.json").write_text(json.dumps({
+        "id": snapshot_id,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "from_version": from_version,
+        "to_version": to_version,
+        "files": files,
+    }, indent=2))
+    return snapshot_id
+
+
+def create_snapshot(
+    project_root: Path,
+    plan: SyncPlan,
+    from_version: Optional[str],
+    to_version: str,
+) -> Tuple[str, int]:
+    """
+    Back up only the files an update will overwrite or delete.
+
+    Files the update adds are recorded as absent so a restore removes them.
+    The version file and manifest are always included so a restore brings
+    back a consistent install.
+
+    Args:
+        project_root: Project root
+        plan: The plan about to be applied
+        from_version: Currently installed version
+        to_version: Version being installed
+
+    Returns:
+        Tuple of (snapshot id, number of files stored)
+    """
+    touched = [change.dst for change in plan.updated + plan.removed + plan.conflicts]
+    touched += [project_root / VERSION_FILE, project_root / MANIFEST_FILE]
+    files = _store_files(project_root, [f for f in touched if f.is_file()])
+    for change in plan.added:
+        files[change.dst.relative_to(project_root).as_posix()] = None
+
+    snapshot_id = _write_snapshot(project_root, files, from_version, to_version)
+    stored = sum(1 for value in files.values() if value is not None)
+    return snapshot_id, stored
+
+
+def list_snapshots(project_root: Path) -> List[Dict]:
+    """List snapshots, oldest first."""
+    snapshot_dir = _snapshot_dir(project_root)
+    if not snapshot_dir.exists():
+        return []
+
+    snapshots = []
+    for path in sorted(snapshot_dir.glob("*.json")):
+        try:
+            snapshots.append(json.loads(path.read_text()))
+        except json.JSONDecodeError:
+            continue
+    return snapshots
+
+
+def restore_snapshot(
+    project_root: Path,
+    snapshot_id: str,
+    backup: bool = True,
+) -> Tuple[List[Path], List[Path], List[str], Optional[str]]:
+    """
+    Roll the project back to the state before a snapshot's update.
+
+    A snapshot only holds the files its own update touched, so every newer
+    snapshot is rolled back too, newest first: the result is the state
+    recorded by the oldest snapshot in that chain for each file. Before
+    anything is written, the files about to change are stored in a new
+    snapshot so the restore itself can be undone.
+
+    Args:
+        project_root: Project root
+        snapshot_id: Snapshot to roll back to
+        backup: Snapshot the current state of the affected files first
+
+    Raises:
+        FileNotFoundError: If the snapshot or one of its blobs is missing
+
+    Returns:
+        Tuple of (restored_files, removed_files, ids of the snapshots rolled
+        back, newest first, id of the pre-restore snapshot or None)
+    """
+    snapshots = list_snapshots(project_root)
+    ids = [snapshot["id"] for snapshot in snapshots]
+    if snapshot_id not in ids:
+        raise FileNotFoundError(f"Backup snapshot not found: {snapshot_id}")
+    chain = snapshots[ids.index(snapshot_id):][::-1]
+
+    # The oldest record of a file in the chain is its state before the target update
+    target_state: Dict[str, Optional[Dict]] = {}
+    for snapshot in chain:
+        target_state.update(snapshot["files"])
+    for relative, record in target_state.items():
+        if record is not None and not _blob_path(project_root, record["sha256"]).exists():
+            raise FileNotFoundError(f"Backup object missing for {relative}: {record['sha256']}")
+
+    backup_id = None
+    if backup:
+        current = _store_files(
+            project_root,
+            [project_root / relative for relative in sorted(target_state)],
+        )
+        backup_id = _write_snapshot(
+            project_root, current, get_installed_version(project_root), chain[-1]["from_version"]
+        )
+
+    restored = []
+    removed = []
+    for relative, record in sorted(target_state.items()):
+        target = project_root / relative
+        if record is None:
+            if target.exists():
+                target.unlink()
+                removed.append(target)
+            continue
+
+        blob = _blob_path(project_root, record["sha256"])
+        target.parent.mkdir(parents=True, exist_ok=True)
+        break_link(target)
+        shutil.copyfile(blob, target)
+        target.chmod(record["mode"])
+        restored.append(target)
+
+    return restored, removed, [snapshot["id"] for snapshot in chain], backup_id
+
+
+def _is_empty(snapshot: Dict) -> bool:
+    """Whether a snapshot records no file besides the version file and manifest."""
+    return set(snapshot["files"]) <= {VERSION_FILE, MANIFEST_FILE}
+
+
+def prune_snapshots(project_root: Path, keep: int = DEFAULT_KEEP_BACKUPS) -> List[str]:
+    """
+    Delete snapshots older than the newest `keep` and unreferenced blobs.
+
+    Snapshots that hold nothing but the version file and manifest do not
+    count toward `keep`, so they never push out the last real update.
+
+    Returns:
+        Ids of the deleted snapshots
+    """
+    snapshots = list_snapshots(project_root)
+    counted = [index for index, snapshot in enumerate(snapshots) if not _is_empty(snapshot)]
+    if keep <= 0:
+        expired = snapshots
+    elif len(counted) > keep:
+        expired = snapshots[:counted[-keep]]
+    else:
+        expired = []
+    for snapshot in expired:
+        (_snapshot_dir(project_root) / f"{snapshot['id']}.json").unlink()
+
+    referenced = {
+        record["sha256"]
+        for snapshot in snapshots[len(expired):]
+        for record in snapshot["files"].values()
+        if record is not None
+    }
+    objects_dir = _store_root(project_root) / "objects"
+    if objects_dir.exists():
+        for blob in objects_dir.glob("*/*"):
+            if blob.name not in referenced:
+                blob.unlink()
+
+    return [snapshot["id"] for snapshot in expired]
@@ -0,0 +1,359 @@
+"""Template delta bundles for offline upgrades between two versions.
+
+A bundle is a gzipped tar containing bundle.json and one blob per distinct
+file content that changed, stored by hash:
+
+    bundle.json          {format, from_version, to_version, base, target}
+    objects/<sha256>     new content of added and changed template files
+
+`base` maps every template file of the old version to its hash, `target`
+maps every file of the new version to {sha256, size}. Added, changed and
+removed files are derived from the two, so the bundle cannot disagree with
+itself. A project accepts a bundle only if the hashes recorded in its
+manifest are exactly `base`.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import tarfile
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Callable, Dict, List, Optional
+
+from custom_speckit.utils.file_manager import should_preserve
+from custom_speckit.utils.sync_plan import (
+    ADD,
+    REMOVE,
+    UNCHANGED,
+    UPDATE,
+    FileChange,
+    SyncPlan,
+    is_locally_modified,
+    load_template,
+)
+from custom_speckit.utils.version import MANIFEST_FILE
+
+BUNDLE_FORMAT = 1
+BUNDLE_JSON = "bundle.json"
+OBJECTS_DIR = "objects"
+WHEEL_TEMPLATES = "custom_speckit/templates/"
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+
+class BundleError(Exception):
+    """A bundle cannot be built, read or applied."""
+
+
+@dataclass
+class TemplateSource:
+    """Template files of one version: hashes, and content if available."""
+
+    version: Optional[str]
+    index: Dict[str, Dict]
+    read: Optional[Callable[[str], bytes]] = None
+
+
+@dataclass
+class Bundle:
+    """The decoded bundle.json of a bundle file."""
+
+    path: Path
+    from_version: Optional[str]
+    to_version: str
+    base: Dict[str, str]
+    target: Dict[str, Dict] = field(default_factory=dict)
+
+    @property
+    def changed(self) -> List[str]:
+        """Files the bundle adds or rewrites."""
+        return sorted(
+            relative for relative, entry in self.target.items()
+            if self.base.get(relative) != entry["sha256"]
+        )
+
+    @property
+    def removed(self) -> List[str]:
+        """Files of the old version the new one no longer ships."""
+        return sorted(set(self.base) - set(self.target))
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _check_relative(relative: str) -> str:
+    """Reject paths outside .specify/ and .cursor/."""
+    path = PurePosixPath(relative)
+    if path.is_absolute() or ".." in path.parts or len(path.parts) < 2 or path.parts[0] not in (".specify", ".cursor"):
+        raise BundleError(f"Bundle contains a path outside the template: {relative}")
+    return relative
+
+
+def _wheel_source(path: Path) -> TemplateSource:
+    contents: Dict[str, bytes] = {}
+    version = None
+    with zipfile.ZipFile(path) as wheel:
+        for name in wheel.namelist():
+            if name.startswith(WHEEL_TEMPLATES) and not name.endswith("/"):
+                relative = name[len(WHEEL_TEMPLATES):]
+                if relative.startswith((".specify/", ".cursor/")):
+                    contents[relative] = wheel.read(name)
+            elif name.endswith(".dist-info/METADATA"):
+                for line in wheel.read(name).decode("utf-8").splitlines():
+                    if line.startswith("Version:"):
+                        version = line.partition(":")[2].strip()
+                        break
+    if not contents:
+        raise BundleError(f"No custom_speckit templates found in {path}")
+    index = {
+        relative: {"sha256": _sha256(data), "size": len(data)}
+        for relative, data in sorted(contents.items())
+    }
+    return TemplateSource(version, index, contents.__getitem__)
+
+
+def _manifest_source(path: Path) -> TemplateSource:
+    try:
+        manifest = json.loads(path.read_text())
+    except json.JSONDecodeError as e:
+        raise BundleError(f"Invalid manifest {path}: {e}") from e
+    entries = manifest.get("entries")
+    if not entries:
+        raise BundleError(f"{path} has no file hashes (installed before manifests recorded them)")
+    index = {relative: {"sha256": entry["sha256"], "size": entry["size"]} for relative, entry in entries.items()}
+    return TemplateSource(manifest.get("version"), index)
+
+
+def _directory_source(template_dir: Path, version: Optional[str]) -> TemplateSource:
+    index = {
+        relative: {"sha256": entry["sha256"], "size": entry["size"]}
+        for relative, entry in load_template(template_dir).items()
+    }
+    if not index:
+        raise BundleError(f"No .specify/ or .cursor/ templates found in {template_dir}")
+    return TemplateSource(version, index, lambda relative: (template_dir / relative).read_bytes())
+
+
+def load_source(path: Optional[Path], version: Optional[str] = None) -> TemplateSource:
+    """
+    Load the template files of one version.
+
+    Args:
+        path: A wheel, a project directory or .manifest.json (hashes only,
+            usable as the base of a bundle), a templates directory, or None
+            for the templates shipped with this installation
+        version: Version label, overriding the one found in the source
+
+    Returns:
+        TemplateSource; `read` is None for hash-only sources
+    """
+    if path is None:
+        from custom_speckit import __version__
+
+        source = _directory_source(TEMPLATE_DIR, __version__)
+    elif path.is_file() and path.suffix in (".whl", ".zip"):
+        source = _wheel_source(path)
+    elif path.is_file():
+        source = _manifest_source(path)
+    elif (path / MANIFEST_FILE).is_file():
+        source = _manifest_source(path / MANIFEST_FILE)
+    elif path.is_dir():
+        source = _directory_source(path, None)
+    else:
+        raise BundleError(f"Not found: {path}")
+    if version:
+        source.version = version
+    return source
+
+
+def _add_member(archive: tarfile.TarFile, name: str, data: bytes) -> None:
+    # Fixed metadata so the same versions always produce the same bundle
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mode = 0o644
+    archive.addfile(info, io.BytesIO(data))
+
+
+def create_bundle(base: TemplateSource, target: TemplateSource, output: Path) -> Bundle:
+    """
+    Write a bundle that upgrades `base` installs to `target`.
+
+    Raises:
+        BundleError: If the target has no content or no version
+
+    Returns:
+        The written bundle
+    """
+    if target.read is None:
+        raise BundleError("The target of a bundle must be a wheel or a templates directory")
+    if not target.version:
+        raise BundleError("The target version is unknown; pass it explicitly")
+
+    bundle = Bundle(
+        path=output,
+        from_version=base.version,
+        to_version=target.version,
+        base={relative: entry["sha256"] for relative, entry in sorted(base.index.items())},
+        target={
+            relative: {"sha256": entry["sha256"], "size": entry["size"]}
+            for relative, entry in sorted(target.index.items())
+        },
+    )
+    blobs: Dict[str, str] = {}
+    for relative in bundle.changed:
+        blobs.setdefault(bundle.target[relative]["sha256"], relative)
+
+    document = json.dumps({
+        "format": BUNDLE_FORMAT,
+        "from_version": bundle.from_version,
+        "to_version": bundle.to_version,
+        "base": bundle.base,
+        "target": bundle.target,
+    }, indent=1).encode("utf-8")
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "wb") as raw, gzip.GzipFile("", "wb", 9, raw, mtime=0) as gz:
+        with tarfile.open(fileobj=gz, mode="w", format=tarfile.PAX_FORMAT) as archive:
+            _add_member(archive, BUNDLE_JSON, document)
+            for sha256, relative in sorted(blobs.items()):
+                data = target.read(relative)
+                if _sha256(data) != sha256:
+                    raise BundleError(f"{relative} changed while the bundle was being built")
+                _add_member(archive, f"{OBJECTS_DIR}/{sha256}", data)
+    return bundle
+
+
+def read_bundle(path: Path) -> Bundle:
+    """
+    Read and validate a bundle's bundle.json.
+
+    Raises:
+        BundleError: If the file is not a bundle this version understands
+    """
+    try:
+        with tarfile.open(path, "r:gz") as archive:
+            member = archive.extractfile(BUNDLE_JSON)
+            document = json.loads(member.read())
+    except (OSError, KeyError, tarfile.TarError, json.JSONDecodeError) as e:
+        raise BundleError(f"{path} is not a template bundle: {e}") from e
+    if document.get("format") != BUNDLE_FORMAT:
+        raise BundleError(f"Unsupported bundle format {document.get('format')!r} in {path}")
+
+    for relative in list(document["base"]) + list(document["target"]):
+        _check_relative(relative)
+    return Bundle(
+        path=path,
+        from_version=document.get("from_version"),
+        to_version=document["to_version"],
+        base=document["base"],
+        target=document["target"],
+    )
+
+
+def extract_objects(bundle: Bundle, destination: Path) -> int:
+    """
+    Extract and verify the blobs the bundle needs into destination/<sha256>.
+
+    Raises:
+        BundleError: If a blob is missing or does not match its hash
+
+    Returns:
+        Number of bytes extracted
+    """
+    needed = {bundle.target[relative]["sha256"] for relative in bundle.changed}
+    destination.mkdir(parents=True, exist_ok=True)
+    extracted = 0
+    with tarfile.open(bundle.path, "r:gz") as archive:
+        for member in archive:
+            name = PurePosixPath(member.name)
+            if not member.isfile() or name.parent != PurePosixPath(OBJECTS_DIR) or name.name not in needed:
+                continue  # anything else is never written to disk
+            data = archive.extractfile(member).read()
+            if _sha256(data) != name.name:
+                raise BundleError(f"Corrupt object {name.name} in {bundle.path}")
+            (destination / name.name).write_bytes(data)
+            needed.discard(name.name)
+            extracted += len(data)
+    if needed:
+        raise BundleError(f"{bundle.path} is missing {len(needed)} objects")
+    return extracted
+
+
+def base_mismatches(bundle: Bundle, entries: Dict[str, Dict]) -> List[str]:
+    """Files whose recorded manifest hash is not the bundle's base version."""
+    recorded = {relative: entry.get("sha256") for relative, entry in entries.items()}
+    return sorted(
+        relative for relative in set(recorded) | set(bundle.base)
+        if recorded.get(relative) != bundle.base.get(relative)
+    )
+
+
+def is_applied(bundle: Bundle, entries: Dict[str, Dict]) -> bool:
+    """True if the manifest already records the bundle's target version."""
+    recorded = {relative: entry.get("sha256") for relative, entry in entries.items()}
+    return recorded == {relative: entry["sha256"] for relative, entry in bundle.target.items()}
+
+
+def _preserved(relative: str) -> bool:
+    return relative.startswith(".specify/") and should_preserve(relative[len(".specify/"):])
+
+
+def plan_bundle(project_root: Path, bundle: Bundle, objects_dir: Path, entries: Dict[str, Dict]) -> SyncPlan:
+    """
+    Plan applying a bundle, in the same shape as sync_plan.plan_update.
+
+    Files the bundle does not change are left as they are, even if edited
+    locally; a full update restores those.
+
+    Args:
+        project_root: Project root
+        bundle: A bundle whose base matches the project's manifest
+        objects_dir: Where extract_objects put the blobs
+        entries: Project-relative manifest entries
+
+    Returns:
+        SyncPlan with src paths pointing at the extracted blobs
+    """
+    buckets: Dict[str, List[FileChange]] = {
+        ADD: [], UPDATE: [], REMOVE: [], UNCHANGED: [], "conflict": [], "kept": [],
+    }
+    changed = set(bundle.changed)
+    for relative, target in bundle.target.items():
+        dst = project_root / relative
+        if relative not in changed:
+            if dst.is_file():
+                buckets[UNCHANGED].append(FileChange(relative, None, dst, UNCHANGED, target["size"]))
+            continue
+        src = objects_dir / target["sha256"]
+        if not dst.exists():
+            buckets[ADD].append(FileChange(relative, src, dst, ADD, target["size"]))
+            continue
+        change = FileChange(relative, src, dst, UPDATE, target["size"])
+        if not is_locally_modified(dst, entries.get(relative)):
+            buckets[UPDATE].append(change)
+        elif _preserved(relative):
+            buckets["kept"].append(change)
+        else:
+            buckets["conflict"].append(change)
+
+    for relative in bundle.removed:
+        dst = project_root / relative
+        # Like plan_update, never remove files in user-owned directories
+        if _preserved(relative):
+            continue
+        if dst.is_file():
+            change = FileChange(relative, None, dst, REMOVE, dst.stat().st_size)
+            modified = is_locally_modified(dst, entries.get(relative))
+            buckets["conflict" if modified else REMOVE].append(change)
+
+    return SyncPlan(
+        added=tuple(buckets[ADD]),
+        updated=tuple(buckets[UPDATE]),
+        removed=tuple(buckets[REMOVE]),
+        unchanged=tuple(buckets[UNCHANGED]),
+        conflicts=tuple(buckets["conflict"]),
+        kept=tuple(buckets["kept"]),
+    )
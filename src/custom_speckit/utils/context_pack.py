@@ -0,0 +1,327 @@
+"""Compact, cached context packs for the agent slash commands.
+
+A pack is the documents one command (plan, tasks, implement, analyze)
+reads, reduced to the sections it uses, stripped of template comments and
+trimmed to a token budget. It is cached in .specify/.cache/context/ keyed by
+the content hashes of its input files; while their size and mtime are
+unchanged a cached pack is returned without reading any of them.
+"""
+
+import hashlib
+import json
+import os
+import re
+import stat
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from custom_speckit.utils.delta_merge import SPEC_HEADING
+from custom_speckit.utils.file_manager import stat_matches, write_if_changed
+from custom_speckit.utils.workspace import FeaturePaths
+
+CACHE_DIR = ".specify/.cache/context"
+PACK_VERSION = 1
+DEFAULT_BUDGET = 12000
+
+# Below this many tokens a truncated document is not worth including
+MIN_EXCERPT_TOKENS = 200
+
+HTML_COMMENT = re.compile(r"<!--.*?-->\n?", re.DOTALL)
+BLANK_RUNS = re.compile(r"\n{3,}")
+
+
+class Source(NamedTuple):
+    """A document a command reads, and the sections of it that it needs."""
+
+    name: str
+    locate: Callable[[FeaturePaths], List[Path]]
+    sections: Tuple[str, ...] = ()
+
+
+def _spec(paths: FeaturePaths) -> List[Path]:
+    spec = paths.feature_spec
+    if not spec.is_file() and (paths.feature_dir / "spec.md").is_file():
+        spec = paths.feature_dir / "spec.md"
+    return [spec]
+
+
+def _project_or_feature(name: str) -> Callable[[FeaturePaths], List[Path]]:
+    """Project skeleton document in .specify/specs/, else the feature's copy."""
+
+    def locate(paths: FeaturePaths) -> List[Path]:
+        shared = paths.repo_root / ".specify" / "specs" / name
+        local = paths.feature_dir / name
+        return [local if not shared.exists() and local.exists() else shared]
+
+    return locate
+
+
+def _contracts(paths: FeaturePaths) -> List[Path]:
+    directory = _project_or_feature("contracts")(paths)[0]
+    files = []
+    for root, dirs, names in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        files.extend(Path(root) / name for name in sorted(names) if not name.startswith("."))
+    return files or [directory]
+
+
+def _feature(name: str) -> Callable[[FeaturePaths], List[Path]]:
+    return lambda paths: [paths.feature_dir / name]
+
+
+SPEC = Source("spec", _spec)
+STORIES_AND_REQUIREMENTS = Source("spec", _spec, ("User Scenarios", "Requirements"))
+DELTA = Source(
+    "delta",
+    lambda paths: [paths.repo_root / ".specify" / ".deltas" / paths.current_branch / "delta-spec.md"],
+)
+CONSTITUTION = Source("constitution", lambda paths: [paths.repo_root / ".specify" / "memory" / "constitution.md"])
+TECH_STACK = Source("tech-stack", _project_or_feature("tech-stack.md"))
+DATA_MODEL = Source("data-model", _project_or_feature("data-model.md"))
+CONTRACTS = Source("contracts", _contracts)
+PLAN = Source("plan", _feature("plan.md"))
+TASKS = Source("tasks", _feature("tasks.md"))
+RESEARCH = Source("research", _feature("research.md"))
+QUICKSTART = Source("quickstart", _feature("quickstart.md"))
+
+# What each slash command loads, most important first: when the budget runs
+# out, documents at the end are truncated or left out
+PACKS: Dict[str, Tuple[Source, ...]] = {
+    "plan": (SPEC, DELTA, CONSTITUTION, TECH_STACK, DATA_MODEL, CONTRACTS),
+    "tasks": (PLAN, STORIES_AND_REQUIREMENTS, DELTA, TECH_STACK, DATA_MODEL, CONTRACTS),
+    "implement": (
+        TASKS,
+        Source("plan", _feature("plan.md"), ("Summary", "Technical Context", "Project Structure")),
+        DATA_MODEL, CONTRACTS, RESEARCH, QUICKSTART,
+    ),
+    "analyze": (
+        Source("spec", _spec, ("User Scenarios", "Requirements", "Success Criteria")),
+        PLAN, TASKS, CONSTITUTION,
+    ),
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about 4 bytes of UTF-8 per token)."""
+    return (len(text.encode("utf-8")) + 3) // 4
+
+
+def compact(text: str) -> str:
+    """Drop HTML comments (template guidance) and runs of blank lines."""
+    return BLANK_RUNS.sub("\n\n", HTML_COMMENT.sub("", text)).strip() + "\n"
+
+
+def select_sections(text: str, names: Tuple[str, ...]) -> Tuple[str, bool]:
+    """
+    Keep the preamble and the `##` sections whose heading starts with one of `names`.
+
+    Returns:
+        Tuple of (text, whether anything was dropped); the whole text if no
+        heading matches (e.g. a document written with other headings)
+    """
+    if not names:
+        return text, False
+    prefixes = tuple(name.lower() for name in names)
+    kept: List[str] = []
+    keep = True  # everything before the first section (title, metadata)
+    matched = False
+    in_fence = False
+    for line in text.splitlines(keepends=True):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        heading = None if in_fence else SPEC_HEADING.match(line)
+        if heading and len(heading.group(1)) == 2:
+            keep = line[3:].strip().lower().startswith(prefixes)
+            matched = matched or keep
+        if keep:
+            kept.append(line)
+    if not matched:
+        return text, False
+    return "".join(kept), True
+
+
+def truncate(text: str, tokens: int) -> Tuple[str, int]:
+    """
+    Cut text at a line boundary to fit roughly `tokens`.
+
+    Returns:
+        Tuple of (kept text, number of lines dropped)
+    """
+    lines = text.splitlines(keepends=True)
+    budget = tokens * 4
+    used = 0
+    for count, line in enumerate(lines):
+        used += len(line.encode("utf-8"))
+        if used > budget:
+            return "".join(lines[:count]), len(lines) - count
+    return text, 0
+
+
+def _relative(path: Path, root: Path) -> str:
+    try:
+        return path.relative_to(root).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def _inputs(paths: FeaturePaths, command: str) -> List[Tuple[Source, Path]]:
+    return [(source, path) for source in PACKS[command] for path in source.locate(paths)]
+
+
+def build_pack(
+    paths: FeaturePaths,
+    command: str,
+    contents: Dict[Path, Optional[str]],
+    budget: int = DEFAULT_BUDGET,
+) -> Dict:
+    """
+    Assemble a pack from the already-read input documents.
+
+    Args:
+        paths: Resolved feature paths
+        command: Key of PACKS
+        contents: Text of every input path (None if it does not exist)
+        budget: Approximate token budget for the documents
+
+    Returns:
+        Dict with the pack text and what was included, truncated, left out
+        for lack of budget, or not found
+    """
+    root = paths.repo_root
+    remaining = budget
+    parts = []
+    sources, missing, omitted = [], [], []
+
+    for source, path in _inputs(paths, command):
+        relative = _relative(path, root)
+        text = contents.get(path)
+        if text is None:
+            missing.append(relative)
+            continue
+        text, partial = select_sections(compact(text), source.sections)
+        tokens = estimate_tokens(text)
+        dropped = 0
+        if tokens > remaining:
+            if remaining < MIN_EXCERPT_TOKENS:
+                omitted.append(relative)
+                continue
+            text, dropped = truncate(text, remaining)
+            tokens = estimate_tokens(text)
+        remaining -= tokens
+
+        attributes = f'path="{relative}"'
+        if partial:
+            attributes += f' sections="{", ".join(source.sections)}"'
+        if dropped:
+            attributes += f' truncated="{dropped} lines not shown"'
+        parts.append(f"<file {attributes}>\n{text.rstrip()}\n</file>\n")
+        sources.append({
+            "path": relative,
+            "tokens": tokens,
+            "sections": list(source.sections) if partial else [],
+            "truncated_lines": dropped,
+        })
+
+    header = [
+        f"# Context for /speckit.{command} (feature: {paths.current_branch})",
+        f"Feature directory: {_relative(paths.feature_dir, root)}",
+        f"~{budget - remaining} of {budget} tokens. Read a file directly only if it is truncated or listed below.",
+    ]
+    if missing:
+        header.append(f"Not found: {', '.join(missing)}")
+    if omitted:
+        header.append(f"Left out (over budget): {', '.join(omitted)}")
+
+    return {
+        "command": command,
+        "branch": paths.current_branch,
+        "feature_dir": str(paths.feature_dir),
+        "budget": budget,
+        "tokens": budget - remaining,
+        "sources": sources,
+        "missing": missing,
+        "omitted": omitted,
+        "pack": "\n".join(header) + "\n\n" + "\n".join(parts),
+    }
+
+
+def _hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _cache_key(command: str, budget: int, hashes: Dict[str, Optional[str]]) -> str:
+    return _hash(json.dumps([PACK_VERSION, command, budget, sorted(hashes.items())]).encode("utf-8"))
+
+
+def load_pack(paths: FeaturePaths, command: str, budget: int = DEFAULT_BUDGET, use_cache: bool = True) -> Dict:
+    """
+    Return the context pack of a command, from the cache when its inputs are unchanged.
+
+    Inputs are first compared by size and mtime, then by content hash; the
+    pack is rebuilt only when a document actually changed (or appeared or
+    disappeared).
+
+    Raises:
+        KeyError: If `command` has no pack
+
+    Returns:
+        build_pack's result plus "cached" (True if nothing was rebuilt)
+    """
+    inputs = [path for _, path in _inputs(paths, command)]
+    cache_path = paths.repo_root / CACHE_DIR / f"{command}.json"
+
+    cached: Dict = {}
+    if use_cache:
+        try:
+            cached = json.loads(cache_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+        if cached.get("version") != PACK_VERSION or cached.get("budget") != budget:
+            cached = {}
+    recorded = cached.get("inputs", {})
+
+    # Stat results of the inputs that are files; None for anything else
+    stats = {}
+    for path in inputs:
+        try:
+            stat_result = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            stat_result = None
+        stats[str(path)] = stat_result if stat_result and stat.S_ISREG(stat_result.st_mode) else None
+
+    if cached and set(recorded) == set(stats) and all(
+        recorded[key] is None if stat_result is None else stat_matches(stat_result, recorded[key])
+        for key, stat_result in stats.items()
+    ):
+        return {**cached["result"], "cached": True}
+
+    contents: Dict[Path, Optional[str]] = {}
+    entries: Dict[str, Optional[Dict]] = {}
+    for path in inputs:
+        stat_result = stats[str(path)]
+        if stat_result is None:
+            contents[path] = None
+            entries[str(path)] = None
+            continue
+        data = path.read_bytes()
+        contents[path] = data.decode("utf-8", errors="replace")
+        entries[str(path)] = {"sha256": _hash(data), "size": stat_result.st_size, "mtime": stat_result.st_mtime_ns}
+
+    key = _cache_key(command, budget, {path: entry and entry["sha256"] for path, entry in entries.items()})
+    if cached and cached.get("key") == key:
+        result = cached["result"]
+        hit = True
+    else:
+        result = build_pack(paths, command, contents, budget)
+        hit = False
+
+    if use_cache:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_if_changed(cache_path, json.dumps({
+            "version": PACK_VERSION,
+            "budget": budget,
+            "key": key,
+            "inputs": entries,
+            "result": result,
+        }, ensure_ascii=False))
+    return {**result, "cached": hit}
@@ -0,0 +1,479 @@
+"""Deterministic merge of a delta spec into .specify/specs/spec.md.
+
+The delta's Additions, Modifications and Deletions sections are parsed into
+changes keyed by ID (`User Story N`, `FR-NNN`, `FR-NEW-NNN`, `SC-NNN`, ...).
+The spec is indexed in one pass and the merged spec is emitted in a second
+pass over the same lines, so merge time is linear in the spec size.
+
+Every change is validated before anything is written. A change that cannot
+be applied exactly (missing target, stale "Before" text, duplicate ID) is
+reported as a conflict and, unless partial merges are requested, the spec
+is left untouched.
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from custom_speckit.utils.file_manager import write_if_changed
+
+ADD = "add"
+MODIFY = "modify"
+DELETE = "delete"
+
+STORY = re.compile(r"\bUser Story (\d+)\b")
+ITEM = re.compile(r"\b([A-Z]{2,4})-(NEW-)?(\d+)\b")
+SPEC_HEADING = re.compile(r"^(#{1,6})\s")
+SPEC_ITEM = re.compile(r"^(\s*)[-*]\s+\*\*([A-Z]{2,4}-\d+)\*\*")
+PRIORITY = re.compile(r"\(Priority: (P\d+)\)")
+NEW_PRIORITY = re.compile(r"\*\*New Priority\*\*:\s*(P\d+)")
+MARKERS = re.compile(r"\s*\**\((NEW|MODIFIED|DELETED)\)\**")
+
+# Heading under which the first item of a prefix is added when the spec has none yet
+ITEM_SECTIONS = {
+    "FR": "### Functional Requirements",
+    "SC": "### Measurable Outcomes",
+}
+
+
+@dataclass
+class DeltaChange:
+    """One addition, modification or deletion parsed from a delta spec."""
+
+    action: str
+    change_id: str
+    heading: str
+    lines: List[str] = field(default_factory=list)
+
+    @property
+    def is_story(self) -> bool:
+        return self.change_id.startswith("User Story")
+
+    def fenced(self, label: str) -> Optional[str]:
+        """Return the fenced block following `**<label>**:`, if any."""
+        marker = f"**{label}**:"
+        for index, line in enumerate(self.lines):
+            if line.strip().startswith(marker):
+                block: List[str] = []
+                inside = False
+                for candidate in self.lines[index + 1:]:
+                    if candidate.strip().startswith("```"):
+                        if inside:
+                            return "\n".join(block).strip("\n")
+                        inside = True
+                    elif inside:
+                        block.append(candidate)
+                    elif candidate.strip():
+                        break
+        return None
+
+
+@dataclass
+class MergeResult:
+    """Merged spec text plus a machine-readable report."""
+
+    content: str
+    additions: int = 0
+    modifications: int = 0
+    deletions: int = 0
+    assigned_ids: Dict[str, str] = field(default_factory=dict)
+    conflicts: List[Dict[str, str]] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return not self.conflicts
+
+    @property
+    def applied(self) -> int:
+        return self.additions + self.modifications + self.deletions
+
+    def report(self) -> Dict:
+        return {
+            "SUCCESS": self.success,
+            "APPLIED": self.applied,
+            "CONFLICT_COUNT": len(self.conflicts),
+            "ADDITIONS_APPLIED": self.additions,
+            "MODIFICATIONS_APPLIED": self.modifications,
+            "DELETIONS_APPLIED": self.deletions,
+            "ASSIGNED_IDS": self.assigned_ids,
+            "CONFLICTS": self.conflicts,
+            "SKIPPED": self.skipped,
+            "ERRORS": [f"{c['id']}: {c['detail']}" for c in self.conflicts],
+        }
+
+
+def _delta_section(heading: str) -> Optional[str]:
+    lower = heading.lower()
+    if "addition" in lower:
+        return ADD
+    if "modification" in lower:
+        return MODIFY
+    if "deletion" in lower:
+        return DELETE
+    return None
+
+
+def _change_id(heading: str) -> Optional[str]:
+    story = STORY.search(heading)
+    if story:
+        return f"User Story {story.group(1)}"
+    item = ITEM.search(heading)
+    if item:
+        return item.group(0)
+    return None
+
+
+def parse_delta(text: str) -> Tuple[List[DeltaChange], List[str]]:
+    """
+    Parse the change sections of a delta spec.
+
+    Returns:
+        Tuple of (changes in document order, headings skipped for lack of an ID,
+        such as unfilled template placeholders)
+    """
+    changes: List[DeltaChange] = []
+    skipped: List[str] = []
+    section = None
+    current: Optional[DeltaChange] = None
+    in_comment = False
+    in_fence = False
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if in_comment:
+            in_comment = "-->" not in line
+            continue
+        if not in_fence and stripped.startswith("<!--"):
+            in_comment = "-->" not in line
+            continue
+        if stripped.startswith("```"):
+            in_fence = not in_fence
+        elif not in_fence:
+            if line.startswith("## "):
+                section = _delta_section(line)
+                current = None
+                continue
+            if stripped == "---":
+                current = None
+                continue
+            if section and (line.startswith("### ") or line.startswith("#### ")):
+                change_id = _change_id(line)
+                if change_id:
+                    current = DeltaChange(section, change_id, line)
+                    changes.append(current)
+                else:
+                    current = None
+                    # "### <Section> (NEW)" only groups additions
+                    if not (section == ADD and line.startswith("### ")):
+                        skipped.append(line.lstrip("#").strip())
+                continue
+        if current is not None:
+            current.lines.append(line)
+
+    return changes, skipped
+
+
+@dataclass
+class _SpecIndex:
+    """Line spans of the IDs in a spec, built in one pass."""
+
+    stories: Dict[int, Tuple[int, int, int]] = field(default_factory=dict)
+    items: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    headings: Dict[str, int] = field(default_factory=dict)
+    scenarios_end: Optional[int] = None
+
+
+def _index_spec(lines: List[str]) -> _SpecIndex:
+    """
+    Record (start, content end, span end) for each user story and
+    (start, end) for each ID'd list item.
+
+    A story runs until the next heading of level 3 or above; its content end
+    excludes the trailing blank lines and `---` separator.
+    """
+    index = _SpecIndex()
+    open_story: Optional[Tuple[int, int]] = None
+    open_item: Optional[Tuple[str, int, int]] = None
+    in_scenarios = False
+
+    def close_story(end: int) -> None:
+        number, start = open_story
+        content_end = end
+        while content_end > start + 1 and lines[content_end - 1].strip() in ("", "---"):
+            content_end -= 1
+        index.stories[number] = (start, content_end, end)
+
+    for position, line in enumerate(lines):
+        heading = SPEC_HEADING.match(line)
+        if open_item is not None:
+            item_id, start, indent = open_item
+            continuation = line.strip() and not heading and len(line) - len(line.lstrip()) > indent
+            if not continuation:
+                index.items[item_id] = (start, position)
+                open_item = None
+
+        if heading:
+            level = len(heading.group(1))
+            if level <= 3 and open_story is not None:
+                close_story(position)
+                open_story = None
+            if level <= 2:
+                if in_scenarios and index.scenarios_end is None:
+                    index.scenarios_end = position
+                in_scenarios = "User Scenarios" in line
+            index.headings.setdefault(line.rstrip(), position)
+            story = STORY.search(line)
+            if level == 3 and story:
+                open_story = (int(story.group(1)), position)
+            continue
+
+        item = SPEC_ITEM.match(line)
+        if item:
+            open_item = (item.group(2), position, len(item.group(1)))
+
+    if open_story is not None:
+        close_story(len(lines))
+    if open_item is not None:
+        index.items[open_item[0]] = (open_item[1], len(lines))
+    if in_scenarios and index.scenarios_end is None:
+        index.scenarios_end = len(lines)
+    return index
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _already_applied(current: str, before: str, after: str) -> bool:
+    """
+    Check whether a Before -> After modification is already in `current`.
+
+    Checked before matching Before: After may contain it ("validate email"
+    -> "validate email addresses"), so Before still matching is not enough
+    to tell that the change is pending.
+    """
+    if after not in current:
+        return False
+    if after in before:
+        return before not in current
+    return before not in current.replace(after, "")
+
+
+def _body(change: DeltaChange) -> List[str]:
+    lines = list(change.lines)
+    while lines and not lines[0].strip():
+        lines.pop(0)
+    while lines and not lines[-1].strip():
+        lines.pop()
+    return lines
+
+
+def _clean_heading(heading: str) -> str:
+    return MARKERS.sub("", heading.lstrip("#").strip()).strip()
+
+
+def _item_description(change: DeltaChange) -> str:
+    """First paragraph of an added requirement, falling back to its title."""
+    paragraph = []
+    for line in _body(change):
+        if line.strip().startswith("**"):
+            break
+        if not line.strip():
+            if paragraph:
+                break
+            continue
+        paragraph.append(line.strip())
+    if paragraph:
+        return " ".join(paragraph)
+    title = _clean_heading(change.heading)
+    return title.split(":", 1)[1].strip() if ":" in title else title
+
+
+def _next_number(prefix: str, items: Dict[str, Tuple[int, int]], taken: List[str]) -> str:
+    numbers = [
+        int(item_id.split("-", 1)[1])
+        for item_id in list(items) + taken
+        if item_id.startswith(f"{prefix}-")
+    ]
+    return f"{prefix}-{max(numbers, default=0) + 1:03d}"
+
+
+def merge_delta(spec_text: str, delta_text: str, partial: bool = False) -> MergeResult:
+    """
+    Apply a delta spec to spec text.
+
+    Args:
+        spec_text: Current spec.md content
+        delta_text: delta-spec.md content
+        partial: Apply the changes that do not conflict even if others do
+
+    Returns:
+        MergeResult; `content` is the original spec text when there are
+        conflicts and `partial` is False
+    """
+    lines = spec_text.splitlines()
+    index = _index_spec(lines)
+    changes, skipped = parse_delta(delta_text)
+    result = MergeResult(content=spec_text, skipped=skipped)
+
+    # position -> replacement lines for the span starting there (None deletes)
+    replacements: Dict[int, Tuple[int, Optional[List[str]]]] = {}
+    inserts: Dict[int, List[str]] = {}
+    touched: Dict[str, str] = {}
+    added_items: List[str] = []
+    counts = {ADD: 0, MODIFY: 0, DELETE: 0}
+
+    def conflict(change: DeltaChange, reason: str, detail: str) -> None:
+        result.conflicts.append({
+            "id": change.change_id,
+            "action": change.action,
+            "reason": reason,
+            "detail": detail,
+        })
+
+    for change in changes:
+        key = change.change_id
+        if key in touched:
+            conflict(change, "duplicate-change", f"already {touched[key]}ed earlier in the delta")
+            continue
+
+        if change.action == ADD:
+            if change.is_story:
+                number = int(key.split()[-1])
+                if number in index.stories or key in added_items:
+                    conflict(change, "duplicate-id", f"{key} already exists in the spec")
+                    continue
+                if index.stories:
+                    position = max(span[2] for span in index.stories.values())
+                else:
+                    position = index.headings.get("### Edge Cases", index.scenarios_end or len(lines))
+                block = [f"### {_clean_heading(change.heading)}", "", *_body(change), "", "---", ""]
+            else:
+                match = ITEM.search(key)
+                prefix, is_new = match.group(1), bool(match.group(2))
+                item_id = _next_number(prefix, index.items, added_items) if is_new else key
+                if item_id in index.items or item_id in added_items:
+                    conflict(change, "duplicate-id", f"{item_id} already exists in the spec")
+                    continue
+                description = _item_description(change)
+                duplicate = next((
+                    item for item, span in index.items.items()
+                    if lines[span[0]].rstrip().endswith(f"**: {description}")
+                ), None)
+                if is_new and duplicate:
+                    conflict(change, "duplicate-content", f"same requirement already present as {duplicate}")
+                    continue
+                block = [f"- **{item_id}**: {description}"]
+                same_prefix = [span[1] for item, span in index.items.items() if item.startswith(f"{prefix}-")]
+                if same_prefix:
+                    position = max(same_prefix)
+                elif ITEM_SECTIONS.get(prefix) in index.headings:
+                    # First item of its kind: start a list right below the heading
+                    position = index.headings[ITEM_SECTIONS[prefix]] + 1
+                    block.insert(0, "")
+                else:
+                    conflict(change, "no-insertion-point", f"spec has no {prefix} items or section to add to")
+                    continue
+                if is_new:
+                    result.assigned_ids[key] = item_id
+                added_items.append(item_id)
+                key = item_id
+            inserts.setdefault(position, []).extend(block)
+
+        else:
+            if change.is_story:
+                number = int(key.split()[-1])
+                span = index.stories.get(number)
+                if span is None:
+                    conflict(change, "missing-target", f"{key} not found in the spec")
+                    continue
+                start, content_end, span_end = span
+            else:
+                span = index.items.get(key)
+                if span is None:
+                    conflict(change, "missing-target", f"{key} not found in the spec")
+                    continue
+                start, content_end = span
+                span_end = content_end
+            current = "\n".join(line.rstrip() for line in lines[start:content_end])
+
+            if change.action == DELETE:
+                original = change.fenced("Original Content")
+                if original and _normalize(original) not in _normalize(current):
+                    conflict(change, "content-mismatch", "Original Content no longer matches the spec")
+                    continue
+                replacements[start] = (span_end, None)
+            else:
+                before = change.fenced("Before")
+                after = change.fenced("After")
+                if after is None:
+                    conflict(change, "missing-after", "no **After** block")
+                    continue
+                if before and _already_applied(current, before.strip(), after.strip()):
+                    conflict(change, "already-applied", "After text is already in the spec")
+                    continue
+                if before:
+                    if before.strip() not in current:
+                        conflict(change, "before-mismatch", "Before text not found in the spec (spec changed since the delta was written?)")
+                        continue
+                    updated = current.replace(before.strip(), after.strip(), 1)
+                elif change.is_story:
+                    updated = after if after.lstrip().startswith("### ") else f"{lines[start]}\n\n{after}"
+                else:
+                    updated = after if after.lstrip()[:1] in ("-", "*") else f"- **{key}**: {after.strip()}"
+
+                if not before and _normalize(updated) == _normalize(current):
+                    conflict(change, "already-applied", "the spec already matches After")
+                    continue
+
+                new_lines = updated.split("\n")
+                new_priority = NEW_PRIORITY.search("\n".join(change.lines))
+                if change.is_story and new_priority:
+                    new_lines[0] = PRIORITY.sub(f"(Priority: {new_priority.group(1)})", new_lines[0])
+                replacements[start] = (content_end, new_lines)
+
+        touched[key] = change.action
+        counts[change.action] += 1
+
+    if result.conflicts and not partial:
+        result.assigned_ids = {}
+        return result
+
+    output: List[str] = []
+    position = 0
+    while position <= len(lines):
+        output.extend(inserts.get(position, ()))
+        if position == len(lines):
+            break
+        if position in replacements:
+            end, new_lines = replacements[position]
+            if new_lines is not None:
+                output.extend(new_lines)
+            position = end
+            continue
+        output.append(lines[position])
+        position += 1
+
+    result.content = "\n".join(output) + ("\n" if spec_text.endswith("\n") or not spec_text else "")
+    result.additions, result.modifications, result.deletions = counts[ADD], counts[MODIFY], counts[DELETE]
+    return result
+
+
+def apply_delta(spec_path: Path, delta_path: Path, dry_run: bool = False, partial: bool = False) -> MergeResult:
+    """
+    Merge a delta file into a spec file, writing atomically on success.
+
+    Returns:
+        MergeResult (the spec is only written when there are no conflicts,
+        or when `partial` is set)
+    """
+    result = merge_delta(
+        spec_path.read_text(encoding="utf-8"),
+        delta_path.read_text(encoding="utf-8"),
+        partial=partial,
+    )
+    if not dry_run and (result.success or partial):
+        write_if_changed(spec_path, result.content)
+    return result
@@ -0,0 +1,214 @@
+"""Whole-project status of every NNN-* feature directory.
+
+Each feature's artifacts, task and checklist checkboxes are cached in
+.specify/.cache/status.json; features that changed are rescanned on a
+thread pool. A cached result is reused while the feature's stamp is
+unchanged: the mtimes of the feature directory, its checklists/ and
+contracts/ directories, and the size and mtime of tasks.md and each
+checklist. Directory mtimes only change when entries are added or removed,
+so the files that are read are stamped too.
+"""
+
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from custom_speckit.utils.file_manager import write_if_changed
+from custom_speckit.utils.workspace import feature_number
+
+CACHE_FILE = ".specify/.cache/status.json"
+DELTAS_DIR = ".specify/.deltas"
+STATUS_VERSION = 1
+
+# Threads only overlap reads on slow (network, cold) filesystems; on a warm
+# local disk the scan costs about the same at any setting
+DEFAULT_JOBS = 4
+
+# Feature documents reported as present or missing, in workflow order
+ARTIFACTS = ("spec.md", "plan.md", "research.md", "data-model.md", "contracts", "quickstart.md", "tasks.md")
+
+CHECKBOX = re.compile(r"^\s*[-*] \[([ xX])\]", re.MULTILINE)
+
+
+def count_checkboxes(text: str) -> Tuple[int, int]:
+    """Return (checked, total) for `- [ ]` / `- [x]` items."""
+    marks = CHECKBOX.findall(text)
+    return sum(1 for mark in marks if mark != " "), len(marks)
+
+
+def _stat_key(path: Path) -> Optional[List[int]]:
+    try:
+        stat_result = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return [stat_result.st_size, stat_result.st_mtime_ns]
+
+
+def _checklists(feature_dir: Path) -> List[str]:
+    try:
+        return sorted(
+            entry.name for entry in os.scandir(feature_dir / "checklists")
+            if entry.name.endswith(".md") and entry.is_file()
+        )
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def feature_stamp(feature_dir: Path) -> List:
+    """Cheap fingerprint of everything scan_feature looks at (stats only)."""
+    checklists_dir = feature_dir / "checklists"
+    return [
+        _stat_key(feature_dir),
+        _stat_key(feature_dir / "tasks.md"),
+        _stat_key(feature_dir / "contracts"),
+        _stat_key(checklists_dir),
+        [[name, _stat_key(checklists_dir / name)] for name in _checklists(feature_dir)],
+    ]
+
+
+def scan_feature(feature_dir: Path) -> Dict:
+    """
+    Report one feature's artifacts, task completion and checklist completion.
+
+    Returns:
+        Dict with "artifacts" (present names), "tasks" and "checklists"
+        ({"done", "total"}), and per-checklist counts
+    """
+    names = {entry.name: entry.is_dir() for entry in os.scandir(feature_dir)}
+    artifacts = []
+    for name in ARTIFACTS:
+        if name == "contracts":
+            if names.get(name) and any(os.scandir(feature_dir / name)):
+                artifacts.append(name)
+        elif name in names and not names[name]:
+            artifacts.append(name)
+
+    tasks_done = tasks_total = 0
+    if "tasks.md" in artifacts:
+        tasks_done, tasks_total = count_checkboxes((feature_dir / "tasks.md").read_text(encoding="utf-8"))
+
+    checklists = {}
+    for name in _checklists(feature_dir):
+        done, total = count_checkboxes((feature_dir / "checklists" / name).read_text(encoding="utf-8"))
+        checklists[name] = {"done": done, "total": total}
+
+    return {
+        "artifacts": artifacts,
+        "tasks": {"done": tasks_done, "total": tasks_total},
+        "checklists": {
+            "done": sum(item["done"] for item in checklists.values()),
+            "total": sum(item["total"] for item in checklists.values()),
+        },
+        "checklist_files": checklists,
+    }
+
+
+def feature_dirs(specs_dir: Path) -> List[Path]:
+    """NNN-* directories under the specs tree, sorted by name."""
+    try:
+        entries = list(os.scandir(specs_dir))
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    return sorted(
+        Path(entry.path) for entry in entries
+        if feature_number(entry.name) and entry.is_dir()
+    )
+
+
+def pending_deltas(project_root: Path) -> Dict[str, str]:
+    """Branch name -> project-relative delta-spec.md of every pending delta."""
+    deltas = {}
+    try:
+        entries = list(os.scandir(project_root / DELTAS_DIR))
+    except (FileNotFoundError, NotADirectoryError):
+        return deltas
+    for entry in sorted(entries, key=lambda e: e.name):
+        if entry.is_dir() and (Path(entry.path) / "delta-spec.md").is_file():
+            deltas[entry.name] = f"{DELTAS_DIR}/{entry.name}/delta-spec.md"
+    return deltas
+
+
+def _load_cache(project_root: Path) -> Dict[str, Dict]:
+    try:
+        cached = json.loads((project_root / CACHE_FILE).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if cached.get("version") != STATUS_VERSION:
+        return {}
+    return cached["features"]
+
+
+def collect_status(project_root: Path, jobs: int = DEFAULT_JOBS, use_cache: bool = True) -> Dict:
+    """
+    Scan every feature of a project, reusing cached results of unchanged ones.
+
+    Args:
+        project_root: Repository root (features live in <root>/specs/NNN-*)
+        jobs: Number of worker threads
+        use_cache: Read and update .specify/.cache/status.json
+
+    Returns:
+        Dict with "features" (name, path and scan_feature fields, plus
+        "deltas"), "duplicate_prefixes", "unmatched_deltas" and "cache_hits"
+    """
+    directories = feature_dirs(project_root / "specs")
+    cached = _load_cache(project_root) if use_cache else {}
+
+    # Stamps are a few stats each; only changed features are read, in parallel
+    entries: Dict[str, Dict] = {}
+    stale: List[Tuple[Path, List]] = []
+    for directory in directories:
+        stamp = feature_stamp(directory)
+        entry = cached.get(directory.name)
+        if entry is not None and entry["stamp"] == stamp:
+            entries[directory.name] = entry
+        else:
+            stale.append((directory, stamp))
+    cache_hits = len(entries)
+
+    if jobs <= 1 or len(stale) <= 1:
+        results = [scan_feature(directory) for directory, _ in stale]
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(scan_feature, [directory for directory, _ in stale]))
+    for (directory, stamp), result in zip(stale, results):
+        entries[directory.name] = {"stamp": stamp, "result": result}
+    if use_cache and entries != cached:
+        cache_path = project_root / CACHE_FILE
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_if_changed(cache_path, json.dumps({"version": STATUS_VERSION, "features": entries}))
+
+    # Deltas belong to the feature with their branch's numeric prefix
+    by_prefix: Dict[str, List[str]] = {}
+    for directory in directories:
+        by_prefix.setdefault(feature_number(directory.name), []).append(directory.name)
+    deltas = pending_deltas(project_root)
+    feature_deltas: Dict[str, List[str]] = {}
+    unmatched = []
+    for branch, delta_path in deltas.items():
+        matches = by_prefix.get(feature_number(branch) or "", [])
+        if branch in entries:
+            matches = [branch]
+        for name in matches:
+            feature_deltas.setdefault(name, []).append(delta_path)
+        if not matches:
+            unmatched.append(delta_path)
+
+    features = [
+        {
+            "name": directory.name,
+            "path": str(directory),
+            **entries[directory.name]["result"],
+            "deltas": feature_deltas.get(directory.name, []),
+        }
+        for directory in directories
+    ]
+    return {
+        "features": features,
+        "duplicate_prefixes": {prefix: names for prefix, names in sorted(by_prefix.items()) if len(names) > 1},
+        "unmatched_deltas": unmatched,
+        "cache_hits": cache_hits,
+    }
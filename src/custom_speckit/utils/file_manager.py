@@ -1,52 +1,344 @@
 """File management utilities for copying and updating templates."""
 
+import hashlib
+import os
 import shutil
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from datetime import datetime
 
+from custom_speckit.utils import tracing
+
+
+# User-owned directories (relative to .specify/) that are never treated as template content
+PRESERVED_DIRS = ("memory/", "specs/", "features/")
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Project paths kept out of version control (scratch space, backups, caches)
+GITIGNORE_ENTRIES = [
+    ".specify/.deltas/",
+    ".cursor/.agent-tools/",
+    ".specify/.backups/",
+    ".specify/.feature-index*",
+    ".specify/.cache/",
+    ".specify/.staging/",
+    ".specify/.transaction.json",
+]
+
+# Concurrent copies pay off on network filesystems; on local disks the thread
+# overhead outweighs the gain, so copies are serial unless --jobs is given
+DEFAULT_JOBS = 1
+
+
+# Install methods. "auto" tries a reflink, then a plain copy; hardlinks are
+# only made on request, and only for HARDLINK_DIRS: a hardlinked file shares
+# its inode with the packaged template (and every other project linked to
+# it), so editing it in place would change all of them.
+COPY = "copy"
+REFLINK = "reflink"
+HARDLINK = "hardlink"
+AUTO = "auto"
+LINK_MODES = (COPY, REFLINK, HARDLINK, AUTO)
+
+# Project-relative directories that may be hardlinked: tooling the workflow
+# runs but never edits (templates, commands and rules are meant to be customized)
+HARDLINK_DIRS = (".specify/scripts/",)
+
+# ioctl request number of FICLONE on Linux (btrfs, XFS, bcachefs, ...)
+FICLONE = 0x40049409
+
+
+def should_preserve(relative_path: str) -> bool:
+    """Check if a path (relative to .specify/) belongs to user-owned content."""
+    normalized = relative_path.replace("\\", "/")
+    return any(normalized.startswith(prefix) for prefix in PRESERVED_DIRS)
+
+
+def hash_file(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file, reading it in chunks."""
+    digest = hashlib.sha256()
+    size = 0
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            size += len(chunk)
+    tracing.count(tracing.BYTES_READ, size)
+    return digest.hexdigest()
+
+
+def stat_matches(stat_result, entry: Optional[Dict]) -> bool:
+    """
+    Check if a stat result still matches a manifest entry (size and mtime).
+
+    Only meaningful for files the entry was recorded from (installed files,
+    cached inputs); template files are compared by hash.
+    """
+    if not entry:
+        return False
+    matches = (
+        stat_result.st_size == entry.get("size")
+        and stat_result.st_mtime_ns == entry.get("mtime")
+    )
+    if matches:
+        tracing.count(tracing.OPS_AVOIDED)
+    return matches
+
+
+def files_differ(src_file: Path, dst_file: Path, entry: Optional[Dict] = None) -> bool:
+    """
+    Check whether a template file differs from its installed copy.
+    
+    The installed file's stat data is compared against the manifest entry
+    first, so it is only read when its size or mtime no longer match what
+    was recorded. The template file is always hashed: builds with fixed
+    mtimes (SOURCE_DATE_EPOCH) can change its content at the same size and
+    mtime.
+    
+    Args:
+        src_file: Template file
+        dst_file: Installed file
+        entry: Manifest entry of the installed file (sha256, size, mtime)
+        
+    Returns:
+        True if the contents differ
+    """
+    src_stat = src_file.stat()
+    dst_stat = dst_file.stat()
+    
+    if src_stat.st_size != dst_stat.st_size:
+        return True
+    
+    dst_hash = entry["sha256"] if stat_matches(dst_stat, entry) else hash_file(dst_file)
+    return hash_file(src_file) != dst_hash
+
+
+def _reflink(src_file: Path, dst_file: Path) -> None:
+    """Clone a file with FICLONE, sharing extents until either copy is written."""
+    import fcntl
+    
+    with src_file.open("rb") as src_f, dst_file.open("wb") as dst_f:
+        fcntl.ioctl(dst_f.fileno(), FICLONE, src_f.fileno())
+    shutil.copystat(src_file, dst_file)
+
+
+def break_link(dst_file: Path) -> None:
+    """Unlink a hardlinked destination so writing it cannot modify the shared inode."""
+    try:
+        if dst_file.stat().st_nlink > 1:
+            dst_file.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def unshare(path: Path) -> None:
+    """Give a hardlinked file its own inode (same content) before it is modified."""
+    if path.stat().st_nlink <= 1:
+        return
+    tmp = path.with_name(f".{path.name}.unshare")
+    shutil.copy2(path, tmp)
+    os.replace(tmp, path)
+
+
+def install_file(src_file: Path, dst_file: Path, link_mode: str = COPY) -> str:
+    """
+    Install a single file using the requested method, falling back to a copy.
+    
+    A hardlink is only attempted in HARDLINK mode; callers decide which
+    files may be linked (see HARDLINK_DIRS).
+    
+    Args:
+        src_file: Source file
+        dst_file: Destination file
+        link_mode: One of LINK_MODES
+        
+    Returns:
+        The method actually used (copy, reflink or hardlink)
+    """
+    break_link(dst_file)
+    tracing.count(tracing.FILES)
+    
+    if link_mode in (REFLINK, AUTO) and sys.platform.startswith("linux"):
+        try:
+            _reflink(src_file, dst_file)
+            tracing.count(tracing.OPS_AVOIDED)
+            return REFLINK
+        except OSError:
+            dst_file.unlink(missing_ok=True)
+    
+    if link_mode == HARDLINK:
+        try:
+            dst_file.unlink(missing_ok=True)
+            os.link(src_file, dst_file)
+            tracing.count(tracing.OPS_AVOIDED)
+            return HARDLINK
+        except OSError:
+            pass  # e.g. EXDEV across filesystems
+    
+    shutil.copy2(src_file, dst_file)
+    if tracing.enabled():
+        size = dst_file.stat().st_size
+        tracing.count(tracing.BYTES_READ, size)
+        tracing.count(tracing.BYTES_WRITTEN, size)
+    return COPY
+
+
+def copy_files(
+    pairs: Iterable[Tuple[Path, Path]],
+    jobs: int = 1,
+    link_mode: str = COPY,
+) -> Dict[Path, str]:
+    """
+    Install (src, dst) file pairs, optionally on a thread pool.
+    
+    Each destination directory is created once up front, so workers only
+    issue the copy itself. On network filesystems the per-file round trips
+    overlap when jobs > 1. Hardlinked destinations are unlinked before
+    being written, so the shared source is never modified.
+    
+    Args:
+        pairs: (source file, destination file) pairs
+        jobs: Number of worker threads (1 copies serially)
+        link_mode: One of LINK_MODES
+        
+    Returns:
+        Mapping of destination paths (in input order) to the method used
+    """
+    pairs = list(pairs)
+    
+    with tracing.span("mkdir"):
+        for directory in sorted({dst_file.parent for _, dst_file in pairs}):
+            directory.mkdir(parents=True, exist_ok=True)
+    
+    def install(pair: Tuple[Path, Path]) -> str:
+        return install_file(pair[0], pair[1], link_mode)
+    
+    with tracing.span("copy files", jobs=jobs, link_mode=link_mode):
+        if jobs <= 1 or len(pairs) <= 1:
+            methods = [install(pair) for pair in pairs]
+        else:
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                # list() re-raises the first copy error, if any
+                methods = list(executor.map(install, pairs))
+    
+    return {dst_file: method for (_, dst_file), method in zip(pairs, methods)}
+
 
 def copy_directory(
     src: Path,
     dst: Path,
     skip_existing: bool = False,
-) -> List[Path]:
+    jobs: int = 1,
+    link_mode: str = COPY,
+    files: Optional[Iterable[str]] = None,
+) -> Dict[Path, str]:
     """
     Copy directory recursively.
     
+    User-editable content (see PRESERVED_DIRS) is always copied, never
+    linked, so edits cannot leak back into the shared source. Hardlinks are
+    only made for files under HARDLINK_DIRS; in hardlink mode other files
+    are reflinked or copied.
+    
     Args:
         src: Source directory
         dst: Destination directory
         skip_existing: If True, skip files that already exist
+        jobs: Number of worker threads used for copying
+        link_mode: One of LINK_MODES
+        files: Paths relative to src to copy instead of walking it
+            (e.g. from the template index)
         
     Returns:
-        List of copied file paths
+        Mapping of copied file paths to the install method used
     """
-    copied_files = []
+    pairs = []
+    private_pairs = []
+    linkable_pairs = []
     
-    for src_file in src.rglob("*"):
-        if src_file.is_file():
-            relative_path = src_file.relative_to(src)
-            dst_file = dst / relative_path
-            
-            # Skip existing files if requested
-            if skip_existing and dst_file.exists():
-                continue
-            
-            # Create parent directory
-            dst_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Copy file
-            shutil.copy2(src_file, dst_file)
-            copied_files.append(dst_file)
+    if files is None:
+        with tracing.span("walk template", path=str(src)):
+            files = [
+                src_file.relative_to(src).as_posix()
+                for src_file in src.rglob("*")
+                if src_file.is_file()
+            ]
+    
+    for relative_path in files:
+        src_file = src / relative_path
+        dst_file = dst / relative_path
+        
+        # Skip existing files if requested
+        if skip_existing and dst_file.exists():
+            continue
+        
+        if should_preserve(relative_path):
+            private_pairs.append((src_file, dst_file))
+        elif f"{dst.name}/{relative_path}".startswith(HARDLINK_DIRS):
+            linkable_pairs.append((src_file, dst_file))
+        else:
+            pairs.append((src_file, dst_file))
     
-    return copied_files
+    copied = copy_files(pairs, jobs, AUTO if link_mode == HARDLINK else link_mode)
+    copied.update(copy_files(linkable_pairs, jobs, link_mode))
+    copied.update(copy_files(private_pairs, jobs))
+    return copied
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """
+    Atomically replace a file's content unless it is already identical.
+
+    Returns:
+        True if the file was written
+    """
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            tracing.count(tracing.OPS_AVOIDED)
+            return False
+        mode = path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = None
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        if mode is not None:
+            os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    tracing.count(tracing.BYTES_WRITTEN, len(content.encode("utf-8")))
+    return True
+
+
+def make_scripts_executable(scripts_dir: Path) -> None:
+    """
+    Mark shell scripts executable, skipping ones that already are.
+
+    A hardlinked script that needs the chmod gets its own inode first, so
+    the packaged copy's mode is never changed.
+    """
+    for script in scripts_dir.glob("*.sh"):
+        if script.stat().st_mode & 0o755 != 0o755:
+            unshare(script)
+            script.chmod(0o755)
+        else:
+            tracing.count(tracing.OPS_AVOIDED)
 
 
 def sync_directory(
     src: Path,
     dst: Path,
     previous_files: Set[str] = None,
+    entries: Optional[Dict[str, Dict]] = None,
+    jobs: int = 1,
 ) -> tuple[List[Path], List[Path], List[Path]]:
     """
     Sync directory with template (add, update, remove).
@@ -55,55 +347,16 @@ def sync_directory(
         src: Source directory (template)
         dst: Destination directory (project)
         previous_files: Set of previously installed file paths (relative to dst)
+        entries: Manifest entries of installed files (relative to dst), used to
+            skip reading files whose stat data is unchanged
+        jobs: Number of worker threads used for copying
         
     Returns:
         Tuple of (added_files, updated_files, removed_files)
     """
-    added = []
-    updated = []
-    removed = []
+    from custom_speckit.utils.sync_plan import apply_plan, plan_directory
     
-    # Get all files in template
-    template_files = set()
-    for src_file in src.rglob("*"):
-        if src_file.is_file():
-            relative_path = src_file.relative_to(src)
-            template_files.add(str(relative_path))
-    
-    # Copy/update files from template
-    for src_file in src.rglob("*"):
-        if src_file.is_file():
-            relative_path = src_file.relative_to(src)
-            dst_file = dst / relative_path
-            
-            # Create parent directory
-            dst_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            if dst_file.exists():
-                # Check if file changed
-                if src_file.read_bytes() != dst_file.read_bytes():
-                    shutil.copy2(src_file, dst_file)
-                    updated.append(dst_file)
-            else:
-                # New file
-                shutil.copy2(src_file, dst_file)
-                added.append(dst_file)
-    
-    # Remove files that were in previous version but not in current template
-    if previous_files:
-        for prev_file in previous_files:
-            if prev_file not in template_files:
-                file_path = dst / prev_file
-                if file_path.exists():
-                    file_path.unlink()
-                    removed.append(file_path)
-                    # Remove empty parent directories
-                    try:
-                        file_path.parent.rmdir()
-                    except OSError:
-                        pass  # Directory not empty
-    
-    return added, updated, removed
+    return apply_plan(plan_directory(src, dst, previous_files, entries), jobs)
 
 
 def backup_file(file_path: Path) -> Path:
@@ -124,13 +377,19 @@ def backup_directory(directory: Path) -> Path:
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_path = directory.parent / f"{directory.name}_backup_{timestamp}"
-    shutil.copytree(directory, backup_path)
+    with tracing.span("backup directory", path=str(directory)):
+        shutil.copytree(directory, backup_path)
     return backup_path
 
 
-def get_changed_files(src: Path, dst: Path) -> List[Path]:
+def get_changed_files(
+    src: Path,
+    dst: Path,
+    entries: Optional[Dict[str, Dict]] = None,
+) -> List[Path]:
     """Get list of files that would be changed during update."""
     changed = []
+    entries = entries or {}
     
     for src_file in src.rglob("*"):
         if src_file.is_file():
@@ -144,7 +403,7 @@ def get_changed_files(src: Path, dst: Path) -> List[Path]:
             # Check if file doesn't exist or is different
             if not dst_file.exists():
                 changed.append(dst_file)
-            elif src_file.read_bytes() != dst_file.read_bytes():
+            elif files_differ(src_file, dst_file, entries.get(str(relative_path))):
                 changed.append(dst_file)
     
     return changed
@@ -156,8 +415,7 @@ def ensure_gitignore(project_root: Path) -> None:
     
     required_entries = [
         "# Custom Speckit - Temporary Files",
-        ".specify/.deltas/",
-        ".cursor/.agent-tools/",
+        *GITIGNORE_ENTRIES,
     ]
     
     if not gitignore_path.exists():
@@ -167,21 +425,15 @@ def ensure_gitignore(project_root: Path) -> None:
     content = gitignore_path.read_text()
     lines = content.splitlines()
     
-    # Check if entries already exist
-    has_deltas = any(".specify/.deltas/" in line for line in lines)
-    has_agent_tools = any(".cursor/.agent-tools/" in line for line in lines)
+    # Check which entries already exist
+    missing = [entry for entry in GITIGNORE_ENTRIES if not any(entry in line for line in lines)]
     
-    if not has_deltas or not has_agent_tools:
+    if missing:
         # Add missing entries
         new_lines = lines.copy()
-        if not has_deltas or not has_agent_tools:
-            new_lines.append("")
-            if not any("Custom Speckit" in line for line in lines):
-                new_lines.append("# Custom Speckit - Temporary Files")
-            if not has_deltas:
-                new_lines.append(".specify/.deltas/")
-            if not has_agent_tools:
-                new_lines.append(".cursor/.agent-tools/")
+        new_lines.append("")
+        if not any("Custom Speckit" in line for line in lines):
+            new_lines.append("# Custom Speckit - Temporary Files")
+        new_lines.extend(missing)
         
         gitignore_path.write_text("\n".join(new_lines) + "\n")
-
@@ -0,0 +1,426 @@
+"""Incremental linter for spec, plan, task and checklist files.
+
+The machine-checkable parts of the project's templates and constitution are
+compiled into rules once:
+
+    placeholders          template placeholders ([FEATURE NAME], [DATE], ...)
+                          that must not survive into a filled-in document
+    sections              `## ... *(mandatory)*` sections of each template,
+                          plus the plan's Constitution Check once the
+                          constitution defines principles
+    clarification_limit   "Maximum N [NEEDS CLARIFICATION] markers" from
+                          speckit.specify.md
+    id_width              digits of FR-001, SC-001, T001, CHK001 style IDs
+    principles            constitution principles the Constitution Check
+                          must address
+
+Rules and per-file findings are cached in .specify/.cache/lint.json. A file
+is re-linted only if its content or the rules changed; unchanged files are
+recognized by size and mtime without being read.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from custom_speckit.utils.file_manager import stat_matches, write_if_changed
+from custom_speckit.utils.workspace import feature_number
+
+CACHE_FILE = ".specify/.cache/lint.json"
+LINT_VERSION = 1
+
+ERROR = "error"
+WARNING = "warning"
+
+SPEC = "spec"
+PLAN = "plan"
+TASKS = "tasks"
+CHECKLIST = "checklist"
+CONSTITUTION = "constitution"
+
+CONSTITUTION_FILE = ".specify/memory/constitution.md"
+
+# Files the rules are compiled from (project copies, so customizations apply)
+TEMPLATES = {
+    SPEC: ".specify/templates/spec-template.md",
+    PLAN: ".specify/templates/plan-template.md",
+    TASKS: ".specify/templates/tasks-template.md",
+    CHECKLIST: ".specify/templates/checklist-template.md",
+}
+SPECIFY_COMMAND = ".cursor/commands/speckit.specify.md"
+RULE_SOURCES = (CONSTITUTION_FILE, *TEMPLATES.values(), SPECIFY_COMMAND)
+
+DEFAULT_CLARIFICATION_LIMIT = 3
+CONSTITUTION_CHECK = "Constitution Check"
+
+HTML_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+FENCED_CODE = re.compile(r"^(\s*)(```|~~~).*?^\1\2", re.DOTALL | re.MULTILINE)
+INLINE_CODE = re.compile(r"`[^`\n]*`")
+BRACKETED = re.compile(r"\[[^\[\]\n]{1,80}\](?!\()")
+# Task-format notation that filled-in documents keep
+NOTATION = re.compile(r"\[(?: |x|X|P\??|US\d+|ID|Story|NEEDS CLARIFICATION[^\]]*)\]")
+NEEDS_CLARIFICATION = re.compile(r"\[NEEDS CLARIFICATION[^\]]*\]")
+CONSTITUTION_PLACEHOLDER = re.compile(r"\[[A-Z][A-Z0-9_]+\]")
+CLARIFICATION_LIMIT = re.compile(r"Maximum (\d+) \[NEEDS CLARIFICATION\]", re.IGNORECASE)
+MANDATORY = re.compile(r"^##\s+(.*?)\s*\*\(mandatory\)\*", re.MULTILINE)
+TEMPLATE_ID = re.compile(r"\b(FR|SC|NFR|CHK|T)-?(\d{2,})\b")
+SPEC_ID = re.compile(r"^\s*[-*]\s+\*\*([A-Z]{2,4})-((?:[A-Z]+-)?)(\d+)\*\*")
+CHECKBOX_ID = re.compile(r"^\s*[-*] \[[ xX]\] ([A-Z]{1,4})(\d+)\b")
+STORY_HEADING = re.compile(r"^###\s+User Story (\d+)\b")
+HANGUL = re.compile(r"[가-힣]")
+PRINCIPLE_PREFIX = re.compile(r"^(?:[IVXLC]+|\d+)\.\s*")
+NON_NEGOTIABLE = re.compile(r"\s*\(NON-NEGOTIABLE\)\s*", re.IGNORECASE)
+
+
+def _hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _blank(match: "re.Match") -> str:
+    """Replace a match with its newlines only, so line numbers are kept."""
+    return "\n" * match.group(0).count("\n")
+
+
+def prose(text: str) -> str:
+    """Text without comments and code, line numbers unchanged."""
+    text = HTML_COMMENT.sub(_blank, text)
+    text = FENCED_CODE.sub(_blank, text)
+    return INLINE_CODE.sub("", text)
+
+
+def _line(text: str, offset: int) -> int:
+    return text.count("\n", 0, offset) + 1
+
+
+def _sections(text: str) -> List[str]:
+    """`##` heading texts of a document, outside comments and code."""
+    return [line[3:].strip() for line in prose(text).splitlines() if line.startswith("## ")]
+
+
+def _principles(constitution: str) -> List[Dict]:
+    """`###` principles under the constitution's first `##` section, once filled in."""
+    principles = []
+    in_core = False
+    for line in prose(constitution).splitlines():
+        if line.startswith("## "):
+            if principles or in_core:
+                break
+            in_core = True
+        elif in_core and line.startswith("### "):
+            title = line[4:].strip()
+            if CONSTITUTION_PLACEHOLDER.search(title):
+                continue  # still the template
+            principles.append({
+                "name": PRINCIPLE_PREFIX.sub("", NON_NEGOTIABLE.sub("", title)).strip(),
+                "non_negotiable": bool(NON_NEGOTIABLE.search(title)),
+            })
+    return principles
+
+
+def compile_rules(sources: Dict[str, Optional[str]]) -> Dict:
+    """
+    Compile lint rules from the templates, the constitution and speckit.specify.md.
+
+    Args:
+        sources: Text of each RULE_SOURCES path (None if missing)
+
+    Returns:
+        JSON-serializable rules (see the module docstring)
+    """
+    placeholders: Dict[str, List[str]] = {}
+    sections: Dict[str, List[str]] = {}
+    id_width: Dict[str, int] = {}
+    for kind, relative in TEMPLATES.items():
+        template = sources.get(relative)
+        if template is None:
+            continue
+        text = prose(template)
+        placeholders[kind] = sorted({
+            token for token in BRACKETED.findall(text) if not NOTATION.fullmatch(token)
+        })
+        sections[kind] = [name.strip() for name in MANDATORY.findall(HTML_COMMENT.sub("", template))]
+        for prefix, digits in TEMPLATE_ID.findall(template):
+            id_width.setdefault(prefix, len(digits))
+
+    principles = _principles(sources.get(CONSTITUTION_FILE) or "")
+    if principles:
+        sections.setdefault(PLAN, []).append(CONSTITUTION_CHECK)
+
+    limit = DEFAULT_CLARIFICATION_LIMIT
+    match = CLARIFICATION_LIMIT.search(sources.get(SPECIFY_COMMAND) or "")
+    if match:
+        limit = int(match.group(1))
+
+    return {
+        "placeholders": placeholders,
+        "sections": sections,
+        "clarification_limit": limit,
+        "id_width": id_width,
+        "principles": principles,
+    }
+
+
+def _finding(line: int, severity: str, rule: str, message: str) -> Dict:
+    return {"line": line, "severity": severity, "rule": rule, "message": message}
+
+
+def _check_placeholders(text: str, tokens: List[str]) -> List[Dict]:
+    if not tokens:
+        return []
+    pattern = re.compile("|".join(re.escape(token) for token in sorted(tokens, key=len, reverse=True)))
+    return [
+        _finding(_line(text, match.start()), ERROR, "placeholder", f"Unfilled template placeholder {match.group(0)}")
+        for match in pattern.finditer(text)
+    ]
+
+
+def _check_sections(text: str, required: List[str]) -> List[Dict]:
+    headings = _sections(text)
+    # Documents are written in the user's language; only English headings are checked
+    if not required or any(HANGUL.search(heading) for heading in headings):
+        return []
+    lowered = [heading.lower() for heading in headings]
+    return [
+        _finding(1, ERROR, "missing-section", f"Missing required section '## {name}'")
+        for name in required
+        if not any(heading.startswith(name.lower()) for heading in lowered)
+    ]
+
+
+def _width_finding(number: int, entry_id: str, separator: str, prefix: str, digits: str, width: int) -> Dict:
+    expected = f"{prefix}{separator}{int(digits):0{width}d}"
+    return _finding(number, ERROR, "id-format", f"{entry_id} should have {width} digits ({expected})")
+
+
+def _check_ids(text: str, kind: str, id_width: Dict[str, int]) -> List[Dict]:
+    findings = []
+    seen: Dict[str, int] = {}
+    for number, line in enumerate(text.splitlines(), start=1):
+        if kind == SPEC:
+            story = STORY_HEADING.match(line)
+            match = SPEC_ID.match(line)
+            if story:
+                entry_id = f"User Story {story.group(1)}"
+            elif match:
+                prefix, infix, digits = match.groups()
+                entry_id = f"{prefix}-{infix}{digits}"
+                if infix:
+                    message = f"{entry_id} is delta notation; merge the delta instead"
+                    findings.append(_finding(number, ERROR, "id-format", message))
+                elif prefix in id_width and len(digits) != id_width[prefix]:
+                    findings.append(_width_finding(number, entry_id, "-", prefix, digits, id_width[prefix]))
+            else:
+                continue
+        else:
+            match = CHECKBOX_ID.match(line)
+            if not match or match.group(1) not in id_width:
+                continue
+            prefix, digits = match.groups()
+            entry_id = f"{prefix}{digits}"
+            if len(digits) != id_width[prefix]:
+                findings.append(_width_finding(number, entry_id, "", prefix, digits, id_width[prefix]))
+        if entry_id in seen:
+            message = f"{entry_id} is already defined on line {seen[entry_id]}"
+            findings.append(_finding(number, ERROR, "duplicate-id", message))
+        else:
+            seen[entry_id] = number
+    return findings
+
+
+def _check_constitution_gate(text: str, principles: List[Dict]) -> List[Dict]:
+    """Each principle must be addressed in the plan's Constitution Check."""
+    lines = prose(text).splitlines()
+    start = next((i for i, line in enumerate(lines) if line.startswith(f"## {CONSTITUTION_CHECK}")), None)
+    if start is None:
+        return []  # reported by the section rule
+    end = next((i for i in range(start + 1, len(lines)) if lines[i].startswith(("# ", "## "))), len(lines))
+    gate = "\n".join(lines[start:end]).lower()
+    return [
+        _finding(
+            start + 1,
+            ERROR if principle["non_negotiable"] else WARNING,
+            "constitution-gate",
+            f"Constitution Check does not address principle '{principle['name']}'",
+        )
+        for principle in principles
+        if principle["name"].lower() not in gate
+    ]
+
+
+def lint_text(text: str, kind: str, rules: Dict) -> List[Dict]:
+    """
+    Lint one document against compiled rules.
+
+    Args:
+        text: Document content
+        kind: SPEC, PLAN, TASKS, CHECKLIST or CONSTITUTION
+        rules: Result of compile_rules
+
+    Returns:
+        Findings sorted by line
+    """
+    if kind == CONSTITUTION:
+        visible = prose(text)
+        return [
+            _finding(_line(visible, match.start()), WARNING, "placeholder", f"Unfilled field {match.group(0)}")
+            for match in CONSTITUTION_PLACEHOLDER.finditer(visible)
+        ]
+
+    visible = prose(text)
+    findings = _check_placeholders(visible, rules["placeholders"].get(kind, []))
+    findings += _check_sections(text, rules["sections"].get(kind, []))
+    findings += _check_ids(visible, kind, rules["id_width"])
+
+    if kind == SPEC:
+        markers = [match.start() for match in NEEDS_CLARIFICATION.finditer(visible)]
+        if len(markers) > rules["clarification_limit"]:
+            findings.append(_finding(
+                _line(visible, markers[rules["clarification_limit"]]), ERROR, "clarification-limit",
+                f"{len(markers)} [NEEDS CLARIFICATION] markers (at most {rules['clarification_limit']})",
+            ))
+    if kind == PLAN and rules["principles"]:
+        findings += _check_constitution_gate(text, rules["principles"])
+    return sorted(findings, key=lambda finding: finding["line"])
+
+
+def classify(relative: str) -> Optional[str]:
+    """Kind of a project-relative path, or None if it is not linted."""
+    path = Path(relative)
+    if relative == CONSTITUTION_FILE:
+        return CONSTITUTION
+    if path.suffix != ".md" or relative.startswith(".specify/templates/"):
+        return None
+    if path.parent.name == "checklists":
+        return CHECKLIST
+    return {"spec.md": SPEC, "plan.md": PLAN, "tasks.md": TASKS}.get(path.name)
+
+
+def discover(project_root: Path) -> List[str]:
+    """Project-relative paths of every document the linter checks."""
+    found = []
+    for relative in (".specify/specs/spec.md", CONSTITUTION_FILE):
+        if (project_root / relative).is_file():
+            found.append(relative)
+
+    roots = [project_root / ".specify" / "features"]
+    try:
+        roots += [
+            Path(entry.path) for entry in os.scandir(project_root / "specs")
+            if feature_number(entry.name) and entry.is_dir()
+        ]
+    except FileNotFoundError:
+        pass
+    for root in roots:
+        for directory, dirs, names in os.walk(root):
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            for name in names:
+                relative = (Path(directory) / name).relative_to(project_root).as_posix()
+                if classify(relative):
+                    found.append(relative)
+    return sorted(set(found))
+
+
+def _load_cache(project_root: Path) -> Dict:
+    try:
+        cache = json.loads((project_root / CACHE_FILE).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return cache if cache.get("version") == LINT_VERSION else {}
+
+
+def _stat(path: Path):
+    try:
+        return path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _load_rules(project_root: Path, cached: Dict) -> Tuple[Dict, bool]:
+    """Compiled rules, recompiled only if a rule source changed. Returns (rules, reused)."""
+    recorded = cached.get("inputs", {})
+    stats = {relative: _stat(project_root / relative) for relative in RULE_SOURCES}
+    if cached and set(recorded) == set(stats) and all(
+        recorded[relative] is None if stat is None else stat_matches(stat, recorded[relative])
+        for relative, stat in stats.items()
+    ):
+        return cached, True
+
+    sources: Dict[str, Optional[str]] = {}
+    inputs: Dict[str, Optional[Dict]] = {}
+    for relative, stat in stats.items():
+        if stat is None:
+            sources[relative] = inputs[relative] = None
+            continue
+        data = (project_root / relative).read_bytes()
+        sources[relative] = data.decode("utf-8", errors="replace")
+        inputs[relative] = {"sha256": _hash(data), "size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+    key = _hash(json.dumps([LINT_VERSION, sorted((k, v and v["sha256"]) for k, v in inputs.items())]).encode())
+    if cached.get("key") == key:
+        return {**cached, "inputs": inputs}, True
+    return {"key": key, "inputs": inputs, "compiled": compile_rules(sources)}, False
+
+
+def lint_project(
+    project_root: Path,
+    files: Optional[Iterable[str]] = None,
+    use_cache: bool = True,
+) -> Dict:
+    """
+    Lint the project's documents, reusing cached results of unchanged files.
+
+    Args:
+        project_root: Repository root
+        files: Project-relative paths to lint (default: everything discover finds);
+            paths the linter does not check are skipped
+        use_cache: Read and update .specify/.cache/lint.json
+
+    Returns:
+        Dict with "files" (path -> findings), "linted" (paths actually read
+        and checked) and "rules_recompiled"
+    """
+    cache = _load_cache(project_root) if use_cache else {}
+    rules, reused = _load_rules(project_root, cache.get("rules", {}))
+    compiled = rules["compiled"]
+    cached_files: Dict[str, Dict] = cache.get("files", {}) if reused else {}
+
+    targets = discover(project_root) if files is None else sorted({f for f in files if classify(f)})
+    results: Dict[str, List[Dict]] = {}
+    # Linting a subset keeps the other files' results, unless the rules changed
+    entries: Dict[str, Dict] = dict(cached_files) if files is not None else {}
+    linted = []
+    for relative in targets:
+        path = project_root / relative
+        stat = _stat(path)
+        if stat is None:
+            entries.pop(relative, None)
+            continue
+        entry = cached_files.get(relative)
+        if entry is not None and stat_matches(stat, entry):
+            results[relative] = entries[relative] = entry
+            continue
+        data = path.read_bytes()
+        sha256 = _hash(data)
+        if entry is not None and entry["sha256"] == sha256:
+            findings = entry["findings"]
+        else:
+            findings = lint_text(data.decode("utf-8", errors="replace"), classify(relative), compiled)
+            linted.append(relative)
+        entries[relative] = {"sha256": sha256, "size": stat.st_size, "mtime": stat.st_mtime_ns, "findings": findings}
+        results[relative] = entries[relative]
+
+    if use_cache:
+        document = {"version": LINT_VERSION, "rules": rules, "files": entries}
+        if document != cache:
+            cache_path = project_root / CACHE_FILE
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            write_if_changed(cache_path, json.dumps(document, ensure_ascii=False))
+
+    return {
+        "files": {relative: entry["findings"] for relative, entry in results.items()},
+        "linted": linted,
+        "rules_recompiled": not reused,
+    }
@@ -0,0 +1,277 @@
+"""Section-level diff between two versions of a spec.
+
+A spec is split into sections with stable anchors: `User Story N` and
+requirement IDs (`FR-001`, `SC-002`, ...) anchor on their ID, every other
+heading anchors on its heading path (`requirements/key-entities`). Each
+section records its hash and byte ranges, so a diff compares hashes and only
+reads the text of sections that were added, changed or removed.
+
+Sections of the base spec are cached in .specify/.cache/spec-sections.json
+and reused while the spec's size/mtime (then hash) are unchanged.
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from custom_speckit.utils.delta_merge import SPEC_HEADING, SPEC_ITEM, STORY
+from custom_speckit.utils.file_manager import stat_matches, write_if_changed
+from custom_speckit.utils.spec_index import CACHE_DIR
+
+SECTIONS_FILE = f"{CACHE_DIR}/spec-sections.json"
+SECTIONS_VERSION = 1
+
+HEADING_KIND = "heading"
+STORY_KIND = "story"
+ITEM_KIND = "item"
+
+ADDED = "added"
+CHANGED = "changed"
+REMOVED = "removed"
+
+
+def _slug(title: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-") or "section"
+
+
+def _section_text(data: bytes, ranges: List[List[int]]) -> str:
+    return b"".join(data[start:end] for start, end in ranges).decode("utf-8")
+
+
+def _section_hash(text: str) -> str:
+    # Trailing whitespace and blank lines are layout, not content
+    normalized = "\n".join(line.rstrip() for line in text.strip("\n").splitlines())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def split_sections(data: bytes) -> List[Dict]:
+    """
+    Split a spec into anchored sections in one pass over its lines.
+
+    Args:
+        data: Raw spec bytes
+
+    Returns:
+        Sections in document order, each {anchor, kind, title, line,
+        ranges, sha256}; ranges are [start, end) byte offsets (a heading's
+        own text may be interrupted by the stories and items below it)
+    """
+    sections: List[Dict] = []
+    anchors: Dict[str, int] = {}
+    path: List[Tuple[int, str]] = []
+    heading: Optional[Dict] = None
+    current: Optional[Dict] = None
+    offset = 0
+
+    def start(anchor: str, kind: str, title: str, number: int) -> Dict:
+        count = anchors.get(anchor, 0) + 1
+        anchors[anchor] = count
+        section = {
+            "anchor": anchor if count == 1 else f"{anchor}~{count}",
+            "kind": kind,
+            "title": title,
+            "line": number,
+            "ranges": [],
+        }
+        sections.append(section)
+        return section
+
+    for number, raw in enumerate(data.decode("utf-8").splitlines(keepends=True), start=1):
+        line = raw.rstrip("\r\n")
+        begin = offset
+        offset += len(raw.encode("utf-8"))
+        match = SPEC_HEADING.match(line)
+        level = len(match.group(1)) if match else 0
+
+        if current is not None and current["kind"] == STORY_KIND:
+            if match and level <= 3:
+                current = None
+        elif current is not None and current["kind"] == ITEM_KIND:
+            indent = len(line) - len(line.lstrip())
+            if not line.strip() or match or indent <= current["_indent"]:
+                current = heading
+
+        if match and (current is None or current["kind"] != STORY_KIND):
+            title = line.lstrip("#").strip()
+            story = STORY.search(line)
+            if level == 3 and story:
+                current = start(f"User Story {story.group(1)}", STORY_KIND, title, number)
+            else:
+                path = [(lvl, slug) for lvl, slug in path if lvl < level] + [(level, _slug(title))]
+                heading = current = start("/".join(slug for _, slug in path), HEADING_KIND, title, number)
+        elif not match and (current is None or current["kind"] != STORY_KIND):
+            item = SPEC_ITEM.match(line)
+            if item:
+                _, _, rest = line.partition("**:")
+                current = start(item.group(2), ITEM_KIND, rest.strip(), number)
+                current["_indent"] = len(item.group(1))
+
+        if current is None:
+            current = heading = start("preamble", HEADING_KIND, "", number)
+        ranges = current["ranges"]
+        if ranges and ranges[-1][1] == begin:
+            ranges[-1][1] = offset
+        else:
+            ranges.append([begin, offset])
+
+    for section in sections:
+        section.pop("_indent", None)
+        section["sha256"] = _section_hash(_section_text(data, section["ranges"]))
+    return sections
+
+
+def load_sections(spec_path: Path, cache_path: Path) -> List[Dict]:
+    """Return the spec's sections, re-splitting only if the spec changed."""
+    stat = spec_path.stat()
+    cached: Dict = {}
+    try:
+        cached = json.loads(cache_path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    if cached.get("version") != SECTIONS_VERSION or cached.get("path") != str(spec_path):
+        cached = {}
+
+    if cached and stat_matches(stat, cached["spec"]):
+        return cached["sections"]
+
+    data = spec_path.read_bytes()
+    sha256 = hashlib.sha256(data).hexdigest()
+    if cached and cached["spec"].get("sha256") == sha256:
+        sections = cached["sections"]
+    else:
+        sections = split_sections(data)
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    write_if_changed(cache_path, json.dumps({
+        "version": SECTIONS_VERSION,
+        "path": str(spec_path),
+        "spec": {"sha256": sha256, "size": stat.st_size, "mtime": stat.st_mtime_ns},
+        "sections": sections,
+    }))
+    return sections
+
+
+SectionReader = Callable[[Dict], str]
+
+
+def bytes_reader(data: bytes) -> SectionReader:
+    """Read section text from an in-memory document."""
+    return lambda section: _section_text(data, section["ranges"])
+
+
+def file_reader(path: Path) -> SectionReader:
+    """Read section text by seeking to its byte ranges in a file."""
+    def read(section: Dict) -> str:
+        with open(path, "rb") as f:
+            chunks = []
+            for start, end in section["ranges"]:
+                f.seek(start)
+                chunks.append(f.read(end - start))
+        return b"".join(chunks).decode("utf-8")
+    return read
+
+
+def diff_sections(
+    old_sections: List[Dict],
+    new_sections: List[Dict],
+    old_reader: Optional[SectionReader] = None,
+    new_reader: Optional[SectionReader] = None,
+) -> List[Dict]:
+    """
+    Compare two section lists by anchor and hash.
+
+    Args:
+        old_sections: Sections of the base version
+        new_sections: Sections of the new version
+        old_reader: Include the old text of changed/removed sections
+        new_reader: Include the new text of added/changed sections
+
+    Returns:
+        Changes in document order, each {change, anchor, kind, title,
+        old_line, new_line, old_text?, new_text?}
+    """
+    old_by_anchor = {section["anchor"]: section for section in old_sections}
+    new_anchors = {section["anchor"] for section in new_sections}
+    changes: List[Dict] = []
+
+    def entry(change: str, old: Optional[Dict], new: Optional[Dict]) -> Dict:
+        section = new or old
+        result = {
+            "change": change,
+            "anchor": section["anchor"],
+            "kind": section["kind"],
+            "title": section["title"],
+            "old_line": old["line"] if old else None,
+            "new_line": new["line"] if new else None,
+        }
+        if old and old_reader:
+            result["old_text"] = old_reader(old)
+        if new and new_reader:
+            result["new_text"] = new_reader(new)
+        return result
+
+    for section in new_sections:
+        old = old_by_anchor.get(section["anchor"])
+        if old is None:
+            changes.append(entry(ADDED, None, section))
+        elif old["sha256"] != section["sha256"]:
+            changes.append(entry(CHANGED, old, section))
+    for section in old_sections:
+        if section["anchor"] not in new_anchors:
+            changes.append(entry(REMOVED, section, None))
+    return changes
+
+
+def summarize(changes: List[Dict]) -> Dict[str, int]:
+    counts = {ADDED: 0, CHANGED: 0, REMOVED: 0}
+    for change in changes:
+        counts[change["change"]] += 1
+    return counts
+
+
+def diff_spec(
+    spec_path: Path,
+    cache_path: Path,
+    delta_path: Optional[Path] = None,
+    against: Optional[Path] = None,
+    include_text: bool = True,
+) -> Tuple[List[Dict], List[Dict[str, str]]]:
+    """
+    Diff a spec against a delta (as it would merge) or another spec version.
+
+    Args:
+        spec_path: Base spec (its sections are cached at cache_path)
+        cache_path: Section cache for the base spec
+        delta_path: delta-spec.md to merge in memory
+        against: Full new version of the spec
+        include_text: Include old/new section text in the changes
+
+    Returns:
+        Tuple of (changes, merge conflicts); changes from a delta reflect
+        only the parts of it that merge cleanly
+    """
+    from custom_speckit.utils.delta_merge import merge_delta
+
+    old_sections = load_sections(spec_path, cache_path)
+    conflicts: List[Dict[str, str]] = []
+    if delta_path is not None:
+        result = merge_delta(
+            spec_path.read_text(encoding="utf-8"),
+            delta_path.read_text(encoding="utf-8"),
+            partial=True,
+        )
+        conflicts = result.conflicts
+        new_data = result.content.encode("utf-8")
+    elif against is not None:
+        new_data = against.read_bytes()
+    else:
+        raise ValueError("Either delta_path or against is required")
+
+    return diff_sections(
+        old_sections,
+        split_sections(new_data),
+        file_reader(spec_path) if include_text else None,
+        bytes_reader(new_data) if include_text else None,
+    ), conflicts
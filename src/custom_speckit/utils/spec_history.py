@@ -0,0 +1,294 @@
+"""Compressed, delta-encoded history of approved spec.md versions.
+
+Replaces the full copies in .specify/specs/.backups/. Each recorded revision
+is stored in .specify/specs/.history/ as either
+
+- a full snapshot (zlib), every SNAPSHOT_INTERVAL revisions, or
+- a line delta against the previous revision: copy ranges of its lines plus
+  inserted text, as zlib-compressed JSON.
+
+Reconstructing a revision therefore reads one snapshot and at most
+SNAPSHOT_INTERVAL - 1 small deltas, however long the history is. A revision
+whose content was recorded before (a restore, an unchanged re-approval)
+reuses the existing object instead of storing anything.
+"""
+
+import difflib
+import hashlib
+import json
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from custom_speckit.utils.file_manager import write_if_changed
+
+HISTORY_DIR = ".specify/specs/.history"
+INDEX_FILE = f"{HISTORY_DIR}/index.json"
+OBJECTS_DIR = f"{HISTORY_DIR}/objects"
+LEGACY_BACKUP_DIR = ".specify/specs/.backups"
+HISTORY_VERSION = 1
+SNAPSHOT_INTERVAL = 16
+
+FULL = "full"
+DELTA = "delta"
+
+Op = Union[List[int], str]
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_history(project_root: Path) -> List[Dict]:
+    """Return the recorded revisions, oldest first."""
+    try:
+        index = json.loads((project_root / INDEX_FILE).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+    if index.get("version") != HISTORY_VERSION:
+        return []
+    return index["revisions"]
+
+
+def _save_history(project_root: Path, revisions: List[Dict]) -> None:
+    write_if_changed(project_root / INDEX_FILE, json.dumps({
+        "version": HISTORY_VERSION,
+        "revisions": revisions,
+    }, indent=1))
+
+
+def encode_delta(old: bytes, new: bytes) -> Optional[List[Op]]:
+    """
+    Describe `new` as line ranges copied from `old` plus inserted text.
+
+    Returns:
+        Ops ([start, end] copies old lines, a string is inserted text), or
+        None if the inserted text is not UTF-8
+    """
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+
+    # Approvals touch a few sections; trim the common head and tail first
+    head = 0
+    limit = min(len(old_lines), len(new_lines))
+    while head < limit and old_lines[head] == new_lines[head]:
+        head += 1
+    tail = 0
+    while tail < limit - head and old_lines[-1 - tail] == new_lines[-1 - tail]:
+        tail += 1
+
+    ops: List[Op] = []
+
+    def copy(start: int, end: int) -> None:
+        if start == end:
+            return
+        if ops and isinstance(ops[-1], list) and ops[-1][1] == start:
+            ops[-1][1] = end
+        else:
+            ops.append([start, end])
+
+    def insert(lines: List[bytes]) -> None:
+        if lines:
+            ops.append(b"".join(lines).decode("utf-8"))
+
+    copy(0, head)
+    matcher = difflib.SequenceMatcher(
+        None, old_lines[head:len(old_lines) - tail], new_lines[head:len(new_lines) - tail], autojunk=False
+    )
+    try:
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                copy(head + i1, head + i2)
+            else:
+                insert(new_lines[head + j1:head + j2])
+    except UnicodeDecodeError:
+        return None
+    copy(len(old_lines) - tail, len(old_lines))
+    return ops
+
+
+def apply_delta_ops(old: bytes, ops: List[Op]) -> bytes:
+    """Rebuild a revision from its base and encode_delta ops."""
+    old_lines = old.splitlines(keepends=True)
+    parts = []
+    for op in ops:
+        if isinstance(op, str):
+            parts.append(op.encode("utf-8"))
+        else:
+            parts.extend(old_lines[op[0]:op[1]])
+    return b"".join(parts)
+
+
+def _read_object(project_root: Path, name: str) -> bytes:
+    return zlib.decompress((project_root / OBJECTS_DIR / name).read_bytes())
+
+
+def read_revision(project_root: Path, rev: int, revisions: Optional[List[Dict]] = None) -> bytes:
+    """
+    Reconstruct the content of a revision.
+
+    Raises:
+        KeyError: If there is no such revision
+        ValueError: If the reconstructed content does not match its hash
+    """
+    revisions = revisions if revisions is not None else load_history(project_root)
+    by_rev = {entry["rev"]: entry for entry in revisions}
+    entry = by_rev[rev]
+
+    chain = [entry]
+    while chain[-1]["kind"] == DELTA:
+        chain.append(by_rev[chain[-1]["base"]])
+
+    data = _read_object(project_root, chain[-1]["object"])
+    for link in reversed(chain[:-1]):
+        data = apply_delta_ops(data, json.loads(_read_object(project_root, link["object"])))
+    if _sha256(data) != entry["sha256"]:
+        raise ValueError(f"Revision {rev} is corrupt (hash mismatch)")
+    return data
+
+
+def record_revision(
+    project_root: Path,
+    data: bytes,
+    branch: str = "",
+    note: str = "",
+    created: Optional[str] = None,
+    previous: Optional[bytes] = None,
+) -> Optional[Dict]:
+    """
+    Record a spec version, unless it is already the latest revision.
+
+    Args:
+        project_root: Project root
+        data: Spec content
+        branch: Branch the version was approved on
+        note: Short description ("approved", "before restore", ...)
+        created: ISO timestamp (defaults to now)
+        previous: Content of the latest revision if the caller has it,
+            to avoid reconstructing it
+
+    Returns:
+        The new revision entry, or None if nothing was recorded
+    """
+    revisions = load_history(project_root)
+    sha256 = _sha256(data)
+    if revisions and revisions[-1]["sha256"] == sha256:
+        return None
+
+    entry = {
+        "rev": revisions[-1]["rev"] + 1 if revisions else 1,
+        "created": created or datetime.now().isoformat(timespec="seconds"),
+        "branch": branch,
+        "note": note,
+        "sha256": sha256,
+        "size": len(data),
+    }
+
+    same = next((item for item in reversed(revisions) if item["sha256"] == sha256), None)
+    if same is not None:
+        # Seen before: point at the existing object
+        entry.update({key: same[key] for key in ("kind", "base", "object") if key in same})
+        entry["stored"] = 0
+    else:
+        name = f"{entry['rev']:06d}.z"
+        ops = None
+        latest = revisions[-1] if revisions else None
+        if latest is not None and _chain_length(revisions, latest) + 1 < SNAPSHOT_INTERVAL:
+            if previous is None or _sha256(previous) != latest["sha256"]:
+                previous = read_revision(project_root, latest["rev"], revisions)
+            ops = encode_delta(previous, data)
+        if ops is not None:
+            payload = zlib.compress(json.dumps(ops, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 9)
+            entry.update({"kind": DELTA, "base": latest["rev"], "object": name})
+        else:
+            payload = zlib.compress(data, 9)
+            entry.update({"kind": FULL, "object": name})
+        objects = project_root / OBJECTS_DIR
+        objects.mkdir(parents=True, exist_ok=True)
+        (objects / name).write_bytes(payload)
+        entry["stored"] = len(payload)
+
+    revisions.append(entry)
+    _save_history(project_root, revisions)
+    return entry
+
+
+def _chain_length(revisions: List[Dict], entry: Dict) -> int:
+    """Number of deltas applied to a snapshot to rebuild a revision."""
+    by_rev = {item["rev"]: item for item in revisions}
+    length = 0
+    while entry["kind"] == DELTA:
+        entry = by_rev[entry["base"]]
+        length += 1
+    return length
+
+
+def resolve_revision(revisions: List[Dict], ref: str) -> Dict:
+    """
+    Find a revision by number, "latest", "latest~N" or branch name.
+
+    Raises:
+        KeyError: If nothing matches
+    """
+    if not revisions:
+        raise KeyError("No spec history recorded yet")
+    if ref.isdigit():
+        for entry in revisions:
+            if entry["rev"] == int(ref):
+                return entry
+        raise KeyError(f"No revision {ref}")
+    base, _, back = ref.partition("~")
+    if base == "latest" and (not back or back.isdigit()):
+        position = len(revisions) - 1 - int(back or 0)
+        if position < 0:
+            raise KeyError(f"Only {len(revisions)} revisions recorded")
+        return revisions[position]
+    for entry in reversed(revisions):
+        if entry["branch"] == ref:
+            return entry
+    raise KeyError(f"No revision or branch named {ref!r}")
+
+
+def import_legacy_backups(project_root: Path, remove: bool = False) -> List[Path]:
+    """
+    Record spec_backup_{YYYYMMDD_HHMMSS}_{branch}.md copies, oldest first.
+
+    Args:
+        project_root: Project root
+        remove: Delete each copy once it is recorded
+
+    Returns:
+        The imported backup files
+    """
+    backup_dir = project_root / LEGACY_BACKUP_DIR
+    if not backup_dir.is_dir():
+        return []
+
+    backups = []
+    for path in backup_dir.glob("spec_backup_*.md"):
+        parts = path.stem[len("spec_backup_"):].split("_", 2)
+        try:
+            created = datetime.strptime(f"{parts[0]}_{parts[1]}", "%Y%m%d_%H%M%S")
+        except (IndexError, ValueError):
+            continue
+        backups.append((created, parts[2] if len(parts) > 2 else "", path))
+
+    imported = []
+    for created, branch, path in sorted(backups):
+        record_revision(
+            project_root,
+            path.read_bytes(),
+            branch=branch,
+            note=f"imported {path.name}",
+            created=created.isoformat(timespec="seconds"),
+        )
+        imported.append(path)
+        if remove:
+            path.unlink()
+    if remove:
+        try:
+            backup_dir.rmdir()
+        except OSError:
+            pass  # Directory not empty
+    return imported
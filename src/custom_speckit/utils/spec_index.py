@@ -0,0 +1,200 @@
+"""On-disk index of requirement and story IDs in .specify/specs/spec.md.
+
+The index maps each `User Story N`, `FR-NNN`, `SC-NNN`, ... entry to its byte
+range in the spec, a hash of its text and the IDs it references. Lookups seek
+straight to those ranges instead of reading the whole spec. The index is
+rebuilt only when the spec's size/mtime and then its hash change.
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from custom_speckit.utils.delta_merge import SPEC_HEADING, SPEC_ITEM, STORY
+from custom_speckit.utils.file_manager import stat_matches, write_if_changed
+from custom_speckit.utils.watch import query
+
+SPEC_FILE = ".specify/specs/spec.md"
+CACHE_DIR = ".specify/.cache"
+INDEX_FILE = f"{CACHE_DIR}/spec-index.json"
+INDEX_VERSION = 1
+
+STORY_KIND = "story"
+ITEM_KIND = "item"
+
+REFERENCE = re.compile(r"\b(?:User Story \d+|[A-Z]{2,4}-\d{3,})\b")
+
+
+def _hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _title(kind: str, line: str) -> str:
+    if kind == STORY_KIND:
+        return line.lstrip("#").strip()
+    # "- **FR-001**: System MUST ..." -> "System MUST ..."
+    _, _, rest = line.partition("**:")
+    return rest.strip()
+
+
+def build_index(data: bytes) -> Dict[str, Dict]:
+    """
+    Index a spec's entries in one pass over its lines.
+
+    Args:
+        data: Raw spec.md bytes
+
+    Returns:
+        Mapping of entry ID to {kind, title, section, line, start, end,
+        sha256, refs, referenced_by}; start/end are byte offsets
+    """
+    lines = data.decode("utf-8").splitlines(keepends=True)
+    entries: Dict[str, Dict] = {}
+    open_entry: Optional[Dict] = None
+    section = ""
+    offset = 0
+
+    def close(entry: Dict) -> None:
+        entry.pop("_indent", None)
+        entry["end"] = entry.pop("_last")
+        entries.setdefault(entry.pop("id"), entry)
+
+    for number, line in enumerate(lines, start=1):
+        stripped = line.rstrip("\r\n")
+        heading = SPEC_HEADING.match(stripped)
+        start = offset
+        offset += len(line.encode("utf-8"))
+
+        if open_entry is not None:
+            if open_entry["kind"] == STORY_KIND:
+                ends = bool(heading) and len(heading.group(1)) <= 3
+            else:
+                # List items continue over more deeply indented lines
+                indent = len(stripped) - len(stripped.lstrip())
+                ends = not stripped.strip() or bool(heading) or indent <= open_entry["_indent"]
+            if ends:
+                close(open_entry)
+                open_entry = None
+
+        if heading:
+            level = len(heading.group(1))
+            story = STORY.search(stripped)
+            if level == 3 and story:
+                open_entry = {"id": f"User Story {story.group(1)}", "kind": STORY_KIND}
+            elif level <= 3:
+                section = stripped.lstrip("#").strip()
+        else:
+            item = SPEC_ITEM.match(stripped)
+            if item and (open_entry is None or open_entry["kind"] != STORY_KIND):
+                open_entry = {"id": item.group(2), "kind": ITEM_KIND, "_indent": len(item.group(1))}
+
+        if open_entry is not None:
+            if "start" not in open_entry:
+                open_entry.update({
+                    "title": _title(open_entry["kind"], stripped),
+                    "section": section,
+                    "line": number,
+                    "start": start,
+                })
+            if stripped.strip() and stripped.strip() != "---":
+                open_entry["_last"] = offset
+
+    if open_entry is not None:
+        close(open_entry)
+
+    for entry_id, entry in entries.items():
+        text = data[entry["start"]:entry["end"]]
+        entry["sha256"] = _hash(text)
+        refs = dict.fromkeys(REFERENCE.findall(text.decode("utf-8")))
+        refs.pop(entry_id, None)
+        entry["refs"] = list(refs)
+        entry["referenced_by"] = []
+
+    for entry_id, entry in entries.items():
+        for ref in entry["refs"]:
+            if ref in entries:
+                entries[ref]["referenced_by"].append(entry_id)
+    return entries
+
+
+def load_index(project_root: Path) -> Tuple[Dict[str, Dict], Path]:
+    """
+    Return the spec index, rebuilding and saving it only if the spec changed.
+
+    A running `custom-speckit watch` daemon answers from memory instead.
+
+    Raises:
+        FileNotFoundError: If the project has no spec.md
+
+    Returns:
+        Tuple of (entries by ID, spec path)
+    """
+    spec_path = project_root / SPEC_FILE
+    answer = query(project_root, "spec-index")
+    if answer is not None:
+        return answer["entries"], spec_path
+
+    index_path = project_root / INDEX_FILE
+    stat = spec_path.stat()
+
+    cached: Dict = {}
+    try:
+        cached = json.loads(index_path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    if cached.get("version") != INDEX_VERSION:
+        cached = {}
+
+    spec_entry = cached.get("spec")
+    if cached and stat_matches(stat, spec_entry):
+        return cached["entries"], spec_path
+
+    data = spec_path.read_bytes()
+    sha256 = _hash(data)
+    if cached and spec_entry.get("sha256") == sha256:
+        entries = cached["entries"]
+    else:
+        entries = build_index(data)
+
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    write_if_changed(index_path, json.dumps({
+        "version": INDEX_VERSION,
+        "spec": {"sha256": sha256, "size": stat.st_size, "mtime": stat.st_mtime_ns},
+        "entries": entries,
+    }))
+    return entries, spec_path
+
+
+def read_entries(spec_path: Path, entries: List[Dict]) -> Iterator[Tuple[Dict, str]]:
+    """Yield (entry, text) by seeking to each entry's byte range."""
+    with open(spec_path, "rb") as f:
+        for entry in entries:
+            f.seek(entry["start"])
+            yield entry, f.read(entry["end"] - entry["start"]).decode("utf-8")
+
+
+def find_project_root(start: Path) -> Optional[Path]:
+    """Nearest directory (from start upwards) that has a spec.md."""
+    for directory in (start, *start.parents):
+        if (directory / SPEC_FILE).is_file():
+            return directory
+    return None
+
+
+def normalize_id(entry_id: str) -> str:
+    """Accept `fr-1`, `FR-001`, `us3`, `story 3` and `User Story 3`."""
+    value = entry_id.strip()
+    story = re.fullmatch(r"(?i)(?:user\s*story|story|us)\s*-?\s*(\d+)", value)
+    if story:
+        return f"User Story {int(story.group(1))}"
+    item = re.fullmatch(r"([A-Za-z]{2,4})-?(\d+)", value)
+    if item:
+        return f"{item.group(1).upper()}-{int(item.group(2)):03d}"
+    return value
+
+
+def entry_sort_key(entry_id: str) -> Tuple[str, int]:
+    prefix, _, number = entry_id.rpartition(" " if entry_id.startswith("User Story") else "-")
+    return (prefix, int(number) if number.isdigit() else 0)
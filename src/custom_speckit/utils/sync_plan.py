@@ -0,0 +1,328 @@
+"""Side-effect-free planning and application of template syncs."""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from custom_speckit.utils import tracing
+from custom_speckit.utils.file_manager import (
+    copy_files,
+    hash_file,
+    should_preserve,
+    stat_matches,
+)
+from custom_speckit.utils.template_index import load_index
+
+
+ADD = "add"
+UPDATE = "update"
+REMOVE = "remove"
+UNCHANGED = "unchanged"
+
+
+@dataclass(frozen=True)
+class FileChange:
+    """A single planned file operation."""
+
+    relative: str
+    src: Optional[Path]
+    dst: Path
+    action: str
+    size: int
+
+
+@dataclass(frozen=True)
+class SyncPlan:
+    """
+    Immutable result of comparing a template tree with a project.
+
+    Conflicts are files modified locally since they were installed that the
+    template would also change; their ``action`` is the operation that
+    applying the plan performs (update or remove). Conflicts in user-owned
+    directories (see should_preserve) are kept instead: applying the plan
+    leaves them as they are.
+    """
+
+    added: Tuple[FileChange, ...] = ()
+    updated: Tuple[FileChange, ...] = ()
+    removed: Tuple[FileChange, ...] = ()
+    unchanged: Tuple[FileChange, ...] = ()
+    conflicts: Tuple[FileChange, ...] = ()
+    kept: Tuple[FileChange, ...] = ()
+
+    def merge(self, other: "SyncPlan") -> "SyncPlan":
+        """Combine two plans (e.g. .specify/ and .cursor/) into one."""
+        return SyncPlan(
+            added=self.added + other.added,
+            updated=self.updated + other.updated,
+            removed=self.removed + other.removed,
+            unchanged=self.unchanged + other.unchanged,
+            conflicts=self.conflicts + other.conflicts,
+            kept=self.kept + other.kept,
+        )
+
+    @property
+    def total_changes(self) -> int:
+        return len(self.added) + len(self.updated) + len(self.removed) + len(self.conflicts)
+
+    @property
+    def bytes_to_write(self) -> int:
+        writes = self.added + self.updated + tuple(c for c in self.conflicts if c.action == UPDATE)
+        return sum(change.size for change in writes)
+
+    @property
+    def bytes_to_remove(self) -> int:
+        removals = self.removed + tuple(c for c in self.conflicts if c.action == REMOVE)
+        return sum(change.size for change in removals)
+
+    @property
+    def installed_files(self) -> List[Path]:
+        """Destination paths of every template file once the plan is applied (kept files aside)."""
+        kept = self.added + self.updated + self.unchanged
+        kept += tuple(c for c in self.conflicts if c.action == UPDATE)
+        return [change.dst for change in kept]
+
+
+def _classify(
+    src_file: Path,
+    dst_file: Path,
+    entry: Optional[Dict],
+    src_entry: Optional[Dict] = None,
+) -> Tuple[str, bool]:
+    """
+    Classify a template file against its installed copy.
+
+    Args:
+        src_file: Template file
+        dst_file: Installed file
+        entry: Manifest entry of the installed file
+        src_entry: Template index entry (sha256, size), if already known
+
+    Returns:
+        Tuple of (action, locally_modified)
+    """
+    try:
+        dst_stat = dst_file.stat()
+    except FileNotFoundError:
+        return ADD, False
+
+    # Template files are hashed (or taken from the index), never trusted by
+    # stat: builds with fixed mtimes can change content at the same size
+    if src_entry is not None:
+        src_size = src_entry["size"]
+        src_hash = src_entry["sha256"]
+    else:
+        src_size = src_file.stat().st_size
+        src_hash = None
+    dst_hash = entry["sha256"] if stat_matches(dst_stat, entry) else None
+
+    if src_size == dst_stat.st_size:
+        src_hash = src_hash or hash_file(src_file)
+        dst_hash = dst_hash or hash_file(dst_file)
+        if src_hash == dst_hash:
+            return UNCHANGED, False
+
+    # Contents differ; a conflict is a file the user edited after it was installed
+    if entry:
+        dst_hash = dst_hash or hash_file(dst_file)
+        return UPDATE, dst_hash != entry["sha256"]
+    return UPDATE, False
+
+
+def is_locally_modified(dst_file: Path, entry: Optional[Dict]) -> bool:
+    """Check if an installed file no longer matches its manifest entry."""
+    if not entry:
+        return False
+    dst_stat = dst_file.stat()
+    if stat_matches(dst_stat, entry):
+        return False
+    return hash_file(dst_file) != entry["sha256"]
+
+
+def scan_template(template_dir: Path, prefixes=(".specify", ".cursor")) -> Dict[str, Dict]:
+    """
+    Walk and hash the template tree once.
+
+    The result can be shared across many projects (see plan_update) so the
+    template is never re-read per project.
+
+    Returns:
+        Mapping of template-relative paths (e.g. ".specify/scripts/bash/common.sh")
+        to entries with "sha256", "size" and "mtime", the same shape as
+        manifest entries
+    """
+    index = {}
+    with tracing.span("scan template"):
+        for prefix in prefixes:
+            root = template_dir / prefix
+            if not root.exists():
+                continue
+            for src_file in sorted(root.rglob("*")):
+                if not src_file.is_file():
+                    continue
+                stat_result = src_file.stat()
+                index[f"{prefix}/{src_file.relative_to(root).as_posix()}"] = {
+                    "sha256": hash_file(src_file),
+                    "size": stat_result.st_size,
+                    "mtime": stat_result.st_mtime_ns,
+                }
+                tracing.count(tracing.FILES)
+    return index
+
+
+def load_template(template_dir: Path) -> Dict[str, Dict]:
+    """
+    Template entries from the build-time index, or by scanning a source checkout.
+
+    Returns:
+        Mapping of template-relative paths to entries with "sha256" and "size"
+    """
+    index = load_index(template_dir)
+    if index is not None:
+        return index
+    return scan_template(template_dir)
+
+
+def plan_directory(
+    src: Path,
+    dst: Path,
+    previous_files: Optional[Set[str]] = None,
+    entries: Optional[Dict[str, Dict]] = None,
+    template_index: Optional[Dict[str, Dict]] = None,
+) -> SyncPlan:
+    """
+    Plan a directory sync without touching the destination.
+
+    Walks the template once (or uses ``template_index`` instead) and only
+    stats installed files, reading them only when their stat data no longer
+    matches the manifest entry.
+
+    Args:
+        src: Source directory (template)
+        dst: Destination directory (project)
+        previous_files: Set of previously installed file paths (relative to dst)
+        entries: Manifest entries of installed files (relative to dst)
+        template_index: Pre-scanned template entries (relative to src)
+
+    Returns:
+        SyncPlan with paths relative to dst
+    """
+    entries = entries or {}
+    buckets: Dict[str, List[FileChange]] = {
+        ADD: [], UPDATE: [], REMOVE: [], UNCHANGED: [], "conflict": [], "kept": [],
+    }
+
+    if template_index is None:
+        template_index = {}
+        if src.exists():
+            for src_file in sorted(src.rglob("*")):
+                if src_file.is_file():
+                    template_index[str(src_file.relative_to(src))] = None
+
+    template_files = set(template_index)
+    for relative, src_entry in template_index.items():
+        src_file = src / relative
+        dst_file = dst / relative
+        action, modified = _classify(src_file, dst_file, entries.get(relative), src_entry)
+        size = src_entry["size"] if src_entry else src_file.stat().st_size
+        change = FileChange(relative, src_file, dst_file, action, size)
+        if modified:
+            # User edits in user-owned directories (e.g. the constitution) win
+            buckets["kept" if should_preserve(relative) else "conflict"].append(change)
+        else:
+            buckets[action].append(change)
+
+    # Files from the previous install that the template no longer ships
+    for relative in sorted(previous_files or ()):
+        if relative in template_files or should_preserve(relative):
+            continue
+        dst_file = dst / relative
+        if not dst_file.is_file():
+            continue
+        change = FileChange(relative, None, dst_file, REMOVE, dst_file.stat().st_size)
+        modified = is_locally_modified(dst_file, entries.get(relative))
+        buckets["conflict" if modified else REMOVE].append(change)
+
+    return SyncPlan(
+        added=tuple(buckets[ADD]),
+        updated=tuple(buckets[UPDATE]),
+        removed=tuple(buckets[REMOVE]),
+        unchanged=tuple(buckets[UNCHANGED]),
+        conflicts=tuple(buckets["conflict"]),
+        kept=tuple(buckets["kept"]),
+    )
+
+
+def plan_update(
+    template_dir: Path,
+    project_root: Path,
+    previous_files: Set[str],
+    entries: Dict[str, Dict],
+    template_index: Optional[Dict[str, Dict]] = None,
+) -> SyncPlan:
+    """
+    Plan an update of .specify/ and .cursor/ from the template directory.
+
+    Args:
+        template_dir: Packaged templates directory
+        project_root: Project root
+        previous_files: Project-relative paths from the manifest
+        entries: Project-relative manifest entries
+        template_index: Result of load_template, to skip walking the template
+            (defaults to the index shipped with the wheel, if any)
+
+    Returns:
+        Combined SyncPlan for both directories
+    """
+    if template_index is None:
+        template_index = load_index(template_dir)
+    plan = SyncPlan()
+    for name in (".specify", ".cursor"):
+        prefix = f"{name}/"
+        with tracing.span(f"plan {name}"):
+            plan = plan.merge(plan_directory(
+                template_dir / name,
+                project_root / name,
+                {f[len(prefix):] for f in previous_files if f.startswith(prefix)},
+                {f[len(prefix):]: e for f, e in entries.items() if f.startswith(prefix)},
+                None if template_index is None else {
+                    f[len(prefix):]: e for f, e in template_index.items() if f.startswith(prefix)
+                },
+            ))
+    return plan
+
+
+def apply_plan(plan: SyncPlan, jobs: int = 1) -> Tuple[List[Path], List[Path], List[Path]]:
+    """
+    Apply a sync plan. Conflicts follow their planned action (template wins);
+    kept files are not touched.
+
+    Args:
+        plan: Plan from plan_directory or plan_update
+        jobs: Number of worker threads used for copying
+
+    Returns:
+        Tuple of (added_files, updated_files, removed_files)
+    """
+    writes = [c for c in plan.added + plan.updated + plan.conflicts if c.action != REMOVE]
+    copy_files(((change.src, change.dst) for change in writes), jobs)
+
+    added = [change.dst for change in writes if change.action == ADD]
+    updated = [change.dst for change in writes if change.action != ADD]
+    removed = []
+
+    with tracing.span("remove files"):
+        for change in plan.removed + plan.conflicts:
+            if change.action != REMOVE:
+                continue
+            if change.dst.exists():
+                change.dst.unlink()
+                removed.append(change.dst)
+                tracing.count(tracing.FILES)
+                # Remove empty parent directories
+                try:
+                    change.dst.parent.rmdir()
+                except OSError:
+                    pass  # Directory not empty
+
+    return added, updated, removed
@@ -0,0 +1,231 @@
+"""Dependency graph and parallel schedule for tasks.md.
+
+Edges come from the rules in tasks-template.md:
+
+- Phases run in order, except that User Story phases only depend on the
+  last non-story phase before them (stories can proceed in parallel) and
+  the next non-story phase (e.g. Polish) depends on all of them.
+- Within a phase, a task without [P] waits for everything before it; a
+  run of [P] tasks only waits for the last task without [P].
+- "depends on T012, T013" notes add explicit edges.
+
+Tasks marked [P] that touch the same file and are not otherwise ordered
+are reported as conflicts and serialized in file order.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from custom_speckit.utils.task_list import Task
+
+
+@dataclass
+class TaskPlan:
+    """Schedule for the pending tasks of a tasks.md."""
+
+    tasks: List[Task]
+    depends_on: Dict[str, List[str]]
+    waves: List[List[str]] = field(default_factory=list)
+    critical_path: List[str] = field(default_factory=list)
+    conflicts: List[Dict] = field(default_factory=list)
+    errors: List[Dict] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        pending = [task for task in self.tasks if not task.done]
+        return {
+            "summary": {
+                "tasks": len(self.tasks),
+                "pending": len(pending),
+                "waves": len(self.waves),
+                "max_parallel": max((len(wave) for wave in self.waves), default=0),
+                "critical_path_length": len(self.critical_path),
+            },
+            "waves": self.waves,
+            "critical_path": self.critical_path,
+            "conflicts": self.conflicts,
+            "errors": self.errors,
+            "tasks": {
+                task.task_id: {
+                    "line": task.line,
+                    "phase": task.phase,
+                    "story": task.story or task.phase_story,
+                    "parallel": task.parallel,
+                    "done": task.done,
+                    "depends_on": self.depends_on[task.task_id],
+                    "files": task.files,
+                    "description": task.description,
+                }
+                for task in self.tasks
+            },
+        }
+
+
+def _implicit_edges(tasks: List[Task]) -> Dict[str, List[str]]:
+    """Edges implied by phase order and [P] markers."""
+    edges: Dict[str, List[str]] = {}
+    base: Set[str] = set()          # exit of the last non-story phase
+    story_exits: Set[str] = set()   # exits of story phases since then
+
+    phases: List[List[Task]] = []
+    for task in tasks:
+        if not phases or phases[-1][0].phase != task.phase:
+            phases.append([])
+        phases[-1].append(task)
+
+    for phase in phases:
+        is_story = phase[0].phase_story is not None
+        entry = base if is_story or not story_exits else story_exits
+        barrier, group = set(entry), []
+        for task in phase:
+            if task.parallel:
+                edges[task.task_id] = sorted(barrier)
+                group.append(task.task_id)
+            else:
+                edges[task.task_id] = sorted(group or barrier)
+                barrier, group = {task.task_id}, []
+        exit_set = set(group) | (barrier if not group else set())
+        if is_story:
+            story_exits |= exit_set
+        else:
+            base, story_exits = exit_set, set()
+    return edges
+
+
+def _find_cycle(nodes: Set[str], depends_on: Dict[str, List[str]]) -> List[str]:
+    """Return one dependency cycle among the given nodes."""
+    path: List[str] = []
+    on_path: Set[str] = set()
+    visited: Set[str] = set()
+
+    def visit(node: str) -> Optional[List[str]]:
+        visited.add(node)
+        path.append(node)
+        on_path.add(node)
+        for dep in depends_on[node]:
+            if dep not in nodes:
+                continue
+            if dep in on_path:
+                return path[path.index(dep):] + [dep]
+            if dep not in visited:
+                cycle = visit(dep)
+                if cycle:
+                    return cycle
+        path.pop()
+        on_path.discard(node)
+        return None
+
+    for node in sorted(nodes):
+        if node not in visited:
+            cycle = visit(node)
+            if cycle:
+                return list(reversed(cycle))
+    return []
+
+
+def _levels(order: List[str], depends_on: Dict[str, List[str]]) -> Optional[List[List[str]]]:
+    """Group nodes into waves (longest distance from a root), or None on a cycle."""
+    remaining = {node: len(depends_on[node]) for node in order}
+    dependents: Dict[str, List[str]] = {node: [] for node in order}
+    for node in order:
+        for dep in depends_on[node]:
+            dependents[dep].append(node)
+
+    waves = []
+    ready = [node for node in order if remaining[node] == 0]
+    scheduled = 0
+    while ready:
+        waves.append(ready)
+        scheduled += len(ready)
+        next_ready = []
+        for node in ready:
+            for dependent in dependents[node]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    next_ready.append(dependent)
+        position = {node: i for i, node in enumerate(order)}
+        ready = sorted(next_ready, key=position.__getitem__)
+    return waves if scheduled == len(order) else None
+
+
+def plan_tasks(tasks: List[Task], include_done: bool = False) -> TaskPlan:
+    """
+    Build the dependency graph and schedule pending tasks into waves.
+
+    Args:
+        tasks: Parsed tasks (see task_list.parse_tasks), in file order
+        include_done: Schedule completed tasks too instead of treating
+            them as already satisfied
+
+    Returns:
+        TaskPlan with maximal parallel waves, the critical path, [P] file
+        conflicts and errors (duplicate IDs, unknown dependencies, cycles)
+    """
+    plan = TaskPlan(tasks=tasks, depends_on={})
+    known: Dict[str, Task] = {}
+    for task in tasks:
+        if task.task_id in known:
+            plan.errors.append({"type": "duplicate-id", "task": task.task_id, "lines": [known[task.task_id].line, task.line]})
+        else:
+            known[task.task_id] = task
+    unique = list(known.values())
+
+    implicit = _implicit_edges(unique)
+    for task in unique:
+        deps = list(implicit[task.task_id])
+        for dep in task.depends_on:
+            if dep not in known:
+                plan.errors.append({"type": "unknown-dependency", "task": task.task_id, "depends_on": dep})
+            elif dep not in deps:
+                deps.append(dep)
+        plan.depends_on[task.task_id] = deps
+
+    scheduled = [task.task_id for task in unique if include_done or not task.done]
+    active = set(scheduled)
+    graph = {node: [dep for dep in plan.depends_on[node] if dep in active] for node in scheduled}
+
+    waves = _levels(scheduled, graph)
+    if waves is None:
+        plan.errors.append({"type": "cycle", "tasks": _find_cycle(active, graph)})
+        return plan
+
+    # Serialize [P] tasks that share a file but are not ordered by the graph
+    ancestors: Dict[str, int] = {}
+    bit = {node: 1 << i for i, node in enumerate(scheduled)}
+    for wave in waves:
+        for node in wave:
+            mask = 0
+            for dep in graph[node]:
+                mask |= ancestors[dep] | bit[dep]
+            ancestors[node] = mask
+
+    parallel = [known[node] for node in scheduled if known[node].parallel and known[node].files]
+    for i, first in enumerate(parallel):
+        for second in parallel[i + 1:]:
+            shared = sorted(set(first.files) & set(second.files))
+            if not shared:
+                continue
+            a, b = first.task_id, second.task_id
+            if ancestors[a] & bit[b] or ancestors[b] & bit[a]:
+                continue
+            plan.conflicts.append({"tasks": [a, b], "files": shared})
+            graph[b].append(a)
+            plan.depends_on[b].append(a)
+            ancestors[b] |= ancestors[a] | bit[a]
+
+    if plan.conflicts:
+        waves = _levels(scheduled, graph)
+    plan.waves = waves
+
+    # Critical path: longest chain, following the deepest dependency back
+    depth: Dict[str, int] = {}
+    for number, wave in enumerate(waves):
+        for node in wave:
+            depth[node] = number
+    if waves:
+        node = waves[-1][0]
+        path = [node]
+        while graph[node]:
+            node = max(graph[node], key=lambda dep: (depth[dep], -scheduled.index(dep)))
+            path.append(node)
+        plan.critical_path = list(reversed(path))
+    return plan
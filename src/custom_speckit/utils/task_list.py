@@ -0,0 +1,87 @@
+"""Parser for tasks.md checklists (`- [ ] T012 [P] [US1] Description ...`)."""
+
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+TASK_LINE = re.compile(r"^\s*[-*] \[([ xX])\] (T\d+)\b\s*(.*)$")
+PHASE_HEADING = re.compile(r"^##\s+(.*)$")
+STORY_LABEL = re.compile(r"\[US(\d+)\]")
+PHASE_STORY = re.compile(r"User Story (\d+)")
+DEPENDS_ON = re.compile(r"(?:depends on|after|requires)\s+((?:T\d+(?:\s*,\s*|\s+and\s+|\s*&\s*)?)+)", re.IGNORECASE)
+TASK_ID = re.compile(r"\bT\d+\b")
+REQUIREMENT_ID = re.compile(r"\b[A-Z]{2,4}-\d{3,}\b")
+FILE_PATH = re.compile(r"`([^`\s]+\.[A-Za-z0-9]+)`|(?<![\w/.])((?:[\w.\[\]-]+/)+[\w.\[\]-]+\.[A-Za-z0-9]+)")
+
+
+@dataclass
+class Task:
+    """One checklist entry from tasks.md."""
+
+    task_id: str
+    description: str
+    line: int
+    done: bool = False
+    parallel: bool = False
+    story: Optional[int] = None
+    phase: str = ""
+    phase_story: Optional[int] = None
+    depends_on: List[str] = field(default_factory=list)
+    requirements: List[str] = field(default_factory=list)
+    files: List[str] = field(default_factory=list)
+
+
+def parse_task_line(line: str, number: int, phase: str = "") -> Optional[Task]:
+    """Parse one tasks.md line, or return None if it is not a task."""
+    match = TASK_LINE.match(line)
+    if not match:
+        return None
+    done, task_id, rest = match.groups()
+    story = STORY_LABEL.search(rest)
+    phase_story = PHASE_STORY.search(phase)
+
+    depends_on: List[str] = []
+    for group in DEPENDS_ON.findall(rest):
+        depends_on.extend(i for i in TASK_ID.findall(group) if i != task_id and i not in depends_on)
+
+    files = []
+    for quoted, bare in FILE_PATH.findall(rest):
+        path = quoted or bare
+        if path not in files:
+            files.append(path)
+
+    return Task(
+        task_id=task_id,
+        description=rest.strip(),
+        line=number,
+        done=done != " ",
+        parallel="[P]" in rest,
+        story=int(story.group(1)) if story else None,
+        phase=phase,
+        phase_story=int(phase_story.group(1)) if phase_story else None,
+        depends_on=depends_on,
+        requirements=list(dict.fromkeys(REQUIREMENT_ID.findall(rest))),
+        files=files,
+    )
+
+
+def parse_tasks(text: str) -> List[Task]:
+    """Parse every task in tasks.md, tracking the `## Phase ...` it belongs to."""
+    tasks = []
+    phase = ""
+    in_comment = False
+    for number, line in enumerate(text.splitlines(), start=1):
+        if in_comment:
+            in_comment = "-->" not in line
+            continue
+        if line.lstrip().startswith("<!--"):
+            in_comment = "-->" not in line
+            continue
+        heading = PHASE_HEADING.match(line)
+        if heading:
+            phase = heading.group(1).strip()
+            continue
+        task = parse_task_line(line, number, phase)
+        if task:
+            tasks.append(task)
+    return tasks
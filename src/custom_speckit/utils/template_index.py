@@ -0,0 +1,90 @@
+"""Template index generated when the wheel is built.
+
+The wheel ships custom_speckit/template_index.json next to the templates
+directory:
+
+    {"version": 1, "files": {".specify/scripts/bash/common.sh":
+                             {"sha256": ..., "size": ..., "mode": ...}, ...}}
+
+init, update and batch diff projects against it instead of walking and
+hashing the installed templates, so a template file is only opened when it
+is copied. A source checkout has no index and falls back to scanning.
+
+This module is also loaded by path from hatch_build.py, so it must only
+import the standard library.
+"""
+
+import hashlib
+import json
+import os
+import stat
+from pathlib import Path
+from typing import Dict, List, Optional
+
+INDEX_FILE = "template_index.json"
+INDEX_VERSION = 1
+PREFIXES = (".specify", ".cursor")
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_index(template_dir: Path) -> Dict:
+    """
+    Index every template file under .specify/ and .cursor/.
+
+    Returns:
+        Index document with template-relative paths (e.g.
+        ".specify/scripts/bash/common.sh") mapped to sha256, size and
+        permission bits
+    """
+    files = {}
+    for prefix in PREFIXES:
+        root = template_dir / prefix
+        for directory, _, names in os.walk(root):
+            for name in names:
+                path = Path(directory) / name
+                stat_result = path.stat()
+                if not stat.S_ISREG(stat_result.st_mode):
+                    continue
+                files[f"{prefix}/{path.relative_to(root).as_posix()}"] = {
+                    "sha256": _sha256(path),
+                    "size": stat_result.st_size,
+                    "mode": stat.S_IMODE(stat_result.st_mode),
+                }
+    return {"version": INDEX_VERSION, "files": {relative: files[relative] for relative in sorted(files)}}
+
+
+def index_path(template_dir: Path) -> Path:
+    """Where the index of a templates directory is installed."""
+    return template_dir.parent / INDEX_FILE
+
+
+def load_index(template_dir: Path) -> Optional[Dict[str, Dict]]:
+    """
+    Load the build-time index of an installed templates directory.
+
+    Returns:
+        Template-relative paths mapped to entries (sha256, size, mode), or
+        None if there is no usable index (e.g. a source checkout)
+    """
+    try:
+        document = json.loads(index_path(template_dir).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if document.get("version") != INDEX_VERSION:
+        return None
+    return document["files"]
+
+
+def files_under(index: Optional[Dict[str, Dict]], prefix: str) -> Optional[List[str]]:
+    """Paths relative to `prefix` (".specify" or ".cursor"), or None without an index."""
+    if index is None:
+        return None
+    start = len(prefix) + 1
+    return [relative[start:] for relative in index if relative.startswith(f"{prefix}/")]
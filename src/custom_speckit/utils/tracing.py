@@ -0,0 +1,197 @@
+"""Opt-in phase timing and I/O counters for init and update (--timings, --trace).
+
+Instrumented code calls `span()` and `count()` unconditionally. Until a
+session is started both are a None check and return immediately, so the
+instrumentation costs nothing in normal runs.
+
+Counters are process-wide (copy worker threads add to them too); each span
+records how much every counter grew while it was open. Traces are written
+in the Chrome trace event format and open in chrome://tracing or Perfetto.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+FILES = "files"
+BYTES_READ = "bytes_read"
+BYTES_WRITTEN = "bytes_written"
+OPS_AVOIDED = "ops_avoided"
+COUNTERS = (FILES, BYTES_READ, BYTES_WRITTEN, OPS_AVOIDED)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+_tracer: Optional["Tracer"] = None
+
+
+class Tracer:
+    """Collects completed spans and counter totals for one command run."""
+
+    def __init__(self) -> None:
+        self.origin = time.perf_counter_ns()
+        self.totals: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.spans: List[Dict] = []
+        self._lock = threading.Lock()
+        self._depth = threading.local()
+
+    def count(self, counter: str, amount: int) -> None:
+        with self._lock:
+            self.totals[counter] = self.totals.get(counter, 0) + amount
+
+    @contextmanager
+    def span(self, name: str, args: Dict) -> Iterator[None]:
+        depth = getattr(self._depth, "value", 0)
+        self._depth.value = depth + 1
+        with self._lock:
+            before = dict(self.totals)
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            self._depth.value = depth
+            with self._lock:
+                totals = dict(self.totals)
+            deltas = {k: v - before.get(k, 0) for k, v in totals.items()}
+            self.spans.append({
+                "name": name,
+                "start": start - self.origin,
+                "duration": end - start,
+                "depth": depth,
+                "thread": threading.get_ident(),
+                "args": {**args, **deltas},
+                "totals": totals,
+            })
+
+    def chrome_trace(self, metadata: Optional[Dict] = None) -> Dict:
+        """Return the recorded spans as a Chrome trace event document."""
+        pid = os.getpid()
+        events = []
+        for span in sorted(self.spans, key=lambda s: s["start"]):
+            events.append({
+                "name": span["name"],
+                "ph": "X",
+                "ts": span["start"] / 1000,
+                "dur": span["duration"] / 1000,
+                "pid": pid,
+                "tid": span["thread"],
+                "args": span["args"],
+            })
+            # Counter track with the running totals at the end of each span
+            events.append({
+                "name": "io",
+                "ph": "C",
+                "ts": (span["start"] + span["duration"]) / 1000,
+                "pid": pid,
+                "args": span["totals"],
+            })
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {**(metadata or {}), "totals": self.totals},
+        }
+
+
+def span(name: str, **args):
+    """Time a phase; a shared no-op context manager while tracing is off."""
+    if _tracer is None:
+        return _NULL_SPAN
+    return _tracer.span(name, args)
+
+
+def count(counter: str, amount: int = 1) -> None:
+    """Add to a counter (FILES, BYTES_READ, BYTES_WRITTEN, OPS_AVOIDED)."""
+    if _tracer is not None:
+        _tracer.count(counter, amount)
+
+
+def enabled() -> bool:
+    """True while a session is active, for counts that need an extra stat()."""
+    return _tracer is not None
+
+
+def format_bytes(size: float) -> str:
+    """Format a byte count for display."""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def print_timings(tracer: Tracer, console) -> None:
+    """Print a per-phase table (nested phases indented) to a rich console."""
+    from rich.table import Table
+
+    table = Table(title="Timings")
+    table.add_column("Phase")
+    table.add_column("Time", justify="right")
+    table.add_column("Files", justify="right")
+    table.add_column("Read", justify="right")
+    table.add_column("Written", justify="right")
+    table.add_column("Avoided", justify="right")
+    main_thread = threading.main_thread().ident
+    spans = [s for s in tracer.spans if s["thread"] == main_thread]
+    for item in sorted(spans, key=lambda s: s["start"]):
+        args = item["args"]
+        table.add_row(
+            "  " * item["depth"] + item["name"],
+            f"{item['duration'] / 1e6:.1f} ms",
+            str(args.get(FILES, 0)),
+            format_bytes(args.get(BYTES_READ, 0)),
+            format_bytes(args.get(BYTES_WRITTEN, 0)),
+            str(args.get(OPS_AVOIDED, 0)),
+        )
+    console.print(table)
+
+
+@contextmanager
+def session(
+    trace_path: Optional[Path] = None,
+    timings: bool = False,
+    console=None,
+    name: str = "command",
+    metadata: Optional[Dict] = None,
+) -> Iterator[Optional[Tracer]]:
+    """
+    Trace the enclosed block if --timings or --trace was given.
+
+    The trace file is written and the timings table printed even when the
+    block exits early (typer.Exit, errors).
+
+    Args:
+        trace_path: Write a Chrome trace JSON here
+        timings: Print a per-phase table to `console` at the end
+        console: rich Console for the table
+        name: Name of the outermost span
+        metadata: Extra fields for the trace's otherData
+    """
+    global _tracer
+    if trace_path is None and not timings:
+        yield None
+        return
+
+    tracer = _tracer = Tracer()
+    try:
+        with tracer.span(name, {}):
+            yield tracer
+    finally:
+        _tracer = None
+        if trace_path is not None:
+            trace_path.write_text(json.dumps(tracer.chrome_trace(metadata), indent=1))
+        if timings and console is not None:
+            print_timings(tracer, console)
@@ -0,0 +1,298 @@
+"""Crash-safe application of a sync plan: stage, journal, then rename.
+
+New and changed files are first copied into .specify/.staging/<id>/, which
+is on the same filesystem as the project, while the project is untouched.
+The transaction then writes a journal (.specify/.transaction.json) listing
+every rename and delete, and only after the journal is durable are the
+staged files moved into place with os.replace and removed files deleted.
+
+On the next run `recover` finishes the job:
+
+- a journal means the commit had started, so it is replayed (renames whose
+  staged file is gone already happened; deletes are idempotent);
+- a staging directory without a journal means staging was interrupted, so
+  it is discarded and the project is exactly as before.
+"""
+
+import json
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from custom_speckit.utils import tracing
+from custom_speckit.utils.file_manager import copy_files, make_scripts_executable
+from custom_speckit.utils.sync_plan import ADD, REMOVE, SyncPlan
+from custom_speckit.utils.version import MANIFEST_FILE, VERSION_FILE, build_manifest
+
+STAGING_DIR = ".specify/.staging"
+JOURNAL_FILE = ".specify/.transaction.json"
+JOURNAL_VERSION = 1
+
+
+def _fsync_path(path: Path) -> None:
+    """Flush a file (or directory entry list) to disk where the OS allows it."""
+    flags = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) if path.is_dir() else os.O_RDONLY
+    try:
+        fd = os.open(path, flags)
+    except OSError:
+        return  # e.g. directories cannot be opened on Windows
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_journal(project_root: Path, journal: Dict) -> None:
+    """Write the journal atomically and durably."""
+    path = project_root / JOURNAL_FILE
+    tmp = path.with_name(f"{path.name}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(journal, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    _fsync_path(path.parent)
+
+
+def _replay(project_root: Path, journal: Dict) -> Tuple[List[Path], List[Path]]:
+    """Apply (or finish applying) a journal's renames and deletes."""
+    renamed = []
+    removed = []
+    for staged, target in journal["renames"]:
+        staged_path = project_root / staged
+        target_path = project_root / target
+        if not staged_path.exists():
+            continue  # moved before the interruption
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(staged_path, target_path)
+        renamed.append(target_path)
+    for target in journal["deletes"]:
+        target_path = project_root / target
+        if target_path.exists():
+            target_path.unlink()
+            removed.append(target_path)
+            # Remove empty parent directories
+            try:
+                target_path.parent.rmdir()
+            except OSError:
+                pass  # Directory not empty
+    return renamed, removed
+
+
+def _cleanup(project_root: Path, transaction_id: Optional[str] = None) -> None:
+    staging_root = project_root / STAGING_DIR
+    if transaction_id is not None:
+        shutil.rmtree(staging_root / transaction_id, ignore_errors=True)
+    else:
+        shutil.rmtree(staging_root, ignore_errors=True)
+    try:
+        staging_root.rmdir()
+    except OSError:
+        pass
+    (project_root / JOURNAL_FILE).unlink(missing_ok=True)
+
+
+class Transaction:
+    """
+    Stage file writes and deletes, then commit them with atomic renames.
+
+    Use as a context manager: leaving the block without calling commit()
+    (or because of an error while staging) discards the staged files.
+    """
+
+    def __init__(self, project_root: Path, description: str = "") -> None:
+        self.project_root = project_root
+        self.id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        self.description = description
+        self.staging = project_root / STAGING_DIR / self.id
+        self.staged: Dict[Path, Path] = {}
+        self.deletes: List[Path] = []
+        self.committing = False
+
+    def __enter__(self) -> "Transaction":
+        self.staging.mkdir(parents=True, exist_ok=True)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        # Once the journal is written the commit must be replayed, not undone
+        if not self.committing:
+            _cleanup(self.project_root, self.id)
+        return False
+
+    def staged_path(self, target: Path) -> Path:
+        """Where a project file is staged before being renamed into place."""
+        return self.staging / target.relative_to(self.project_root)
+
+    def stage_copies(self, pairs: List[Tuple[Path, Path]], jobs: int = 1) -> None:
+        """Copy (source, project file) pairs into the staging directory."""
+        staged_pairs = [(src, self.staged_path(dst)) for src, dst in pairs]
+        copy_files(staged_pairs, jobs)
+        for (_, dst), (_, staged) in zip(pairs, staged_pairs):
+            self.staged[dst] = staged
+
+    def stage_text(self, target: Path, content: str) -> None:
+        """Stage new content for a project file."""
+        staged = self.staged_path(target)
+        staged.parent.mkdir(parents=True, exist_ok=True)
+        staged.write_text(content, encoding="utf-8")
+        self.staged[target] = staged
+
+    def delete(self, target: Path) -> None:
+        """Delete a project file when the transaction commits."""
+        self.deletes.append(target)
+
+    def commit(self) -> Tuple[List[Path], List[Path]]:
+        """
+        Make the staged changes durable, journal them, then apply them.
+
+        Returns:
+            Tuple of (files renamed into place, files deleted)
+        """
+        with tracing.span("fsync staged files"):
+            for staged in self.staged.values():
+                _fsync_path(staged)
+
+        relative = self.project_root
+        journal = {
+            "version": JOURNAL_VERSION,
+            "id": self.id,
+            "description": self.description,
+            "renames": [
+                [staged.relative_to(relative).as_posix(), target.relative_to(relative).as_posix()]
+                for target, staged in self.staged.items()
+            ],
+            "deletes": [target.relative_to(relative).as_posix() for target in self.deletes],
+        }
+        _write_journal(self.project_root, journal)
+        self.committing = True
+
+        with tracing.span("rename into place", files=len(self.staged), deletes=len(self.deletes)):
+            result = _replay(self.project_root, journal)
+        _cleanup(self.project_root, self.id)
+        return result
+
+
+def recover(project_root: Path) -> Optional[str]:
+    """
+    Finish or discard a transaction interrupted by a previous run.
+
+    Returns:
+        A short description of what was done, or None if there was nothing
+        to recover
+    """
+    journal_path = project_root / JOURNAL_FILE
+    staging_root = project_root / STAGING_DIR
+
+    if journal_path.exists():
+        try:
+            journal = json.loads(journal_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            # The journal is written atomically, so this is not ours to replay
+            journal = None
+        if journal and journal.get("version") == JOURNAL_VERSION:
+            renamed, removed = _replay(project_root, journal)
+            _cleanup(project_root)
+            return (
+                f"Completed interrupted {journal.get('description') or 'transaction'} {journal['id']} "
+                f"({len(renamed)} files moved into place, {len(removed)} removed)"
+            )
+
+    if staging_root.exists():
+        _cleanup(project_root)
+        return "Discarded files staged by an interrupted update (project was not modified)"
+    return None
+
+
+def stage_plan(tx: Transaction, plan: SyncPlan, jobs: int = 1) -> Tuple[List[Path], List[Path], List[Path]]:
+    """
+    Stage a sync plan, with the same semantics as sync_plan.apply_plan.
+
+    Staged shell scripts are made executable before they are moved into
+    place.
+
+    Returns:
+        Tuple of (added_files, updated_files, removed_files) as they will be
+        once the transaction commits
+    """
+    writes = [c for c in plan.added + plan.updated + plan.conflicts if c.action != REMOVE]
+    tx.stage_copies([(change.src, change.dst) for change in writes], jobs)
+
+    scripts_dir = tx.staged_path(tx.project_root / ".specify" / "scripts" / "bash")
+    if scripts_dir.exists():
+        make_scripts_executable(scripts_dir)
+
+    removed = []
+    for change in plan.removed + plan.conflicts:
+        if change.action == REMOVE and change.dst.exists():
+            tx.delete(change.dst)
+            removed.append(change.dst)
+
+    added = [change.dst for change in writes if change.action == ADD]
+    updated = [change.dst for change in writes if change.action != ADD]
+    return added, updated, removed
+
+
+def apply_update(
+    project_root: Path,
+    plan: SyncPlan,
+    version: str,
+    previous_entries: Dict[str, Dict],
+    template_entries: Optional[Dict[str, Dict]] = None,
+    jobs: int = 1,
+) -> Tuple[List[Path], List[Path], List[Path]]:
+    """
+    Apply an update plan together with the version file and manifest, atomically.
+
+    The plan, VERSION and the manifest are staged in one Transaction, so
+    they land together or (if interrupted) are completed by `recover`.
+    Call `recover` before planning, or a pending journal would later be
+    replayed over this update.
+
+    Args:
+        project_root: Project root
+        plan: Plan from plan_update or plan_bundle
+        version: Version being installed
+        previous_entries: Project-relative manifest entries before the update
+        template_entries: Template entries the written files come from
+        jobs: Number of worker threads used for staging copies
+
+    Returns:
+        Tuple of (added_files, updated_files, removed_files)
+    """
+    specify_dst = project_root / ".specify"
+    cursor_dst = project_root / ".cursor"
+    with Transaction(project_root, "update") as tx:
+        with tracing.span("stage"):
+            added, updated, removed = stage_plan(tx, plan, jobs)
+
+        # Stage the version and file manifest with the files so they land together
+        # (unchanged files keep their recorded hashes). Only template-managed files
+        # are recorded; user files (specs, features, deltas) must never appear in
+        # the manifest or a later sync would remove them.
+        with tracing.span("manifest"):
+            # A copy can keep the old size and mtime, so the hash of a written file
+            # comes from the template entry (or is re-read), never the old entry
+            written = {path.relative_to(project_root).as_posix() for path in added + updated}
+            # Files kept with local edits keep their old entry, so they stay "modified"
+            kept = [change.dst.relative_to(project_root).as_posix() for change in plan.kept]
+            tx.stage_text(project_root / VERSION_FILE, f"{version}\n")
+            tx.stage_text(project_root / MANIFEST_FILE, build_manifest(
+                project_root,
+                version,
+                [f for f in plan.installed_files if f.is_relative_to(specify_dst)],
+                [f for f in plan.installed_files if f.is_relative_to(cursor_dst)],
+                {relative: entry for relative, entry in previous_entries.items() if relative not in written},
+                sources=tx.staged,
+                template_entries={
+                    relative: entry for relative, entry in (template_entries or {}).items() if relative in written
+                },
+                kept_entries={relative: previous_entries[relative] for relative in kept},
+            ))
+
+        with tracing.span("commit"):
+            tx.commit()
+    return added, updated, removed
@@ -2,7 +2,11 @@
 
 import json
 from pathlib import Path
-from typing import Optional, Set, List
+from typing import Dict, Optional, Set, List
+
+from custom_speckit.utils import tracing
+from custom_speckit.utils.file_manager import hash_file, stat_matches
+from custom_speckit.utils.watch import query
 
 
 VERSION_FILE = ".specify/VERSION"
@@ -25,16 +29,126 @@ def get_installed_version(project_root: Path) -> Optional[str]:
     return None
 
 
-def get_installed_files(project_root: Path) -> Set[str]:
-    """Get the list of files that were installed in the previous version."""
+def _read_manifest(project_root: Path) -> Dict:
+    """Read the manifest file, returning an empty dict if missing or invalid."""
     manifest_file = project_root / MANIFEST_FILE
     if manifest_file.exists():
         try:
-            data = json.loads(manifest_file.read_text())
-            return set(data.get("files", []))
+            return json.loads(manifest_file.read_text())
         except json.JSONDecodeError:
             pass
-    return set()
+    return {}
+
+
+def get_installed_files(project_root: Path) -> Set[str]:
+    """Get the list of files that were installed in the previous version."""
+    data = _read_manifest(project_root)
+    if "entries" in data:
+        return set(data["entries"])
+    return set(data.get("files", []))
+
+
+def get_installed_entries(project_root: Path) -> Dict[str, Dict]:
+    """
+    Get the per-file manifest entries of the previous install.
+    
+    Each entry maps a project-relative path (e.g. ".specify/scripts/bash/common.sh")
+    to its recorded "sha256", "size" and "mtime" (nanoseconds). Manifests written
+    before entries were introduced yield an empty dict. Served from memory by
+    the `custom-speckit watch` daemon when one is running.
+    """
+    answer = query(project_root, "manifest")
+    if answer is not None:
+        return answer["entries"]
+    return _read_manifest(project_root).get("entries", {})
+
+
+def build_manifest_entry(
+    file_path: Path,
+    previous: Optional[Dict] = None,
+    link: Optional[str] = None,
+    expected: Optional[Dict] = None,
+) -> Dict:
+    """
+    Build a manifest entry, reusing the previous hash if stat data is unchanged.
+    
+    ``link`` records how the file was installed (reflink or hardlink) so that
+    update can break the link before rewriting it; untouched files keep the
+    method recorded previously. ``expected`` is the template entry the file
+    was just copied from; its hash is used if the size agrees.
+    """
+    stat_result = file_path.stat()
+    unchanged = stat_matches(stat_result, previous)
+    if unchanged:
+        sha256 = previous["sha256"]
+    elif expected and expected["size"] == stat_result.st_size:
+        sha256 = expected["sha256"]
+        tracing.count(tracing.OPS_AVOIDED)
+    else:
+        sha256 = hash_file(file_path)
+    entry = {
+        "sha256": sha256,
+        "size": stat_result.st_size,
+        "mtime": stat_result.st_mtime_ns,
+    }
+    if link is None and unchanged:
+        link = previous.get("link")
+    if link and link != "copy":
+        entry["link"] = link
+    return entry
+
+
+def build_manifest(
+    project_root: Path,
+    version: str,
+    specify_files: List[Path],
+    cursor_files: List[Path],
+    previous_entries: Optional[Dict[str, Dict]] = None,
+    link_methods: Optional[Dict[Path, str]] = None,
+    sources: Optional[Dict[Path, Path]] = None,
+    template_entries: Optional[Dict[str, Dict]] = None,
+    kept_entries: Optional[Dict[str, Dict]] = None,
+) -> str:
+    """
+    Build the manifest JSON for the given installed files.
+    
+    ``sources`` maps installed paths to the file to stat and hash instead,
+    e.g. a staged copy that is about to be renamed into place (a rename
+    keeps size and mtime, so the entry stays valid). ``template_entries``
+    (project-relative, e.g. the template index) supplies the hashes of files
+    that were just installed from the template, so they are not read back.
+    ``kept_entries`` are recorded as they are: files deliberately left with
+    local edits keep the entry of the install, so they still count as
+    modified next time.
+    """
+    previous_entries = previous_entries or {}
+    link_methods = link_methods or {}
+    sources = sources or {}
+    template_entries = template_entries or {}
+    
+    specify_root = project_root / ".specify"
+    cursor_root = project_root / ".cursor"
+    
+    entries = {}
+    for file_path in specify_files:
+        relative = f".specify/{file_path.relative_to(specify_root)}"
+        entries[relative] = build_manifest_entry(
+            sources.get(file_path, file_path), previous_entries.get(relative), link_methods.get(file_path),
+            template_entries.get(relative),
+        )
+    for file_path in cursor_files:
+        relative = f".cursor/{file_path.relative_to(cursor_root)}"
+        entries[relative] = build_manifest_entry(
+            sources.get(file_path, file_path), previous_entries.get(relative), link_methods.get(file_path),
+            template_entries.get(relative),
+        )
+    
+    entries.update(kept_entries or {})
+    return json.dumps({
+        "version": version,
+        "files": sorted(entries),
+        "entries": {path: entries[path] for path in sorted(entries)},
+    }, indent=2)
 
 
 def save_version_and_files(
@@ -42,31 +156,29 @@ def save_version_and_files(
     version: str,
     specify_files: List[Path],
     cursor_files: List[Path],
+    previous_entries: Optional[Dict[str, Dict]] = None,
+    link_methods: Optional[Dict[Path, str]] = None,
+    template_entries: Optional[Dict[str, Dict]] = None,
 ) -> None:
-    """Save the Custom Speckit version and installed file list."""
+    """
+    Save the Custom Speckit version and installed file manifest.
+    
+    Files whose stat data still matches ``previous_entries`` keep their recorded
+    hash; only new or modified files are read. ``link_methods`` maps installed
+    paths to the method used to install them (copy, reflink or hardlink).
+    ``template_entries`` are the hashes of freshly copied template files.
+    """
     # Save version
     version_file = project_root / VERSION_FILE
     version_file.parent.mkdir(parents=True, exist_ok=True)
     version_file.write_text(f"{version}\n")
     
     # Save manifest with file list
-    specify_root = project_root / ".specify"
-    cursor_root = project_root / ".cursor"
-    
-    file_list = []
-    for file_path in specify_files:
-        relative = file_path.relative_to(specify_root)
-        file_list.append(f".specify/{relative}")
-    for file_path in cursor_files:
-        relative = file_path.relative_to(cursor_root)
-        file_list.append(f".cursor/{relative}")
-    
     manifest_file = project_root / MANIFEST_FILE
-    manifest_data = {
-        "version": version,
-        "files": sorted(file_list),
-    }
-    manifest_file.write_text(json.dumps(manifest_data, indent=2))
+    manifest_file.write_text(build_manifest(
+        project_root, version, specify_files, cursor_files, previous_entries, link_methods,
+        template_entries=template_entries,
+    ))
 
 
 def save_version(project_root: Path, version: str) -> None:
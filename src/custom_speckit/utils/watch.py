@@ -0,0 +1,89 @@
+"""Client side of the `custom-speckit watch` daemon.
+
+A running daemon keeps the current branch, feature directory map, manifest
+entries and spec index of one project in memory and answers one JSON line
+per connection on a Unix socket. Callers use `query()` and fall back to the
+cold path whenever it returns None: no daemon, a stale socket, a timeout,
+SPECIFY_NO_WATCH set, or an answer for another project.
+
+This module is on the `custom-speckit script` fast path. It uses `_socket`
+rather than `socket` (which pulls in enum and costs several milliseconds)
+and, when no daemon has ever run, costs a single stat().
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+PROTOCOL_VERSION = 1
+QUERY_TIMEOUT = 0.5  # seconds; a wedged daemon must not stall a script
+
+
+def socket_dir() -> Path:
+    """Per-user directory holding the daemon sockets."""
+    base = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+    return Path(base) / f"custom-speckit-{os.getuid()}"
+
+
+def socket_path(project_root: Path) -> Path:
+    """Socket of the daemon watching project_root (one per project)."""
+    import zlib
+
+    # Keyed by a hash of the root: AF_UNIX paths are limited to ~100 bytes
+    key = zlib.crc32(str(project_root).encode("utf-8"))
+    return socket_dir() / f"{key:08x}.sock"
+
+
+def request(path: Path, message: Dict, timeout: float = QUERY_TIMEOUT) -> Optional[Dict]:
+    """
+    Send one request to a daemon socket and return its decoded answer.
+
+    Returns:
+        The answer, or None if nothing is listening or it did not answer
+    """
+    import _socket
+    import json
+
+    client = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    try:
+        client.settimeout(timeout)
+        client.connect(str(path))
+        client.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        chunks = []
+        while True:
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return json.loads(b"".join(chunks))
+    except (OSError, ValueError):
+        return None
+    finally:
+        client.close()
+
+
+def query(project_root: Path, op: str, **args) -> Optional[Dict]:
+    """
+    Ask the daemon watching project_root, if there is one.
+
+    Args:
+        project_root: Repository root as resolved by workspace.get_feature_paths
+        op: "paths", "manifest", "spec-index" or "ping"
+        args: Operation arguments
+
+    Returns:
+        The answer, or None to tell the caller to take the cold path
+    """
+    if os.environ.get("SPECIFY_NO_WATCH"):
+        return None
+    try:
+        # Also refuses sockets in a directory another user created
+        if os.stat(socket_dir()).st_uid != os.getuid():
+            return None
+    except OSError:
+        return None
+
+    answer = request(socket_path(project_root), {"op": op, "version": PROTOCOL_VERSION, **args})
+    if not answer or not answer.get("ok") or answer.get("root") != str(project_root):
+        return None
+    return answer
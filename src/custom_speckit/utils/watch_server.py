@@ -0,0 +1,306 @@
+"""The `custom-speckit watch` daemon (Linux, inotify).
+
+Answers are computed lazily with the same functions the cold path uses and
+cached until inotify reports a change in a directory they depend on:
+
+    git dir (HEAD)      -> current branch
+    <root>, <root>/specs -> feature directories by prefix
+    .specify             -> manifest entries, latest feature
+    .specify/specs       -> latest feature, spec index
+
+Pending inotify events are drained before every answer, so a change that
+completed before a query was sent is always reflected in it.
+"""
+
+import ctypes
+import errno
+import json
+import os
+import selectors
+import signal
+import socket
+import struct
+import time
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from custom_speckit.utils.watch import PROTOCOL_VERSION, request, socket_dir, socket_path
+from custom_speckit.utils.workspace import (
+    find_feature_dir_by_prefix,
+    find_git_dir,
+    find_specify_root,
+    latest_feature_dir,
+    read_head_branch,
+)
+
+# inotify(7) event bits
+IN_MODIFY = 0x002
+IN_ATTRIB = 0x004
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_DELETE_SELF = 0x400
+IN_MOVE_SELF = 0x800
+IN_Q_OVERFLOW = 0x4000
+IN_IGNORED = 0x8000
+IN_ONLYDIR = 0x01000000
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+EVENT_HEADER = struct.Struct("iIII")
+
+HEAD = "head"
+FEATURES = "features"
+LATEST = "latest"
+MANIFEST = "manifest"
+SPEC_INDEX = "spec-index"
+
+
+class WatchError(Exception):
+    """The daemon cannot run here."""
+
+
+def resolve_root(path: Path) -> Tuple[Path, Optional[Path]]:
+    """Resolve the project root exactly like workspace.get_feature_paths."""
+    path = path.resolve()
+    work_tree, git_dir = find_git_dir(path)
+    if work_tree is not None:
+        return work_tree, git_dir
+    return find_specify_root(path) or path, None
+
+
+class Inotify:
+    """Minimal ctypes binding for inotify_init1/inotify_add_watch."""
+
+    def __init__(self) -> None:
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            init = libc.inotify_init1
+            self._add_watch = libc.inotify_add_watch
+        except (AttributeError, OSError) as e:
+            raise WatchError("watch requires Linux inotify") from e
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = init(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise WatchError(f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}")
+
+    def add_watch(self, path: Path) -> Optional[int]:
+        """Watch a directory; None if it does not exist (yet)."""
+        wd = self._add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        return wd if wd >= 0 else None
+
+    def read(self):
+        """Yield pending (wd, mask) events without blocking."""
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size + length
+                yield wd, mask
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class WatchServer:
+    """Serve cached workspace lookups for one project until stopped."""
+
+    def __init__(self, project_root: Path, git_dir: Optional[Path]) -> None:
+        self.root = project_root
+        self.git_dir = git_dir
+        self.path = socket_path(project_root)
+        self.started = time.time()
+        self.stats = {"queries": 0, "hits": 0, "rebuilds": 0, "events": 0}
+        self.cache: Dict[str, object] = {}
+        self.inotify = Inotify()
+        # Watched directory -> cache keys it invalidates
+        self.watched: Dict[Path, Set[str]] = {
+            project_root: {FEATURES},
+            project_root / "specs": {FEATURES},
+            project_root / ".specify": {MANIFEST, LATEST},
+            project_root / ".specify" / "specs": {LATEST, SPEC_INDEX},
+        }
+        if git_dir is not None:
+            self.watched[git_dir] = {HEAD}
+        self.wds: Dict[int, Path] = {}
+        self.running = False
+        # The cold-path functions used to fill the cache must not query us
+        os.environ["SPECIFY_NO_WATCH"] = "1"
+
+    def _add_watches(self) -> None:
+        watching = set(self.wds.values())
+        for directory in self.watched:
+            if directory not in watching:
+                wd = self.inotify.add_watch(directory)
+                if wd is not None:
+                    self.wds[wd] = directory
+
+    def _drain(self) -> None:
+        """Apply pending inotify events to the cache."""
+        rewatch = False
+        for wd, mask in self.inotify.read():
+            self.stats["events"] += 1
+            if mask & IN_Q_OVERFLOW:
+                self.cache.clear()
+                rewatch = True
+                continue
+            directory = self.wds.get(wd)
+            if directory is None:
+                continue
+            for key in self.watched[directory]:
+                self.cache.pop(key, None)
+            if mask & (IN_IGNORED | IN_DELETE_SELF | IN_MOVE_SELF):
+                self.wds.pop(wd, None)
+            if mask & IN_CREATE:
+                rewatch = True  # maybe a watched directory appeared
+        if rewatch:
+            self._add_watches()
+
+    def _cached(self, key: str, compute):
+        if key in self.cache:
+            self.stats["hits"] += 1
+            return self.cache[key]
+        self.stats["rebuilds"] += 1
+        value = self.cache[key] = compute()
+        return value
+
+    def _paths(self, message: Dict) -> Dict:
+        branch = message.get("branch")
+        if branch is None and self.git_dir is not None:
+            branch = self._cached(HEAD, lambda: read_head_branch(self.git_dir))
+        if branch is None:
+            branch = self._cached(LATEST, lambda: latest_feature_dir(self.root / ".specify" / "specs")) or "main"
+        features = self._cached(FEATURES, dict)
+        if branch not in features:
+            feature_dir, error = find_feature_dir_by_prefix(self.root, branch)
+            features[branch] = (str(feature_dir), error)
+        feature_dir, error = features[branch]
+        return {"branch": branch, "feature_dir": feature_dir, "error": error}
+
+    def _manifest(self) -> Dict:
+        from custom_speckit.utils.version import get_installed_entries
+
+        return {"entries": self._cached(MANIFEST, lambda: get_installed_entries(self.root))}
+
+    def _spec_index(self) -> Dict:
+        from custom_speckit.utils.spec_index import load_index
+
+        def compute():
+            try:
+                return load_index(self.root)[0]
+            except FileNotFoundError:
+                return None
+
+        entries = self._cached(SPEC_INDEX, compute)
+        if entries is None:
+            return {"ok": False, "error": "no spec.md"}
+        return {"entries": entries}
+
+    def answer(self, message: Dict) -> Dict:
+        """Answer one decoded request."""
+        self._drain()
+        self.stats["queries"] += 1
+        op = message.get("op")
+        if message.get("version") != PROTOCOL_VERSION:
+            result = {"ok": False, "error": "protocol version mismatch"}
+        elif op == "paths":
+            result = self._paths(message)
+        elif op == "manifest":
+            result = self._manifest()
+        elif op == "spec-index":
+            result = self._spec_index()
+        elif op == "ping":
+            result = {
+                "pid": os.getpid(),
+                "started": self.started,
+                "watching": sorted(str(d) for d in self.wds.values()),
+                "cached": sorted(self.cache),
+                **self.stats,
+            }
+        elif op == "stop":
+            self.running = False
+            result = {}
+        else:
+            result = {"ok": False, "error": f"unknown op {op!r}"}
+        return {"ok": True, "root": str(self.root), **result}
+
+    def _handle(self, conn: socket.socket) -> None:
+        with conn:
+            conn.settimeout(1.0)
+            data = b""
+            try:
+                while not data.endswith(b"\n"):
+                    chunk = conn.recv(65536)
+                    if not chunk:
+                        break
+                    data += chunk
+                message = json.loads(data)
+            except (OSError, ValueError):
+                return
+            try:
+                response = self.answer(message)
+            except Exception as e:  # keep serving; the client falls back
+                response = {"ok": False, "error": str(e)}
+            try:
+                conn.sendall(json.dumps(response, ensure_ascii=False).encode("utf-8"))
+            except OSError:
+                pass
+
+    def _bind(self) -> socket.socket:
+        directory = socket_dir()
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if directory.stat().st_uid != os.getuid():
+            raise WatchError(f"{directory} is owned by another user")
+        if self.path.exists():
+            if request(self.path, {"op": "ping", "version": PROTOCOL_VERSION}):
+                raise WatchError(f"A daemon is already watching {self.root}")
+            self.path.unlink()  # left behind by a daemon that was killed
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(self.path))
+        server.listen(64)
+        return server
+
+    def serve(self) -> None:
+        """Run until SIGTERM/SIGINT or a "stop" request."""
+        server = self._bind()
+        self._add_watches()
+        self.running = True
+
+        def stop(signum, frame):
+            self.running = False
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+
+        selector = selectors.DefaultSelector()
+        selector.register(server, selectors.EVENT_READ, "accept")
+        selector.register(self.inotify.fd, selectors.EVENT_READ, "inotify")
+        try:
+            while self.running:
+                try:
+                    ready = selector.select(timeout=1.0)
+                except InterruptedError:
+                    continue
+                for key, _ in ready:
+                    if key.data == "inotify":
+                        self._drain()
+                    else:
+                        try:
+                            conn, _ = server.accept()
+                        except OSError as e:
+                            if e.errno in (errno.EAGAIN, errno.EINTR):
+                                continue
+                            raise
+                        self._handle(conn)
+        finally:
+            selector.close()
+            server.close()
+            self.path.unlink(missing_ok=True)
+            self.inotify.close()
@@ -0,0 +1,203 @@
+"""Repository and feature path resolution (native port of common.sh).
+
+The repository root and current branch are resolved once per process by
+reading `.git` directly instead of forking `git rev-parse`. This module sits
+on the `custom-speckit script` fast path, so it avoids heavier stdlib
+imports (re, dataclasses).
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from custom_speckit.utils.watch import query
+
+
+def feature_number(name: str) -> Optional[str]:
+    """Return the NNN prefix of a feature name like "004-add-login", else None."""
+    prefix = name[:3]
+    if len(name) > 3 and name[3] == "-" and prefix.isascii() and prefix.isdigit():
+        return prefix
+    return None
+
+
+class FeaturePaths:
+    """Paths exported by get_feature_paths in common.sh."""
+
+    __slots__ = ("repo_root", "current_branch", "has_git", "feature_dir")
+
+    def __init__(self, repo_root: Path, current_branch: str, has_git: bool, feature_dir: Path):
+        self.repo_root = repo_root
+        self.current_branch = current_branch
+        self.has_git = has_git
+        self.feature_dir = feature_dir
+
+    @property
+    def feature_spec(self) -> Path:
+        return self.repo_root / ".specify" / "specs" / "spec.md"
+
+    @property
+    def impl_plan(self) -> Path:
+        return self.feature_dir / "plan.md"
+
+    @property
+    def tasks(self) -> Path:
+        return self.feature_dir / "tasks.md"
+
+    @property
+    def research(self) -> Path:
+        return self.feature_dir / "research.md"
+
+    @property
+    def data_model(self) -> Path:
+        return self.feature_dir / "data-model.md"
+
+    @property
+    def quickstart(self) -> Path:
+        return self.feature_dir / "quickstart.md"
+
+    @property
+    def contracts_dir(self) -> Path:
+        return self.feature_dir / "contracts"
+
+
+def find_git_dir(start: Path) -> Tuple[Optional[Path], Optional[Path]]:
+    """
+    Find the enclosing git work tree without running git.
+
+    Handles both `.git` directories and `.git` files (worktrees, submodules).
+
+    Returns:
+        Tuple of (work tree root, git directory), or (None, None)
+    """
+    for directory in (start, *start.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            return directory, dot_git
+        if dot_git.is_file():
+            content = dot_git.read_text().strip()
+            if content.startswith("gitdir:"):
+                git_dir = Path(content[len("gitdir:"):].strip())
+                if not git_dir.is_absolute():
+                    git_dir = (directory / git_dir).resolve()
+                return directory, git_dir
+    return None, None
+
+
+def read_head_branch(git_dir: Path) -> Optional[str]:
+    """
+    Read the checked-out branch from HEAD, like `git rev-parse --abbrev-ref HEAD`.
+
+    Returns:
+        Branch name, "HEAD" when detached, or None if HEAD cannot be read
+    """
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return None
+    if head.startswith("ref:"):
+        ref = head[len("ref:"):].strip()
+        return ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+    return "HEAD"
+
+
+def find_specify_root(start: Path) -> Optional[Path]:
+    """Find the nearest directory containing .specify/ (non-git fallback)."""
+    for directory in (start, *start.parents):
+        if (directory / ".specify").is_dir():
+            return directory
+    return None
+
+
+def latest_feature_dir(specs_dir: Path) -> Optional[str]:
+    """Return the NNN-* directory name with the highest number, if any."""
+    latest = None
+    highest = 0
+    if specs_dir.is_dir():
+        for entry in os.scandir(specs_dir):
+            number = feature_number(entry.name)
+            if number and entry.is_dir() and int(number) > highest:
+                highest = int(number)
+                latest = entry.name
+    return latest
+
+
+def find_feature_dir_by_prefix(repo_root: Path, branch_name: str) -> Tuple[Path, Optional[str]]:
+    """
+    Find the feature directory by numeric prefix instead of exact branch match.
+
+    This allows multiple branches to work on the same spec (e.g. 004-fix-bug,
+    004-add-feature).
+
+    Returns:
+        Tuple of (feature directory, error message if several directories match)
+    """
+    specs_dir = repo_root / "specs"
+    prefix = feature_number(branch_name)
+    if not prefix:
+        return specs_dir / branch_name, None
+
+    matches: List[str] = []
+    if specs_dir.is_dir():
+        matches = sorted(
+            entry.name for entry in os.scandir(specs_dir)
+            if entry.name.startswith(f"{prefix}-") and entry.is_dir()
+        )
+
+    if len(matches) == 1:
+        return specs_dir / matches[0], None
+    if not matches:
+        return specs_dir / branch_name, None
+    return specs_dir / branch_name, (
+        f"ERROR: Multiple spec directories found with prefix '{prefix}': {' '.join(matches)}\n"
+        "Please ensure only one spec directory exists per numeric prefix."
+    )
+
+
+def get_feature_paths(cwd: Optional[Path] = None) -> FeaturePaths:
+    """
+    Resolve the repository root, branch and feature directory in one pass.
+
+    Mirrors get_repo_root, get_current_branch, has_git and
+    find_feature_dir_by_prefix from common.sh, including the SPECIFY_FEATURE
+    override and the non-git fallbacks. The branch and feature directory
+    come from the `custom-speckit watch` daemon when one is running.
+    """
+    cwd = (cwd or Path.cwd()).resolve()
+    work_tree, git_dir = find_git_dir(cwd)
+    has_git = work_tree is not None
+
+    if has_git:
+        repo_root = work_tree
+    else:
+        repo_root = find_specify_root(cwd) or cwd
+
+    branch = os.environ.get("SPECIFY_FEATURE") or None
+    answer = query(repo_root, "paths", branch=branch)
+    if answer is not None:
+        branch = answer["branch"]
+        feature_dir, error = Path(answer["feature_dir"]), answer["error"]
+    else:
+        if branch is None and git_dir is not None:
+            branch = read_head_branch(git_dir)
+        if branch is None:
+            branch = latest_feature_dir(repo_root / ".specify" / "specs") or "main"
+        feature_dir, error = find_feature_dir_by_prefix(repo_root, branch)
+
+    if error:
+        print(error, file=sys.stderr)
+
+    return FeaturePaths(repo_root, branch, has_git, feature_dir)
+
+
+def check_feature_branch(branch: str, has_git: bool) -> bool:
+    """Validate the branch name, printing the same messages as common.sh."""
+    if not has_git:
+        print("[specify] Warning: Git repository not detected; skipped branch validation", file=sys.stderr)
+        return True
+    if not feature_number(branch):
+        print(f"ERROR: Not on a feature branch. Current branch: {branch}", file=sys.stderr)
+        print("Feature branches should be named like: 001-feature-name", file=sys.stderr)
+        return False
+    return True